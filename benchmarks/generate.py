@@ -0,0 +1,192 @@
+"""
+This module generates the synthetic directory trees which the benchmark suite runs against. Every
+tree is generated deterministically from its size parameters, so that results are comparable across
+runs and versions of the library.
+
+The generated tree contains:
+
+- `small/`: many small mapping files, spread evenly across group directories.
+- `deep/`: a deep hierarchy of directories with a file at every level, for recursive `**` globs.
+- `anchors/`: a few multi-megabyte files, each defining many anchors.
+- `merge/`: a long chain of files which each merge the previous one with `<<`, and a set of base
+  files which are all merged into a single document at once.
+- `documents/`: the entry documents loaded by each benchmark scenario.
+"""
+
+from dataclasses import dataclass
+import math
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    """Size parameters of a synthetic tree.
+
+    Attributes:
+        small_files (int): Number of small files under `small/`. Defaults to 10,000.
+        small_files_per_dir (int): Number of small files per group directory. Defaults to 100.
+        imported_files (int): Number of small files imported one by one with `!import`. Defaults to
+            1,000.
+        deep_depth (int): Depth of the hierarchy under `deep/`. Defaults to 10.
+        deep_branching (int): Number of subdirectories of each directory under `deep/`. Defaults to
+            2.
+        anchor_files (int): Number of large files under `anchors/`. Defaults to 4.
+        anchors_per_file (int): Number of anchors defined by each large file. Defaults to 20,000,
+            which makes each file roughly 2 MB.
+        merge_chain (int): Length of the chain of merged files under `merge/`. Defaults to 200.
+        merge_fan_in (int): Number of base files merged into a single document. Defaults to 200.
+
+    Methods:
+        scaled: Return a copy of the spec with every count multiplied by a factor.
+    """
+
+    small_files: int = 10_000
+    small_files_per_dir: int = 100
+    imported_files: int = 1_000
+    deep_depth: int = 10
+    deep_branching: int = 2
+    anchor_files: int = 4
+    anchors_per_file: int = 20_000
+    merge_chain: int = 200
+    merge_fan_in: int = 200
+
+    def scaled(self, factor: float) -> "TreeSpec":
+        """Return a copy of the spec with every count multiplied by a factor. The depth of the deep
+        hierarchy grows logarithmically, so that its number of files scales linearly.
+
+        Args:
+            factor (float): Factor to scale the counts by.
+
+        Returns:
+            TreeSpec: Scaled spec.
+        """
+
+        def _scale(count: int) -> int:
+            return max(1, round(count * factor))
+
+        depth = max(1, self.deep_depth + round(math.log(factor, self.deep_branching)))
+        return TreeSpec(
+            small_files=_scale(self.small_files),
+            small_files_per_dir=self.small_files_per_dir,
+            imported_files=_scale(self.imported_files),
+            deep_depth=depth,
+            deep_branching=self.deep_branching,
+            anchor_files=self.anchor_files,
+            anchors_per_file=_scale(self.anchors_per_file),
+            merge_chain=_scale(self.merge_chain),
+            merge_fan_in=_scale(self.merge_fan_in),
+        )
+
+
+def _write(path: Path, contents: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(contents)
+
+
+def _small_file_path(index: int, spec: TreeSpec) -> str:
+    return f"small/group_{index // spec.small_files_per_dir:04d}/item_{index:06d}.yml"
+
+
+def generate_small_files(root: Path, spec: TreeSpec) -> None:
+    """Generate the small mapping files under `small/`.
+
+    Args:
+        root (Path): Root directory of the tree.
+        spec (TreeSpec): Size parameters of the tree.
+    """
+    for index in range(spec.small_files):
+        _write(root / _small_file_path(index, spec), f"id: {index}\nname: item-{index}\ntags: [alpha, beta]\n")
+
+
+def generate_deep_tree(root: Path, spec: TreeSpec) -> None:
+    """Generate the deep hierarchy under `deep/`, with a `node.yml` file in every directory.
+
+    Args:
+        root (Path): Root directory of the tree.
+        spec (TreeSpec): Size parameters of the tree.
+    """
+
+    def _generate(directory: Path, depth: int) -> None:
+        _write(directory / "node.yml", f"depth: {depth}\npath: {directory.relative_to(root).as_posix()}\n")
+        if depth < spec.deep_depth:
+            for branch in range(spec.deep_branching):
+                _generate(directory / f"d{depth}_{branch}", depth + 1)
+
+    _generate(root / "deep", 0)
+
+
+def generate_anchor_files(root: Path, spec: TreeSpec) -> None:
+    """Generate the large files under `anchors/`. Each defines many anchors, the last of which is
+    named `last` so that extracting it requires scanning the whole file.
+
+    Args:
+        root (Path): Root directory of the tree.
+        spec (TreeSpec): Size parameters of the tree.
+    """
+    payload = "x" * 48
+    for file_index in range(spec.anchor_files):
+        lines = []
+        for index in range(spec.anchors_per_file):
+            anchor = "last" if index == spec.anchors_per_file - 1 else f"anchor_{index}"
+            lines.append(f"key_{index}: &{anchor}\n  id: {index}\n  payload: {payload}\n  values: [1, 2, 3]\n")
+        _write(root / f"anchors/big_{file_index:02d}.yml", "".join(lines))
+
+
+def generate_merge_files(root: Path, spec: TreeSpec) -> None:
+    """Generate the chain of merged files and the merge base files under `merge/`.
+
+    Args:
+        root (Path): Root directory of the tree.
+        spec (TreeSpec): Size parameters of the tree.
+    """
+    _write(root / "merge/chain_0000.yml", "key_0: 0\n")
+    for index in range(1, spec.merge_chain):
+        contents = f"<<: !import merge/chain_{index - 1:04d}.yml\nkey_{index}: {index}\n"
+        _write(root / f"merge/chain_{index:04d}.yml", contents)
+    for index in range(spec.merge_fan_in):
+        _write(root / f"merge/base_{index:04d}.yml", f"key_{index}: {index}\nshared: {index}\n")
+
+
+def generate_documents(root: Path, spec: TreeSpec) -> dict[str, Path]:
+    """Generate the entry documents loaded by the benchmark scenarios.
+
+    Args:
+        root (Path): Root directory of the tree.
+        spec (TreeSpec): Size parameters of the tree.
+
+    Returns:
+        dict[str, Path]: Paths to the entry documents, by scenario name.
+    """
+    imported = min(spec.imported_files, spec.small_files)
+    documents = {
+        "import": "items:\n" + "".join(f"  - !import {_small_file_path(i, spec)}\n" for i in range(imported)),
+        "import.anchor": "value: !import.anchor anchors/big_00.yml &last\n",
+        "import-all": "items: !import-all small/**/*.yml\n",
+        "import-all.deep": "items: !import-all deep/**/*.yml\n",
+        "import-all.anchor": "values: !import-all.anchor anchors/*.yml &last\n",
+        "import-all-parameterized": "items: !import-all-parameterized small/{group:*}/{name:*}.yml\n",
+        "merge.chain": f"<<: !import merge/chain_{spec.merge_chain - 1:04d}.yml\n",
+        "merge.fan-in": "<<:\n" + "".join(f"  - !import merge/base_{i:04d}.yml\n" for i in range(spec.merge_fan_in)),
+    }
+    paths = {}
+    for name, contents in documents.items():
+        paths[name] = root / f"documents/{name}.yml"
+        _write(paths[name], contents)
+    return paths
+
+
+def generate_tree(root: Path, spec: TreeSpec) -> dict[str, Path]:
+    """Generate the whole synthetic tree under a root directory.
+
+    Args:
+        root (Path): Root directory of the tree, which should be empty.
+        spec (TreeSpec): Size parameters of the tree.
+
+    Returns:
+        dict[str, Path]: Paths to the entry documents, by scenario name.
+    """
+    generate_small_files(root, spec)
+    generate_deep_tree(root, spec)
+    generate_anchor_files(root, spec)
+    generate_merge_files(root, spec)
+    return generate_documents(root, spec)
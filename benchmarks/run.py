@@ -0,0 +1,245 @@
+"""
+This module runs the benchmark suite for the `!import` family of tags and for path pattern matching,
+against a synthetic tree generated by the `generate` module.
+
+Each scenario is measured for wall time (over several repeats), peak memory allocated while it runs
+(as traced by `tracemalloc`), and number of files opened (as reported by the `open` audit event).
+Caches are cleared before every run, so the results describe a cold load, unless `--warm` is given.
+Results are written as JSON, so that they can be compared across versions of the library.
+
+Usage:
+
+``` bash
+python -m benchmarks.run --scale 0.1 --output bench_results.json
+```
+"""
+
+import argparse
+from dataclasses import asdict, dataclass
+import datetime
+import importlib.metadata
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import yaml
+
+import yaml_extras
+from yaml_extras import file_utils, yaml_import
+from yaml_extras.file_utils import PathPattern
+
+from benchmarks.generate import TreeSpec, generate_tree
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Benchmark scenario, which loads one entry document or expands one path pattern.
+
+    Attributes:
+        name (str): Name of the scenario.
+        tag (str): Tag (or API) being exercised.
+        run (Callable[[Path, dict[str, Path], type], Any]): Function running the scenario, given the
+            root of the tree, the entry documents by scenario name, and the loader type.
+    """
+
+    name: str
+    tag: str
+    run: Callable[[Path, dict[str, Path], type], Any]
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of a single scenario.
+
+    Attributes:
+        name (str): Name of the scenario.
+        tag (str): Tag (or API) being exercised.
+        wall_time_s (dict[str, float]): Minimum, median and maximum wall time over the repeats, in
+            seconds.
+        peak_memory_bytes (int): Peak memory allocated while running the scenario once.
+        file_opens (int): Number of files opened while running the scenario once.
+    """
+
+    name: str
+    tag: str
+    wall_time_s: dict[str, float]
+    peak_memory_bytes: int
+    file_opens: int
+
+
+def _load_document(name: str) -> Callable[[Path, dict[str, Path], type], Any]:
+    def _run(root: Path, documents: dict[str, Path], loader_type: type) -> Any:
+        with documents[name].open("r") as f:
+            return yaml.load(f, Loader=loader_type)
+
+    return _run
+
+
+def _expand_pattern(pattern: str) -> Callable[[Path, dict[str, Path], type], Any]:
+    def _run(root: Path, documents: dict[str, Path], loader_type: type) -> Any:
+        return PathPattern(pattern, root).results()
+
+    return _run
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("import", "!import", _load_document("import")),
+    Scenario("import.anchor", "!import.anchor", _load_document("import.anchor")),
+    Scenario("import-all", "!import-all", _load_document("import-all")),
+    Scenario("import-all.deep", "!import-all", _load_document("import-all.deep")),
+    Scenario("import-all.anchor", "!import-all.anchor", _load_document("import-all.anchor")),
+    Scenario("import-all-parameterized", "!import-all-parameterized", _load_document("import-all-parameterized")),
+    Scenario("merge.chain", "<<: !import", _load_document("merge.chain")),
+    Scenario("merge.fan-in", "<<: !import", _load_document("merge.fan-in")),
+    Scenario("path_pattern.small", "PathPattern.results", _expand_pattern("small/**/*.yml")),
+    Scenario("path_pattern.deep", "PathPattern.results", _expand_pattern("deep/**/node.yml")),
+    Scenario("path_pattern.named", "PathPattern.results", _expand_pattern("small/{group:*}/{name:*}.yml")),
+]
+
+
+class _OpenCounter:
+    """Counts the files opened while it is enabled, using the `open` audit event. Audit hooks cannot
+    be removed once installed, so a single counter is installed for the whole run."""
+
+    def __init__(self):
+        self.enabled = False
+        self.count = 0
+        sys.addaudithook(self._hook)
+
+    def _hook(self, event: str, args: tuple) -> None:
+        if self.enabled and event == "open":
+            self.count += 1
+
+
+def _clear_caches() -> None:
+    if (parse_cache := yaml_import.get_parse_cache()) is not None:
+        parse_cache.clear()
+    if (glob_cache := file_utils.get_glob_cache()) is not None:
+        glob_cache.clear()
+
+
+def run_scenario(
+    scenario: Scenario,
+    root: Path,
+    documents: dict[str, Path],
+    loader_type: type,
+    repeat: int,
+    warm: bool,
+    open_counter: _OpenCounter,
+) -> ScenarioResult:
+    """Run a scenario and measure it.
+
+    Args:
+        scenario (Scenario): Scenario to run.
+        root (Path): Root directory of the synthetic tree.
+        documents (dict[str, Path]): Paths to the entry documents, by scenario name.
+        loader_type (type): YAML loader type.
+        repeat (int): Number of timed runs.
+        warm (bool): Whether to keep the caches populated between runs.
+        open_counter (_OpenCounter): Counter of opened files.
+
+    Returns:
+        ScenarioResult: Measurements of the scenario.
+    """
+    if warm:
+        scenario.run(root, documents, loader_type)
+    timings = []
+    for _ in range(repeat):
+        if not warm:
+            _clear_caches()
+        start = time.perf_counter()
+        scenario.run(root, documents, loader_type)
+        timings.append(time.perf_counter() - start)
+
+    # Memory and file opens are measured in a separate run, since tracing allocations slows it down
+    if not warm:
+        _clear_caches()
+    open_counter.count = 0
+    tracemalloc.start()
+    open_counter.enabled = True
+    try:
+        scenario.run(root, documents, loader_type)
+    finally:
+        open_counter.enabled = False
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return ScenarioResult(
+        name=scenario.name,
+        tag=scenario.tag,
+        wall_time_s={"min": min(timings), "median": statistics.median(timings), "max": max(timings)},
+        peak_memory_bytes=peak,
+        file_opens=open_counter.count,
+    )
+
+
+def _version() -> str:
+    try:
+        return importlib.metadata.version("yaml-extras")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the yaml-extras benchmark suite.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Factor to scale the synthetic tree by.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs of each scenario.")
+    parser.add_argument("--loader", choices=["ExtrasLoader", "CExtrasLoader"], default="ExtrasLoader")
+    parser.add_argument("--warm", action="store_true", help="Keep the caches populated between runs.")
+    parser.add_argument("--tree", type=Path, default=None, help="Directory to generate the tree in.")
+    parser.add_argument("--only", nargs="*", default=None, help="Names of the scenarios to run.")
+    parser.add_argument("--output", type=Path, default=None, help="Path to write the JSON results to.")
+    args = parser.parse_args(argv)
+
+    spec = TreeSpec().scaled(args.scale)
+    loader_type = getattr(yaml_extras, args.loader)
+    scenarios = [scenario for scenario in SCENARIOS if args.only is None or scenario.name in args.only]
+    open_counter = _OpenCounter()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = args.tree or Path(tmp_dir)
+        documents = generate_tree(root, spec)
+        # Chains of nested imports recurse through the constructor for every link
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 100 * spec.merge_chain))
+        yaml_import.set_import_relative_dir(root)
+        results = []
+        for scenario in scenarios:
+            result = run_scenario(scenario, root, documents, loader_type, args.repeat, args.warm, open_counter)
+            results.append(result)
+            print(
+                f"{result.name:<28} median {result.wall_time_s['median'] * 1000:10.1f} ms"
+                f"  peak {result.peak_memory_bytes / 2**20:8.1f} MiB  opens {result.file_opens:6d}",
+                file=sys.stderr,
+            )
+
+    report = {
+        "meta": {
+            "yaml_extras": _version(),
+            "pyyaml": yaml.__version__,
+            "libyaml": yaml.__with_libyaml__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "loader": args.loader,
+            "scale": args.scale,
+            "repeat": args.repeat,
+            "warm": args.warm,
+            "tree": asdict(spec),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    output = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
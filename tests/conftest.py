@@ -39,8 +39,20 @@ def loose_equality_for_lists():
 
 @pytest.fixture
 def reset_caches():
-    from yaml_extras.file_utils import PathPattern
+    from yaml_extras.file_utils import get_glob_cache
+    from yaml_extras.yaml_import import get_parse_cache
 
     yield
-    PathPattern.glob_results.cache_clear()
-    PathPattern.results.cache_clear()
+    if (glob_cache := get_glob_cache()) is not None:
+        glob_cache.clear()
+    if (parse_cache := get_parse_cache()) is not None:
+        parse_cache.clear()
+
+
+@pytest.fixture(params=["ExtrasLoader", "CExtrasLoader"])
+def extras_loader(request: pytest.FixtureRequest):
+    """Parameterize a test over both the pure-Python and the libyaml-accelerated loaders, which
+    must have identical tag and merge semantics."""
+    import yaml_extras
+
+    yield getattr(yaml_extras, request.param)
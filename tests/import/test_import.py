@@ -65,15 +65,14 @@ def test_import(
     other_docs: dict[str, str],
     expected: dict,
     tmp_chdir,
+    extras_loader,
 ):
-    from yaml_extras import ExtrasLoader
-
     for path, content in other_docs.items():
         with open(path, "w") as f:
             f.write(content)
     doc_yml = Path("doc.yml")
     doc_yml.write_text(doc)
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert data == expected
 
 
@@ -136,20 +135,19 @@ def test_merge_import(
     other_docs: dict[str, str],
     expected: dict,
     tmp_chdir,
+    extras_loader,
 ):
-    from yaml_extras import ExtrasLoader
-
     for path, content in other_docs.items():
         with open(path, "w") as f:
             f.write(content)
     doc_yml = Path("doc.yml")
     doc_yml.write_text(doc)
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert data == expected
 
 
-def test_import__relative_dir(tmp_path, reset_caches):
-    from yaml_extras import ExtrasLoader, yaml_import
+def test_import__relative_dir(tmp_path, reset_caches, extras_loader):
+    from yaml_extras import yaml_import
 
     doc = """
 data: !import data.yml
@@ -162,6 +160,68 @@ data: !import data.yml
     data_yml = Path(tmpdir) / "data.yml"
     data_yml.write_text("a: 1\nb: 2\n")
 
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert data == {"data": {"a": 1, "b": 2}}
     yaml_import._reset_import_relative_dir()
+
+
+def test_merge_import__constructed_once(tmp_chdir, reset_caches, extras_loader, monkeypatch: pytest.MonkeyPatch):
+    from yaml_extras import yaml_import
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("merged imports must not be represented back into nodes")
+
+    monkeypatch.setattr(yaml.representer.SafeRepresenter, "represent_data", _fail)
+    loads: list[Path] = []
+    original_load = yaml_import.ImportConstructor.load
+
+    def _counting_load(self, loader_type, import_spec):
+        loads.append(import_spec.path)
+        return original_load(self, loader_type, import_spec)
+
+    monkeypatch.setattr(yaml_import.ImportConstructor, "load", _counting_load)
+    Path("base.yml").write_text("a: 1\nnested: {b: [1, 2]}\n")
+    Path("overlay.yml").write_text("a: 2\nc: 3\n")
+    data = yaml.load("data:\n  <<: [!import base.yml, !import overlay.yml]\n  d: 4\n", extras_loader)
+    assert data == {"data": {"a": 2, "nested": {"b": [1, 2]}, "c": 3, "d": 4}}
+    assert len(loads) == 2
+
+
+def test_import_relative_dir_is_context_local(tmp_path: Path, reset_caches, extras_loader):
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+
+    from yaml_extras import yaml_import
+
+    tenants = [f"tenant{i}" for i in range(8)]
+    for tenant in tenants:
+        (tmp_path / tenant).mkdir()
+        (tmp_path / tenant / "name.yml").write_text(f"name: {tenant}\n")
+    barrier = threading.Barrier(len(tenants))
+
+    def _load(tenant: str) -> dict:
+        with yaml_import.import_relative_dir(tmp_path / tenant):
+            # Make every thread enter its context before any of them loads
+            barrier.wait()
+            return yaml.load("config: !import name.yml", extras_loader)
+
+    with ThreadPoolExecutor(len(tenants)) as executor:
+        results = list(executor.map(_load, tenants))
+    assert results == [{"config": {"name": tenant}} for tenant in tenants]
+    assert yaml_import.get_import_relative_dir() == Path.cwd()
+
+
+def test_import_relative_dir_overrides_default(tmp_path: Path, reset_caches, extras_loader):
+    from yaml_extras import yaml_import
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "x.yml").write_text("a\n")
+    (tmp_path / "b" / "x.yml").write_text("b\n")
+    yaml_import.set_import_relative_dir(tmp_path / "a")
+    try:
+        with yaml_import.import_relative_dir(tmp_path / "b"):
+            assert yaml.load("!import x.yml", extras_loader) == "b"
+        assert yaml.load("!import x.yml", extras_loader) == "a"
+    finally:
+        yaml_import._reset_import_relative_dir()
@@ -131,21 +131,20 @@ def test_import_all(
     tmp_chdir,
     loose_equality_for_lists,
     reset_caches,
+    extras_loader,
 ):
-    from yaml_extras import ExtrasLoader
-
     for path, content in other_docs.items():
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w") as f:
             f.write(content)
     doc_yml = Path("doc.yml")
     doc_yml.write_text(doc)
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert loose_equality_for_lists(data, expected)
 
 
-def test_import_all__relative_dir(tmp_path, reset_caches, loose_equality_for_lists):
-    from yaml_extras import ExtrasLoader, yaml_import
+def test_import_all__relative_dir(tmp_path, reset_caches, loose_equality_for_lists, extras_loader):
+    from yaml_extras import yaml_import
 
     doc = """
 data: !import-all data/*.yml
@@ -161,6 +160,6 @@ data: !import-all data/*.yml
     data1_yml.write_text("a: 1\n")
     data2_yml = data_dir / "two.yml"
     data2_yml.write_text("b: 2\n")
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert loose_equality_for_lists(data, {"data": [{"a": 1}, {"b": 2}]})
     yaml_import._reset_import_relative_dir()
@@ -113,20 +113,19 @@ def test_import_anchor(
     tmp_chdir,
     loose_equality_for_lists,
     reset_caches,
+    extras_loader,
 ):
-    from yaml_extras import ExtrasLoader
-
     for path, content in other_docs.items():
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         Path(path).write_text(content)
     doc_yml = Path("doc.yml")
     doc_yml.write_text(doc)
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert loose_equality_for_lists(data, expected)
 
 
-def test_import_all_anchor__relative_dir(tmp_path, reset_caches, loose_equality_for_lists):
-    from yaml_extras import ExtrasLoader, yaml_import
+def test_import_all_anchor__relative_dir(tmp_path, reset_caches, loose_equality_for_lists, extras_loader):
+    from yaml_extras import yaml_import
 
     doc = """
 data: !import-all.anchor data/*.yml &sum
@@ -143,6 +142,6 @@ data: !import-all.anchor data/*.yml &sum
     data2_yml = data_dir / "two.yml"
     data2_yml.write_text("operands: [3, 4]\nsum: &sum 7\n")
 
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert loose_equality_for_lists(data, {"data": [3, 7]})
     yaml_import._reset_import_relative_dir()
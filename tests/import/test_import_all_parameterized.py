@@ -126,21 +126,20 @@ def test_import_all_parameterized(
     reset_caches,
     loose_equality_for_lists,
     tmp_chdir,
+    extras_loader,
 ):
-    from yaml_extras import ExtrasLoader
-
     for path, content in other_docs.items():
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w") as f:
             f.write(content)
     doc_yml = Path("doc.yml")
     doc_yml.write_text(doc)
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert loose_equality_for_lists(data, expected)
 
 
-def test_import_all_parameterized__relative_dir(tmp_path, reset_caches, loose_equality_for_lists):
-    from yaml_extras import ExtrasLoader, yaml_import
+def test_import_all_parameterized__relative_dir(tmp_path, reset_caches, loose_equality_for_lists, extras_loader):
+    from yaml_extras import yaml_import
 
     doc = """
 data: !import-all-parameterized data/{num:*}.yml
@@ -155,6 +154,6 @@ data: !import-all-parameterized data/{num:*}.yml
     for i in range(1, 6):
         data_yml = data_dir / f"{i}.yml"
         data_yml.write_text(f"number: {i}\n")
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert loose_equality_for_lists(data, {"data": [{"num": str(i), "number": i} for i in range(1, 6)]})
     yaml_import._reset_import_relative_dir()
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+
+def test_import_all_stream(tmp_chdir, reset_caches, loose_equality_for_lists, extras_loader):
+    from yaml_extras.yaml_import import ImportAllStream
+
+    for i in range(5):
+        Path(f"records/{i % 2}").mkdir(parents=True, exist_ok=True)
+        Path(f"records/{i % 2}/{i}.yml").write_text(f"id: {i}\n")
+    data = yaml.load("records: !import-all.stream records/**/*.yml\n", extras_loader)
+    assert isinstance(data["records"], ImportAllStream)
+    assert loose_equality_for_lists(list(data["records"]), [{"id": i} for i in range(5)])
+    # The view may be iterated again, picking up new files
+    Path("records/5.yml").write_text("id: 5\n")
+    assert len(list(data["records"])) == 6
+
+
+def test_import_all_stream_is_lazy(tmp_chdir, reset_caches, extras_loader, monkeypatch: pytest.MonkeyPatch):
+    from yaml_extras import yaml_import
+
+    reads: list[Path] = []
+    original_read = yaml_import._read_yaml_file
+
+    def _counting_read(path, loader_type, anchor=None):
+        reads.append(path)
+        return original_read(path, loader_type, anchor)
+
+    monkeypatch.setattr(yaml_import, "_read_yaml_file", _counting_read)
+    Path("records").mkdir()
+    for i in range(10):
+        Path(f"records/{i}.yml").write_text(f"id: {i}\n")
+    data = yaml.load("records: !import-all.stream records/*.yml\n", extras_loader)
+    assert reads == []
+    iterator = iter(data["records"])
+    next(iterator)
+    next(iterator)
+    assert len(reads) == 2
+
+
+def test_import_all_stream_merge(tmp_chdir, reset_caches, extras_loader):
+    Path("cases").mkdir()
+    Path("cases/a.yml").write_text("a: 1\n")
+    Path("cases/b.yml").write_text("b: 2\n")
+    data = yaml.load("cases:\n  <<: !import-all.stream cases/*.yml\n", extras_loader)
+    assert data == {"cases": {"a": 1, "b": 2}}
+
+
+def test_import_all_stream_rejects_named_wildcards(tmp_chdir, reset_caches, extras_loader):
+    with pytest.raises(ValueError, match="Named wildcards"):
+        yaml.load("records: !import-all.stream records/{name:*}.yml\n", extras_loader)
@@ -91,17 +91,47 @@ items: &list [foo, bar, baz, buzz]
             {"data": ["foo", "bar", "baz", "buzz"]},
             id="single anchored flow sequence import",
         ),
+        pytest.param(
+            """
+data: !import.anchor defaults.yml &service
+""",
+            {
+                "defaults.yml": """
+base: &base
+  retries: 3
+timeout: &timeout 30
+service: &service
+  <<: *base
+  timeout: *timeout
+  name: api
+""",
+            },
+            {"data": {"retries": 3, "timeout": 30, "name": "api"}},
+            id="anchor with aliases to earlier anchors",
+        ),
+        pytest.param(
+            """
+data: !import.anchor nested.yml &inner
+""",
+            {
+                "nested.yml": """
+outer: &outer
+  unrelated: true
+  inner: &inner [1, 2]
+""",
+            },
+            {"data": [1, 2]},
+            id="anchor nested within another anchor",
+        ),
     ],
 )
-def test_import_anchor(doc: str, other_docs: dict[str, str], expected: dict, tmp_chdir, reset_caches):
-    from yaml_extras import ExtrasLoader
-
+def test_import_anchor(doc: str, other_docs: dict[str, str], expected: dict, tmp_chdir, reset_caches, extras_loader):
     for path, content in other_docs.items():
         with open(path, "w") as f:
             f.write(content)
     doc_yml = Path("doc.yml")
     doc_yml.write_text(doc)
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert data == expected
 
 
@@ -148,20 +178,19 @@ def test_merge_import_anchor(
     other_docs: dict[str, str],
     expected: dict,
     tmp_chdir,
+    extras_loader,
 ):
-    from yaml_extras import ExtrasLoader
-
     for path, content in other_docs.items():
         with open(path, "w") as f:
             f.write(content)
     doc_yml = Path("doc.yml")
     doc_yml.write_text(doc)
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert data == expected
 
 
-def test_import_anchor__relative_dir(tmp_path, reset_caches, loose_equality_for_lists):
-    from yaml_extras import ExtrasLoader, yaml_import
+def test_import_anchor__relative_dir(tmp_path, reset_caches, loose_equality_for_lists, extras_loader):
+    from yaml_extras import yaml_import
 
     doc = """
 data: !import.anchor data.yml &sum
@@ -173,6 +202,6 @@ data: !import.anchor data.yml &sum
     yaml_import.set_import_relative_dir(tmpdir)
     data_yml = tmpdir / "data.yml"
     data_yml.write_text("operands: [1, 2]\nsum: &sum 3\n")
-    data = yaml.load(doc_yml.open("r"), ExtrasLoader)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
     assert data == {"data": 3}
     yaml_import._reset_import_relative_dir()
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+
+@pytest.mark.parametrize(
+    "doc,other_docs,expected",
+    [
+        pytest.param(
+            """
+data: !import.anchors other.yml &a &b
+""",
+            {"other.yml": "first: &a {v: 1}\nsecond: &b [1, 2]\n"},
+            {"data": {"a": {"v": 1}, "b": [1, 2]}},
+            id="two anchors",
+        ),
+        pytest.param(
+            """
+data: !import.anchors nested.yml &outer &inner
+""",
+            {"nested.yml": "outer: &outer\n  inner: &inner [1, 2]\n"},
+            {"data": {"outer": {"inner": [1, 2]}, "inner": [1, 2]}},
+            id="anchor nested within another anchor",
+        ),
+        pytest.param(
+            """
+data:
+  <<: !import.anchors defaults.yml &service
+  extra: true
+""",
+            {"defaults.yml": "base: &base {retries: 3}\nservice: &service\n  <<: *base\n  name: api\n"},
+            {"data": {"service": {"retries": 3, "name": "api"}, "extra": True}},
+            id="merged into a mapping",
+        ),
+    ],
+)
+def test_import_anchors(doc: str, other_docs: dict[str, str], expected: dict, tmp_chdir, reset_caches, extras_loader):
+    for path, content in other_docs.items():
+        with open(path, "w") as f:
+            f.write(content)
+    doc_yml = Path("doc.yml")
+    doc_yml.write_text(doc)
+    data = yaml.load(doc_yml.open("r"), extras_loader)
+    assert data == expected
+
+
+def test_import_anchors_are_independent(tmp_chdir, reset_caches, extras_loader):
+    Path("nested.yml").write_text("outer: &outer\n  inner: &inner [1, 2]\n")
+    data = yaml.load("!import.anchors nested.yml &outer &inner", extras_loader)
+    assert data["outer"]["inner"] is not data["inner"]
+
+
+@pytest.mark.parametrize(
+    "doc,error",
+    [
+        pytest.param("!import.anchors other.yml", ValueError, id="no anchor"),
+        pytest.param("!import.anchors other.yml &missing", ValueError, id="missing anchor"),
+        pytest.param("!import.anchors [other.yml, &a]", TypeError, id="not a scalar"),
+    ],
+)
+def test_import_anchors_errors(doc: str, error: type, tmp_chdir, reset_caches, extras_loader):
+    Path("other.yml").write_text("a: &a 1\n")
+    with pytest.raises(error):
+        yaml.load(doc, extras_loader)
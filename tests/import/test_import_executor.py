@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+
+@pytest.fixture(params=["thread", "process"])
+def import_executor(request: pytest.FixtureRequest):
+    from yaml_extras import yaml_import
+
+    yaml_import.set_import_executor(request.param, max_workers=4)
+    yield request.param
+    yaml_import.set_import_executor(None)
+
+
+@pytest.mark.parametrize(
+    "doc,expected",
+    [
+        pytest.param(
+            "data: !import-all data/*.yml\n",
+            {"data": [{"n": i} for i in range(20)]},
+            id="import-all",
+        ),
+        pytest.param(
+            "data: !import-all.anchor data/*.yml &n\n",
+            {"data": list(range(20))},
+            id="import-all.anchor",
+        ),
+        pytest.param(
+            "data: !import-all-parameterized data/{name:*}.yml\n",
+            {"data": [{"name": f"{i:02d}", "n": i} for i in range(20)]},
+            id="import-all-parameterized",
+        ),
+    ],
+)
+def test_import_all_executor_preserves_order(doc, expected, tmp_chdir, reset_caches, import_executor):
+    from yaml_extras import ExtrasLoader
+    from yaml_extras.file_utils import PathPattern
+
+    Path("data").mkdir()
+    for i in range(20):
+        Path(f"data/{i:02d}.yml").write_text(f"n: &n {i}\n")
+    data = yaml.load(doc, ExtrasLoader)
+    # The order of the results must match the order of the pattern's results
+    order = [int(result.path.stem) for result in PathPattern("data/*.yml", tmp_chdir).results()]
+    assert data == {"data": [expected["data"][i] for i in order]}
+
+
+def test_import_all_executor_nested(tmp_chdir, reset_caches, import_executor):
+    from yaml_extras import ExtrasLoader
+
+    Path("data/nested").mkdir(parents=True)
+    Path("data/a.yml").write_text("a: 1\n")
+    Path("data/b.yml").write_text("nested: !import-all data/nested/*.yml\n")
+    Path("data/nested/c.yml").write_text("c: 3\n")
+    data = yaml.load("data: !import-all data/*.yml\n", ExtrasLoader)
+    assert sorted(data["data"], key=str) == sorted([{"a": 1}, {"nested": [{"c": 3}]}], key=str)
+
+
+def test_import_all_executor_error_names_path(tmp_chdir, reset_caches, import_executor):
+    from yaml_extras import ExtrasLoader
+
+    Path("data").mkdir()
+    Path("data/good.yml").write_text("a: 1\n")
+    Path("data/bad.yml").write_text("a: [1, 2\n")
+    with pytest.raises(ValueError, match=r"Failed to import .*bad\.yml"):
+        yaml.load("data: !import-all data/*.yml\n", ExtrasLoader)
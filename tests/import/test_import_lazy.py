@@ -0,0 +1,73 @@
+import copy
+from pathlib import Path
+import pickle
+
+import pytest
+import yaml
+
+
+@pytest.fixture
+def lazy_imports():
+    from yaml_extras import yaml_import
+
+    yaml_import.set_lazy_imports(True)
+    yield
+    yaml_import.set_lazy_imports(False)
+
+
+def test_lazy_import_defers_io(tmp_chdir, reset_caches, lazy_imports, extras_loader):
+    from yaml_extras.lazy import LazyImport
+
+    data = yaml.load("a: !import a.yml\nb: !import.anchor b.yml &ptr\n", extras_loader)
+    assert isinstance(data["a"], LazyImport) and not data["a"].is_resolved
+    # The files only need to exist once the proxies are first accessed
+    Path("a.yml").write_text("x: 1\ny: [1, 2]\n")
+    Path("b.yml").write_text("other: 0\nptr: &ptr [3, 4]\n")
+    assert data["a"]["x"] == 1
+    assert data["a"].is_resolved
+    assert list(data["a"].keys()) == ["x", "y"]
+    assert len(data["b"]) == 2 and 3 in data["b"]
+    assert data == {"a": {"x": 1, "y": [1, 2]}, "b": [3, 4]}
+
+
+def test_lazy_import_materialize(tmp_chdir, reset_caches, lazy_imports, extras_loader):
+    from yaml_extras.lazy import LazyImport, materialize
+
+    Path("leaf.yml").write_text("leaf: true\n")
+    Path("middle.yml").write_text("middle: !import leaf.yml\n")
+    data = yaml.load("root: !import middle.yml\n", extras_loader)
+    assert materialize(data) is data
+    assert type(data["root"]) is dict and type(data["root"]["middle"]) is dict
+    assert data == {"root": {"middle": {"leaf": True}}}
+    assert not isinstance(pickle.loads(pickle.dumps(LazyImport(lambda: {"a": 1}, "a"))), LazyImport)
+
+
+def test_lazy_import_merge(tmp_chdir, reset_caches, lazy_imports, extras_loader):
+    Path("base.yml").write_text("a: 1\nb: 2\n")
+    data = yaml.load("data:\n  <<: !import base.yml\n  b: 3\n", extras_loader)
+    assert data == {"data": {"a": 1, "b": 3}}
+
+
+def test_lazy_import_copy(tmp_chdir, reset_caches, lazy_imports, extras_loader):
+    Path("a.yml").write_text("items: [1]\n")
+    proxy = yaml.load("!import a.yml", extras_loader)
+    duplicate = copy.deepcopy(proxy)
+    duplicate["items"].append(2)
+    assert proxy == {"items": [1]}
+    assert duplicate == {"items": [1, 2]}
+
+
+def test_lazy_import_not_cached_for_eager_loads(tmp_chdir, reset_caches, extras_loader):
+    from yaml_extras import yaml_import
+    from yaml_extras.lazy import LazyImport
+
+    Path("leaf.yml").write_text("leaf: true\n")
+    Path("mid.yml").write_text("m: !import leaf.yml\n")
+    yaml_import.set_lazy_imports(True)
+    try:
+        lazy = yaml.load("!import mid.yml", extras_loader)
+        assert isinstance(lazy["m"], LazyImport)
+    finally:
+        yaml_import.set_lazy_imports(False)
+    eager = yaml.load("!import mid.yml", extras_loader)
+    assert type(eager["m"]) is dict and eager == {"m": {"leaf": True}}
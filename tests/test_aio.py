@@ -0,0 +1,89 @@
+import asyncio
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+from yaml_extras import yaml_import
+from yaml_extras.aio import load_async
+
+
+def test_load_async_path_and_stream(tmp_path: Path, reset_caches, extras_loader):
+    (tmp_path / "items").mkdir()
+    for i in range(5):
+        (tmp_path / "items" / f"{i}.yml").write_text(f"n: {i}\n")
+    (tmp_path / "root.yml").write_text("items: !import-all items/*.yml\n")
+    expected = {"items": [{"n": i} for i in range(5)]}
+
+    async def _main():
+        from_path = await load_async(tmp_path / "root.yml", extras_loader, relative_dir=tmp_path)
+        from_stream = await load_async("items: !import-all items/*.yml", extras_loader, relative_dir=tmp_path)
+        return from_path, from_stream
+
+    assert asyncio.run(_main()) == (expected, expected)
+
+
+def test_load_async_concurrent_documents(tmp_path: Path, reset_caches, extras_loader):
+    for tenant in ("a", "b", "c"):
+        (tmp_path / tenant).mkdir()
+        (tmp_path / tenant / "name.yml").write_text(f"{tenant}\n")
+
+    async def _main():
+        return await asyncio.gather(
+            *(load_async("!import name.yml", extras_loader, relative_dir=tmp_path / t) for t in ("a", "b", "c"))
+        )
+
+    assert asyncio.run(_main()) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_load_async_concurrency_limit(max_concurrency: int, tmp_path: Path, reset_caches, monkeypatch):
+    (tmp_path / "items").mkdir()
+    for i in range(8):
+        (tmp_path / "items" / f"{i}.yml").write_text(f"{i}\n")
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    original = yaml_import._parse_yaml_file
+
+    def _slow_parse(path, loader_type, anchor=None):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        try:
+            return original(path, loader_type, anchor)
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(yaml_import, "_parse_yaml_file", _slow_parse)
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+
+    async def _main():
+        ticks = 0
+
+        async def _ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        result = await load_async("!import-all items/*.yml", max_concurrency=max_concurrency, relative_dir=tmp_path)
+        ticker.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(_main())
+    assert result == list(range(8))
+    assert peak == max_concurrency
+    # The event loop kept running while the files were loaded
+    assert ticks > 0
+    assert yaml_import.get_import_executor() is None
+
+
+def test_load_async_invalid_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(load_async("a: 1", max_concurrency=0))
@@ -0,0 +1,124 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from yaml_extras import CExtrasLoader, ExtrasLoader, yaml_import
+from yaml_extras.anchor_index import AnchorIndex, anchor_index_path, clear_anchor_indexes
+
+DEFS = """\
+# Definitions
+header: é
+block: &block
+  name: block
+  nested:
+    - 1
+    - {inline: true}
+flow: &flow [1, 2, {three: 3}]
+scalar: &scalar hello world
+literal: &literal |
+  line one
+  line two
+items:
+  - &item
+    id: 1
+    tags: [a, b]
+  - id: 2
+base: &base {v: 1}
+derived: &derived
+  <<: *base
+  w: 2
+twice: &twice 1
+again: &twice 2
+last: &last
+  - x
+"""
+
+ANCHORS = ["block", "flow", "scalar", "literal", "item", "base", "derived", "twice", "last"]
+
+
+@pytest.fixture
+def anchor_index(monkeypatch) -> list[Path]:
+    """Enable anchor indexes for every file, disable the parse cache, and record every full parse."""
+    monkeypatch.setattr(yaml_import, "ANCHOR_INDEX_THRESHOLD", 0)
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+    clear_anchor_indexes()
+    full_parses: list[Path] = []
+    original = yaml_import._open_yaml_loader
+
+    def _spy(path, loader_type):
+        full_parses.append(Path(path))
+        return original(path, loader_type)
+
+    class _ScannerSpy(yaml_import._AnchorScanner):
+        def __init__(self, path, loader_type):
+            full_parses.append(Path(path))
+            super().__init__(path, loader_type)
+
+    monkeypatch.setattr(yaml_import, "_open_yaml_loader", _spy)
+    monkeypatch.setattr(yaml_import, "_AnchorScanner", _ScannerSpy)
+    yield full_parses
+    clear_anchor_indexes()
+
+
+def _load_anchors(loader_type) -> list:
+    document = "".join(f"- !import.anchor defs.yml &{anchor}\n" for anchor in ANCHORS)
+    return yaml.load(document, loader_type)
+
+
+@pytest.mark.parametrize("newline", [pytest.param("\n", id="lf"), pytest.param("\r\n", id="crlf")])
+def test_anchor_index_matches_full_parse(newline: str, tmp_chdir, anchor_index, extras_loader, monkeypatch):
+    Path("defs.yml").write_bytes(DEFS.replace("\n", newline).encode("utf-8"))
+    expected = [
+        {"name": "block", "nested": [1, {"inline": True}]},
+        [1, 2, {"three": 3}],
+        "hello world",
+        "line one\nline two\n",
+        {"id": 1, "tags": ["a", "b"]},
+        {"v": 1},
+        {"v": 1, "w": 2},
+        1,
+        ["x"],
+    ]
+    assert _load_anchors(extras_loader) == expected
+    assert anchor_index_path(Path("defs.yml")).exists()
+    # Besides the scan which built the index, the file is parsed in full once, for the anchors
+    # which cannot be parsed on their own ("derived" refers to "base", and "twice" is defined twice)
+    assert len(anchor_index) == 2
+    index = AnchorIndex.read(anchor_index_path(Path("defs.yml")))
+    assert index.anchors["twice"].digest is None
+
+    # A new process reads the sidecar index instead of scanning the file again
+    clear_anchor_indexes()
+    anchor_index.clear()
+    other_loader = CExtrasLoader if extras_loader is ExtrasLoader else ExtrasLoader
+    assert _load_anchors(other_loader) == expected
+    assert len(anchor_index) == 1
+
+
+def test_anchor_index_staleness(tmp_chdir, anchor_index, extras_loader):
+    Path("defs.yml").write_text("a: &a 1\nb: &b 2\n")
+    assert yaml.load("!import.anchor defs.yml &b", extras_loader) == 2
+    assert len(anchor_index) == 1
+
+    # Touching the file leaves the index in place, since its contents are unchanged
+    stat = os.stat("defs.yml")
+    os.utime("defs.yml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    clear_anchor_indexes()
+    assert yaml.load("!import.anchor defs.yml &b", extras_loader) == 2
+    assert len(anchor_index) == 1
+
+    # Changing the file rebuilds the index
+    Path("defs.yml").write_text("a: &a 1\nbb: &b 22\n")
+    assert yaml.load("!import.anchor defs.yml &b", extras_loader) == 22
+    assert len(anchor_index) == 2
+    with pytest.raises(ValueError, match="Anchor 'c' not found"):
+        yaml.load("!import.anchor defs.yml &c", extras_loader)
+
+
+def test_anchor_index_threshold(tmp_chdir, anchor_index, extras_loader, monkeypatch):
+    monkeypatch.setattr(yaml_import, "ANCHOR_INDEX_THRESHOLD", 1024)
+    Path("defs.yml").write_text("a: &a 1\n")
+    assert yaml.load("!import-all.anchor defs.yml &a", extras_loader) == [1]
+    assert not anchor_index_path(Path("defs.yml")).exists()
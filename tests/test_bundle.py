@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from yaml_extras import bundle
+from yaml_extras.__main__ import main
+
+
+@pytest.fixture
+def tree(tmp_chdir, reset_caches):
+    Path("base.yml").write_text("a: 1\n")
+    Path("items").mkdir()
+    Path("items/x.yml").write_text("x: 1\n")
+    Path("root.yml").write_text("base: !import base.yml\nitems: !import-all items/*.yml\n")
+    return Path("root.yml")
+
+
+def test_build_and_load_bundle(tree: Path, monkeypatch):
+    expected = {"base": {"a": 1}, "items": [{"x": 1}]}
+    assert bundle.build_bundle(tree) == expected
+    assert Path("root.yml.bundle").exists()
+    manifest = bundle.BundleManifest.read(Path("root.yml.bundle.manifest.json"))
+    assert sorted(Path(file.path).name for file in manifest.files) == ["base.yml", "root.yml", "x.yml"]
+    assert [glob.pattern for glob in manifest.globs] == ["items/*.yml"]
+
+    monkeypatch.setattr(yaml, "load", lambda *args, **kwargs: pytest.fail("Bundle was not used"))
+    assert bundle.load_bundle(tree) == expected
+    assert bundle.is_bundle_current(tree)
+
+
+def test_load_bundle_builds_missing_bundle(tree: Path):
+    assert not bundle.is_bundle_current(tree)
+    assert bundle.load_bundle(tree) == {"base": {"a": 1}, "items": [{"x": 1}]}
+    assert bundle.is_bundle_current(tree)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(lambda: Path("base.yml").write_text("a: 22\n"), id="nested-file-changed"),
+        pytest.param(lambda: Path("items/y.yml").write_text("y: 2\n"), id="glob-match-added"),
+        pytest.param(lambda: Path("items/x.yml").unlink(), id="glob-match-removed"),
+    ],
+)
+def test_bundle_stale_after_change(tree: Path, change):
+    bundle.build_bundle(tree)
+    change()
+    assert not bundle.is_bundle_current(tree)
+    data = bundle.load_bundle(tree)
+    assert data == yaml.load(tree.read_text(), bundle.ExtrasLoader)
+    assert bundle.is_bundle_current(tree)
+
+
+def test_bundle_stale_without_parse_cache(tree: Path, monkeypatch):
+    from yaml_extras import yaml_import
+
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+    bundle.build_bundle(tree)
+    manifest = bundle.BundleManifest.read(Path("root.yml.bundle.manifest.json"))
+    assert sorted(Path(file.path).name for file in manifest.files) == ["base.yml", "root.yml", "x.yml"]
+    Path("base.yml").write_text("a: 22\n")
+    assert not bundle.is_bundle_current(tree)
+    assert bundle.load_bundle(tree) == {"base": {"a": 22}, "items": [{"x": 1}]}
+
+
+def test_bundle_current_after_touch(tree: Path):
+    bundle.build_bundle(tree)
+    stat = Path("base.yml").stat()
+    os.utime("base.yml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert bundle.is_bundle_current(tree)
+    manifest = bundle.BundleManifest.read(Path("root.yml.bundle.manifest.json"))
+    base = next(file for file in manifest.files if file.path.endswith("base.yml"))
+    assert base.mtime_ns == stat.st_mtime_ns + 1_000_000_000
+
+
+def test_bundle_stale_for_other_loader(tree: Path):
+    from yaml_extras import CExtrasLoader
+
+    bundle.build_bundle(tree)
+    if CExtrasLoader is not bundle.ExtrasLoader:
+        assert not bundle.is_bundle_current(tree, loader_type=CExtrasLoader)
+
+
+def test_bundle_cli(tree: Path, capsys):
+    assert main(["check", "root.yml"]) == 1
+    assert main(["bundle", "root.yml", "-o", "out.bundle"]) == 0
+    assert Path("out.bundle").exists() and Path("out.bundle.manifest.json").exists()
+    assert main(["check", "root.yml", "-o", "out.bundle"]) == 0
+    assert "up-to-date" in capsys.readouterr().out
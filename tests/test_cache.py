@@ -0,0 +1,144 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from yaml_extras.cache import FileSignature, ParseCache, copy_value
+
+
+def _touch(path: Path, content: str) -> None:
+    # Guarantee a new mtime even on filesystems with coarse timestamps
+    stat = path.stat() if path.exists() else None
+    path.write_text(content)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def parse_cache(monkeypatch):
+    from yaml_extras import cache as cache_module, yaml_import
+
+    # Files in these tests are all freshly modified, so disable the racy window to let results be
+    # cached.
+    monkeypatch.setattr(cache_module, "_RACY_WINDOW_NS", 0)
+    cache = ParseCache()
+    previous = yaml_import.get_parse_cache()
+    yaml_import.set_parse_cache(cache)
+    yield cache
+    yaml_import.set_parse_cache(previous)
+
+
+def test_parse_cache_hits_and_misses(tmp_chdir, parse_cache: ParseCache):
+    from yaml_extras import ExtrasLoader
+
+    Path("base.yml").write_text("a: 1\n")
+    Path("doc.yml").write_text("x: !import base.yml\ny: !import base.yml\n")
+    data = yaml.load(Path("doc.yml").read_text(), ExtrasLoader)
+    assert data == {"x": {"a": 1}, "y": {"a": 1}}
+    # Within a single load, the second import is served by the import session
+    stats = parse_cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (0, 1, 1)
+    assert yaml.load(Path("doc.yml").read_text(), ExtrasLoader) == data
+    stats = parse_cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_parse_cache_copy_on_read(tmp_chdir, parse_cache: ParseCache):
+    from yaml_extras import ExtrasLoader
+
+    Path("base.yml").write_text("items: [1, 2]\n")
+    first = yaml.load("!import base.yml", ExtrasLoader)
+    first["items"].append(3)
+    second = yaml.load("!import base.yml", ExtrasLoader)
+    assert second == {"items": [1, 2]}
+    assert parse_cache.stats().hits == 1
+
+
+def test_parse_cache_invalidated_by_change(tmp_chdir, parse_cache: ParseCache):
+    from yaml_extras import ExtrasLoader
+
+    base = Path("base.yml")
+    _touch(base, "a: 1\n")
+    assert yaml.load("!import base.yml", ExtrasLoader) == {"a": 1}
+    _touch(base, "a: 2\n")
+    assert yaml.load("!import base.yml", ExtrasLoader) == {"a": 2}
+    assert parse_cache.stats().hits == 0
+
+
+def test_parse_cache_invalidated_by_nested_change(tmp_chdir, parse_cache: ParseCache):
+    from yaml_extras import ExtrasLoader
+
+    leaf = Path("leaf.yml")
+    _touch(leaf, "value: 1\n")
+    Path("middle.yml").write_text("leaf: !import leaf.yml\n")
+    assert yaml.load("!import middle.yml", ExtrasLoader) == {"leaf": {"value": 1}}
+    _touch(leaf, "value: 2\n")
+    assert yaml.load("!import middle.yml", ExtrasLoader) == {"leaf": {"value": 2}}
+
+
+def test_parse_cache_invalidated_by_new_glob_match(tmp_chdir, parse_cache: ParseCache, reset_caches):
+    from yaml_extras import ExtrasLoader
+
+    Path("data").mkdir()
+    Path("data/one.yml").write_text("1\n")
+    Path("middle.yml").write_text("all: !import-all data/*.yml\n")
+    assert yaml.load("!import middle.yml", ExtrasLoader) == {"all": [1]}
+    Path("data/two.yml").write_text("2\n")
+    assert sorted(yaml.load("!import middle.yml", ExtrasLoader)["all"]) == [1, 2]
+
+
+def test_parse_cache_eviction(tmp_path: Path, monkeypatch):
+    from yaml_extras import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_RACY_WINDOW_NS", 0)
+    cache = ParseCache(max_entries=2)
+    for name in "abc":
+        (tmp_path / f"{name}.yml").write_text(f"{name}: 1\n")
+        cache.get_or_load(tmp_path / f"{name}.yml", yaml.SafeLoader, lambda: name)
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions) == (2, 1)
+
+    cache = ParseCache(max_bytes=9)
+    for name in "abc":
+        cache.get_or_load(tmp_path / f"{name}.yml", yaml.SafeLoader, lambda: name)
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions, stats.size_bytes) == (1, 2, 5)
+
+
+def test_parse_cache_racy_results_are_not_cached(tmp_chdir, monkeypatch):
+    from yaml_extras import ExtrasLoader, yaml_import
+
+    cache = ParseCache()
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", cache)
+    # Rewrite the file with the same size and modification time, as can happen within the
+    # resolution of its timestamp
+    path = Path("base.yml")
+    path.write_text("a: 1\n")
+    stat = path.stat()
+    assert yaml.load("!import base.yml", ExtrasLoader) == {"a": 1}
+    path.write_text("a: 2\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert yaml.load("!import base.yml", ExtrasLoader) == {"a": 2}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (0, 2, 0)
+
+
+def test_copy_value_preserves_aliases():
+    shared = {"a": [1, 2]}
+    original = {"x": shared, "y": shared, "z": ("t", [3])}
+    copied = copy_value(original)
+    assert copied == original
+    assert copied["x"] is copied["y"] and copied["x"] is not shared
+    assert copied["z"][1] is not original["z"][1]
+
+
+def test_file_signature_is_current(tmp_path: Path):
+    path = tmp_path / "file.yml"
+    _touch(path, "a: 1\n")
+    signature = FileSignature.from_path(path)
+    assert signature.is_current()
+    _touch(path, "a: 2\n")
+    assert not signature.is_current()
+    path.unlink()
+    assert not signature.is_current()
@@ -1,4 +1,6 @@
 from pathlib import Path
+import pickle
+
 import pytest
 
 from yaml_extras.file_utils import PathPattern, PathWithMetadata
@@ -146,3 +148,205 @@ def test_path_pattern_results_named(tmp_path: Path, tmp_chdir, reset_caches):
         PathWithMetadata(tmp_path / "g" / "ku" / "o" / "oh.l", {"subpath": "ku/o", "leaf": "oh"}),
         PathWithMetadata(tmp_path / "g" / "ku" / "o" / "0.l", {"subpath": "ku/o", "leaf": "0"}),
     }
+
+
+def test_path_with_metadata_record(tmp_path: Path, tmp_chdir, reset_caches):
+    materialize_dir_tree({"x": {"a.l": "a", "b.l": "b"}})
+    results = PathPattern("{dir:*}/{leaf:*}.l").results()
+    assert [result.values for result in results] == [("x", "a"), ("x", "b")]
+    assert results[0].names == ("dir", "leaf")
+    # Every match of a pattern shares the same tuple of names
+    assert results[0].names is results[1].names
+    # Matches compare and hash equal to records built from a metadata dict, in any order
+    from_dict = PathWithMetadata(tmp_path / "x" / "a.l", {"leaf": "a", "dir": "x"})
+    assert results[0] == from_dict and hash(results[0]) == hash(from_dict)
+    assert results[0] != PathWithMetadata(tmp_path / "x" / "a.l", {"leaf": "b", "dir": "x"})
+    assert results[0].metadata == {"dir": "x", "leaf": "a"}
+    assert pickle.loads(pickle.dumps(results[0])) == results[0]
+    with pytest.raises(AttributeError):
+        results[0].path = tmp_path  # type: ignore
+    with pytest.raises(TypeError):
+        results[0].metadata["dir"] = "y"  # type: ignore
+    assert PathWithMetadata(tmp_path, {}).metadata is None
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["*", "**", "**/*.l", "g/**/*.l", "*/*.l", "g/*o/*.l", "**/o/*", "g/h?/[jl].l", "missing/**/*.l", "g/ku/n.l"],
+)
+def test_path_pattern_matches_pathlib_glob(pattern: str, tmp_path: Path, tmp_chdir, reset_caches):
+    tree: DirTree = {
+        "a": {"b.l": "b", ".c.l": "c"},
+        "g": {
+            "hi": {"j.l": "j", "k.l": "k"},
+            "ho": {"l.l": "l"},
+            "ku": {"n.l": "n", "o": {"oh.l": "oh"}},
+        },
+    }
+    materialize_dir_tree(tree)
+    assert sorted(PathPattern(pattern).glob_results()) == sorted(tmp_path.glob(pattern))
+
+
+def test_path_pattern_results_ordered(tmp_path: Path, tmp_chdir, reset_caches):
+    materialize_dir_tree({"d": {name: name for name in ["c.l", "a.l", "b.l"]} | {"sub": {"0.l": "0"}}})
+    assert [result.path.name for result in PathPattern("d/**/*.l").results()] == ["a.l", "b.l", "c.l", "0.l"]
+
+
+def test_path_pattern_named_recursive_zero_depth(tmp_path: Path, tmp_chdir, reset_caches):
+    materialize_dir_tree({"g": {"top.l": "top", "sub": {"deep.l": "deep"}}})
+    assert set(PathPattern("g/{subpath:**}/{leaf:*}.l").results()) == {
+        PathWithMetadata(tmp_path / "g" / "top.l", {"subpath": "", "leaf": "top"}),
+        PathWithMetadata(tmp_path / "g" / "sub" / "deep.l", {"subpath": "sub", "leaf": "deep"}),
+    }
+
+
+def test_path_pattern_prunes_to_literal_prefix(tmp_path: Path, tmp_chdir, reset_caches, monkeypatch):
+    import os
+
+    materialize_dir_tree({"a": {"b": {"c.l": "c"}, "x": {"y.l": "y"}}, "z": {"w.l": "w"}})
+    listed: list[str] = []
+    original_scandir = os.scandir
+
+    def _recording_scandir(path):
+        listed.append(os.path.relpath(path, tmp_path))
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _recording_scandir)
+    assert PathPattern("a/b/*.l").glob_results() == [tmp_path / "a" / "b" / "c.l"]
+    assert listed == ["a/b"]
+
+
+def test_path_pattern_duplicate_names():
+    with pytest.raises(ValueError, match="Duplicate named wildcards"):
+        PathPattern("{name:*}/{name:*}.l").results()
+
+
+@pytest.fixture
+def glob_cache(monkeypatch):
+    from yaml_extras import file_utils
+
+    # Directories in these tests are all freshly modified, so disable the racy window to let
+    # entries be trusted on later lookups.
+    monkeypatch.setattr(file_utils, "_RACY_WINDOW_NS", 0)
+    cache = file_utils.GlobCache(max_entries=2)
+    monkeypatch.setattr(file_utils, "GLOB_CACHE", cache)
+    return cache
+
+
+def test_glob_cache_hit(tmp_path: Path, tmp_chdir, glob_cache):
+    materialize_dir_tree({"a": {"x.l": "x"}})
+    first = PathPattern("a/*.l").glob_results()
+    assert PathPattern("a/*.l").glob_results() == first
+    stats = glob_cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_glob_cache_invalidated_by_new_file(tmp_path: Path, tmp_chdir, glob_cache):
+    materialize_dir_tree({"a": {"x.l": "x"}})
+    assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l"]
+    (tmp_path / "a" / "y.l").write_text("y")
+    assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l", tmp_path / "a" / "y.l"]
+    (tmp_path / "a" / "x.l").unlink()
+    assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "y.l"]
+    assert glob_cache.stats().stale == 2
+
+
+def test_glob_cache_invalidated_by_new_directory(tmp_path: Path, tmp_chdir, glob_cache):
+    materialize_dir_tree({"a": {"b": {"x.l": "x"}}})
+    assert PathPattern("a/b/*.l").glob_results() == [tmp_path / "a" / "b" / "x.l"]
+    assert PathPattern("c/*.l").glob_results() == []
+    materialize_dir_tree({"c": {"y.l": "y"}})
+    assert PathPattern("c/*.l").glob_results() == [tmp_path / "c" / "y.l"]
+
+
+def test_glob_cache_keyed_by_relative_to(tmp_path: Path, tmp_chdir, glob_cache):
+    materialize_dir_tree({"a": {"x.l": "x"}, "b": {"y.l": "y"}})
+    assert PathPattern("*.l", tmp_path / "a").glob_results() == [tmp_path / "a" / "x.l"]
+    assert PathPattern("*.l", tmp_path / "b").glob_results() == [tmp_path / "b" / "y.l"]
+    assert hash(PathPattern("*.l", tmp_path / "a")) != hash(PathPattern("*.l", tmp_path / "b"))
+
+
+def test_glob_cache_evicts_least_recently_used(tmp_path: Path, tmp_chdir, glob_cache):
+    materialize_dir_tree({"a": {"x.l": "x"}, "b": {"y.l": "y"}, "c": {"z.l": "z"}})
+    for pattern in ("a/*.l", "b/*.l", "a/*.l", "c/*.l"):
+        PathPattern(pattern).results()
+    assert glob_cache.stats().evictions == 1
+    PathPattern("a/*.l").results()
+    assert glob_cache.stats().hits == 2
+
+
+def test_glob_cache_ttl(tmp_path: Path, tmp_chdir, glob_cache):
+    glob_cache.ttl = 60.0
+    materialize_dir_tree({"a": {"x.l": "x"}})
+    assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l"]
+    (tmp_path / "a" / "y.l").write_text("y")
+    assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l"]
+    glob_cache.ttl = None
+    assert len(PathPattern("a/*.l").glob_results()) == 2
+
+
+def test_glob_cache_racy_entries_are_not_trusted(tmp_path: Path, tmp_chdir, monkeypatch):
+    from yaml_extras import file_utils
+
+    monkeypatch.setattr(file_utils, "GLOB_CACHE", file_utils.GlobCache())
+    materialize_dir_tree({"a": {"x.l": "x"}})
+    PathPattern("a/*.l").results()
+    PathPattern("a/*.l").results()
+    stats = file_utils.get_glob_cache().stats()  # type: ignore
+    assert (stats.hits, stats.misses, stats.stale) == (0, 2, 1)
+
+
+def test_glob_cache_disabled(tmp_path: Path, tmp_chdir, monkeypatch):
+    from yaml_extras import file_utils
+
+    monkeypatch.setattr(file_utils, "GLOB_CACHE", None)
+    materialize_dir_tree({"a": {"x.l": "x"}})
+    assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l"]
+
+
+@pytest.fixture
+def scandirs(tmp_path: Path, monkeypatch) -> list[str]:
+    """Record every directory listed with `os.scandir`, relative to the temporary directory."""
+    import os
+
+    listed: list[str] = []
+    original_scandir = os.scandir
+
+    def _recording_scandir(path):
+        listed.append(os.path.relpath(path, tmp_path))
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _recording_scandir)
+    return listed
+
+
+def test_directory_snapshot_lists_each_directory_once(tmp_path: Path, tmp_chdir, monkeypatch, scandirs):
+    from yaml_extras import file_utils
+
+    monkeypatch.setattr(file_utils, "GLOB_CACHE", None)
+    materialize_dir_tree({"configs": {"prod": {"a.yml": "a"}, "dev": {"b.yml": "b"}, "c.yml": "c"}})
+    with file_utils.directory_snapshot() as snapshot:
+        assert len(PathPattern("configs/**/*.yml").results()) == 3
+        assert [r.metadata for r in PathPattern("configs/**/{name:*}.yml").results()][0] == {"name": "c"}
+        assert PathPattern("configs/prod/*.yml").glob_results() == [tmp_path / "configs" / "prod" / "a.yml"]
+        assert file_utils.get_directory_snapshot() is snapshot
+    assert sorted(scandirs) == ["configs", "configs/dev", "configs/prod"]
+    assert snapshot.listings == 3
+    assert file_utils.get_directory_snapshot() is None
+    # Outside of the snapshot, directories are listed again
+    PathPattern("configs/prod/*.yml").results()
+    assert scandirs.count("configs/prod") == 2
+
+
+def test_directory_snapshot_invalidates_glob_cache(tmp_path: Path, tmp_chdir, glob_cache):
+    from yaml_extras import file_utils
+
+    materialize_dir_tree({"a": {"x.l": "x"}})
+    with file_utils.directory_snapshot():
+        assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l"]
+        (tmp_path / "a" / "y.l").write_text("y")
+        # Within the snapshot, the directory is not listed again
+        assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l"]
+    # The cached result records the modification time from before the snapshot listed the directory
+    assert PathPattern("a/*.l").glob_results() == [tmp_path / "a" / "x.l", tmp_path / "a" / "y.l"]
+    assert glob_cache.stats().stale == 2
@@ -0,0 +1,137 @@
+import io
+from pathlib import Path
+import pickle
+import tarfile
+import zipfile
+
+import pytest
+import yaml
+
+from yaml_extras import yaml_import
+from yaml_extras.filesystem import (
+    ArchiveFileSystem,
+    MemoryFileSystem,
+    OSFileSystem,
+    get_filesystem,
+    set_filesystem,
+    use_filesystem,
+)
+from yaml_extras.lazy import materialize
+
+TREE = {
+    "config.yml": "db: !import db.yml\nservices: !import-all services/*.yml\nlimits: !import.anchor limits.yml &prod\n",
+    "db.yml": "host: localhost\n",
+    "services/api.yml": "name: api\n",
+    "services/web.yml": "name: web\n",
+    "limits.yml": "dev: &dev {cpu: 1}\nprod: &prod {cpu: 4}\n",
+    "regions/eu/west.yml": "zone: eu-west\n",
+    "regions/us/east.yml": "zone: us-east\n",
+}
+
+EXPECTED = {
+    "db": {"host": "localhost"},
+    "services": [{"name": "api"}, {"name": "web"}],
+    "limits": {"cpu": 4},
+}
+
+
+def _load_tree(loader_type) -> dict:
+    document = (
+        "<<: !import config.yml\n"
+        "regions: !import-all-parameterized regions/{region:*}/{name:*}.yml\n"
+        "stream: !import-all.stream services/*.yml\n"
+    )
+    data = yaml.load(document, loader_type)
+    data["stream"] = list(data["stream"])
+    return data
+
+
+def _check_tree(data: dict) -> None:
+    assert {key: data[key] for key in EXPECTED} == EXPECTED
+    assert data["regions"] == [
+        {"zone": "eu-west", "region": "eu", "name": "west"},
+        {"zone": "us-east", "region": "us", "name": "east"},
+    ]
+    assert data["stream"] == [{"name": "api"}, {"name": "web"}]
+
+
+def test_memory_filesystem(tmp_chdir, reset_caches, extras_loader):
+    with use_filesystem(MemoryFileSystem(TREE)) as fs:
+        assert get_filesystem() is fs
+        _check_tree(_load_tree(extras_loader))
+    assert isinstance(get_filesystem(), OSFileSystem)
+    # Nothing was written to or read from disk
+    assert list(tmp_chdir.iterdir()) == []
+    with pytest.raises(FileNotFoundError):
+        yaml.load("!import config.yml", extras_loader)
+
+
+def test_memory_filesystem_tree(tmp_path: Path):
+    fs = MemoryFileSystem({"a/b.yml": "1", "c.yml": b"2"}, root=tmp_path)
+    assert [(entry.name, entry.is_dir) for entry in fs.list_dir(tmp_path)] == [("a", True), ("c.yml", False)]
+    assert fs.read_bytes(tmp_path / "a" / "b.yml") == b"1"
+    assert fs.is_dir(tmp_path / "a") and not fs.is_dir(tmp_path / "c.yml")
+    assert fs.stat(tmp_path / "c.yml").size == 1  # type: ignore
+    assert not fs.exists(tmp_path.parent / "c.yml")
+    with pytest.raises(FileNotFoundError):
+        fs.read_bytes(tmp_path / "missing.yml")
+    with pytest.raises(IsADirectoryError):
+        fs.read_bytes(tmp_path / "a")
+    with pytest.raises(ValueError, match="Cannot write a file"):
+        fs.write(tmp_path / "a", "3")
+    fs.write(tmp_path / "a" / "d.yml", "4")
+    assert [entry.name for entry in fs.list_dir(tmp_path / "a")] == ["b.yml", "d.yml"]
+    assert pickle.loads(pickle.dumps(fs)).read_bytes(tmp_path / "a" / "d.yml") == b"4"
+
+
+def _write_zip(path: Path) -> None:
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, contents in TREE.items():
+            archive.writestr(name, contents)
+
+
+def _write_tar(path: Path) -> None:
+    with tarfile.open(path, "w:gz") as archive:
+        for name, contents in TREE.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(contents.encode())
+            archive.addfile(info, io.BytesIO(contents.encode()))
+
+
+@pytest.mark.parametrize(
+    "name,write",
+    [pytest.param("configs.zip", _write_zip, id="zip"), pytest.param("configs.tar.gz", _write_tar, id="tar")],
+)
+def test_archive_filesystem(name, write, tmp_chdir, reset_caches, extras_loader):
+    write(tmp_chdir / name)
+    with ArchiveFileSystem(name, root=Path("/configs")) as fs, use_filesystem(fs):
+        with yaml_import.import_relative_dir(Path("/configs")):
+            _check_tree(_load_tree(extras_loader))
+        assert [entry.name for entry in fs.list_dir(Path("/configs/regions"))] == ["eu", "us"]
+    with pytest.raises(ValueError, match="closed"):
+        fs.read_bytes(Path("/configs/db.yml"))
+
+
+def test_archive_filesystem_unsupported(tmp_chdir):
+    Path("configs.yml").write_text("a: 1\n")
+    with pytest.raises(ValueError, match="Unsupported archive format"):
+        ArchiveFileSystem("configs.yml")
+
+
+def test_filesystem_lazy_imports(tmp_chdir, reset_caches, monkeypatch, extras_loader):
+    monkeypatch.setattr(yaml_import, "LAZY_IMPORTS", True)
+    with use_filesystem(MemoryFileSystem(TREE)):
+        data = yaml.load("!import config.yml", extras_loader)
+    # The proxy reads from the filesystem in effect when it was created
+    assert materialize(data) == EXPECTED
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_filesystem_import_executor(kind, tmp_chdir, reset_caches, extras_loader):
+    set_filesystem(MemoryFileSystem(TREE))
+    try:
+        with yaml_import.import_executor(kind, max_workers=2):
+            assert yaml.load("!import config.yml", extras_loader) == EXPECTED
+    finally:
+        set_filesystem(None)
+    assert isinstance(get_filesystem(), OSFileSystem)
@@ -0,0 +1,96 @@
+import copy
+from pathlib import Path
+import pickle
+
+import pytest
+import yaml
+
+from yaml_extras import yaml_import
+from yaml_extras.frozen import FrozenDict, freeze, thaw
+
+
+@pytest.fixture
+def shared_imports(monkeypatch):
+    monkeypatch.setattr(yaml_import, "SHARED_IMPORTS", True)
+
+
+def test_frozen_dict():
+    frozen = FrozenDict({"a": 1, "b": (2, 3)})
+    assert frozen == {"a": 1, "b": (2, 3)}
+    assert {"a": 1, "b": (2, 3)} == frozen
+    assert hash(frozen) == hash(FrozenDict({"b": (2, 3), "a": 1}))
+    assert copy.deepcopy(frozen) is frozen
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert frozen | {"c": 4} == {"a": 1, "b": (2, 3), "c": 4}
+    with pytest.raises(TypeError):
+        frozen["a"] = 2  # type: ignore
+
+
+def test_freeze_interns_identical_content():
+    a = freeze({"defaults": {"retries": 3, "hosts": ["a", "b"]}, "name": "a"})
+    b = freeze({"defaults": {"retries": 3, "hosts": ["a", "b"]}, "name": "b"})
+    assert isinstance(a, FrozenDict) and isinstance(a["defaults"]["hosts"], tuple)
+    assert a["defaults"] is b["defaults"]
+    assert thaw(a) == {"defaults": {"retries": 3, "hosts": ["a", "b"]}, "name": "a"}
+    assert type(thaw(a)["defaults"]["hosts"]) is list
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        pytest.param({"v": 1}, {"v": True}, id="int-bool"),
+        pytest.param({"v": 1}, {"v": 1.0}, id="int-float"),
+        pytest.param({"a": 1, "b": 2}, {"b": 2, "a": 1}, id="order"),
+    ],
+)
+def test_freeze_keeps_distinct_types_and_order(left: dict, right: dict):
+    frozen_left, frozen_right = freeze(left), freeze(right)
+    assert frozen_left is not frozen_right
+    assert [(k, type(v)) for k, v in frozen_right.items()] == [(k, type(v)) for k, v in right.items()]
+
+
+def test_freeze_recursive_structure():
+    recursive: list = []
+    recursive.append(recursive)
+    with pytest.raises(ValueError, match="recursive"):
+        freeze(recursive)
+
+
+def test_shared_imports(tmp_chdir, reset_caches, shared_imports, extras_loader):
+    Path("defaults.yml").write_text("retries: 3\nhosts: [a, b]\n")
+    Path("copy.yml").write_text("retries: 3\nhosts: [a, b]\n")
+    Path("service.yml").write_text("<<: !import defaults.yml\nname: service\n")
+    document = "- !import defaults.yml\n- !import defaults.yml\n- !import copy.yml\n- !import service.yml\n"
+    data = yaml.load(document, extras_loader)
+    assert data == [{"retries": 3, "hosts": ("a", "b")}] * 3 + [{"retries": 3, "hosts": ("a", "b"), "name": "service"}]
+    assert data[0] is data[1] is data[2]
+    assert isinstance(data[3], FrozenDict)
+    assert data[3]["hosts"] is data[0]["hosts"]
+    # Later loads share the same structure through the parse cache
+    assert yaml.load("!import defaults.yml", extras_loader) is data[0]
+
+
+def test_shared_lazy_imports(tmp_chdir, reset_caches, shared_imports, monkeypatch, extras_loader):
+    from yaml_extras.lazy import LazyImport, materialize
+
+    monkeypatch.setattr(yaml_import, "LAZY_IMPORTS", True)
+    Path("sub").mkdir()
+    Path("sub/common.yml").write_text("retries: 3\nhosts: [a, b]\n")
+    Path("sub/b.yml").write_text("name: b\ncommon: !import sub/common.yml\nitems: [!import sub/common.yml]\n")
+    data = yaml.load("x: !import sub/b.yml\n", extras_loader)
+    # The outermost import stays lazy, while the imports nested within the frozen file are resolved
+    assert isinstance(data["x"], LazyImport)
+    b = data["x"].resolve()
+    assert isinstance(b, FrozenDict) and isinstance(b["common"], FrozenDict)
+    assert b["items"][0] is b["common"]
+    assert b._key is not None
+    common = {"retries": 3, "hosts": ("a", "b")}
+    assert materialize(data) == {"x": {"name": "b", "common": common, "items": (common,)}}
+    assert yaml.load("!import sub/b.yml", extras_loader).resolve() is b
+
+
+def test_shared_imports_disabled(tmp_chdir, reset_caches, extras_loader):
+    Path("defaults.yml").write_text("retries: 3\n")
+    data = yaml.load("- !import defaults.yml\n- !import defaults.yml\n", extras_loader)
+    assert type(data[0]) is dict
+    assert data[0] is not data[1]
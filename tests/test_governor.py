@@ -0,0 +1,115 @@
+from pathlib import Path
+import time
+
+import pytest
+import yaml
+
+from yaml_extras import yaml_import
+from yaml_extras.file_utils import PathPattern
+from yaml_extras.governor import (
+    ImportLimitError,
+    ImportLimits,
+    ImportLimitWarning,
+    get_import_budget,
+    import_budget,
+    import_limits,
+)
+
+
+@pytest.fixture
+def tree(tmp_chdir, reset_caches) -> Path:
+    Path("data").mkdir()
+    for i in range(5):
+        Path(f"data/{i}.yml").write_text(f"n: {i}\n")
+    Path("big.yml").write_text("x" * 1000 + ": 1\n")
+    for depth in range(4):
+        Path(f"chain{depth}.yml").write_text(f"!import chain{depth + 1}.yml\n")
+    Path("chain4.yml").write_text("end\n")
+    return tmp_chdir
+
+
+@pytest.mark.parametrize("cached", [pytest.param(True, id="glob-cache"), pytest.param(False, id="no-glob-cache")])
+def test_max_files_per_pattern(cached: bool, tree, monkeypatch, extras_loader):
+    from yaml_extras import file_utils
+
+    if not cached:
+        monkeypatch.setattr(file_utils, "GLOB_CACHE", None)
+    walked: list[Path] = []
+    original = file_utils._CompiledPattern.walk
+
+    def _spy(self, *args, **kwargs):
+        for path, captures in original(self, *args, **kwargs):
+            walked.append(path)
+            yield path, captures
+
+    monkeypatch.setattr(file_utils._CompiledPattern, "walk", _spy)
+    with import_limits(ImportLimits(max_files_per_pattern=3)):
+        assert len(yaml.load("!import-all data/[0-2].yml", extras_loader)) == 3
+        walked.clear()
+        with pytest.raises(ImportLimitError, match=r"max_files_per_pattern=3 exceeded by data/\*.yml: 4") as info:
+            yaml.load("!import-all data/*.yml", extras_loader)
+        # The walk stops as soon as the limit is exceeded
+        assert len(walked) == 4
+        assert (info.value.limit, info.value.value, info.value.maximum) == ("max_files_per_pattern", 4, 3)
+        with pytest.raises(ImportLimitError):
+            list(PathPattern("data/*.yml").iter_results())
+
+
+def test_max_total_bytes(tree, extras_loader):
+    with import_limits(ImportLimits(max_total_bytes=100)):
+        assert yaml.load("!import-all data/*.yml", extras_loader) == [{"n": i} for i in range(5)]
+        with pytest.raises(ImportLimitError, match=r"Largest files read: .*big.yml \(1004 bytes\)"):
+            yaml.load("- !import data/0.yml\n- !import big.yml\n", extras_loader)
+
+
+def test_max_import_depth(tree, monkeypatch, extras_loader):
+    # Files served from the parse cache do not import their nested files again
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+    with import_limits(ImportLimits(max_import_depth=5)):
+        assert yaml.load("!import chain0.yml", extras_loader) == "end"
+    with import_limits(ImportLimits(max_import_depth=3)):
+        with pytest.raises(ImportLimitError, match="max_import_depth=3 exceeded by .*chain3.yml: 4"):
+            yaml.load("!import chain0.yml", extras_loader)
+
+
+def test_max_load_time(tree, monkeypatch, extras_loader):
+    original = yaml_import._parse_yaml_file
+
+    def _slow(path, loader_type, anchor=None):
+        time.sleep(0.05)
+        return original(path, loader_type, anchor)
+
+    monkeypatch.setattr(yaml_import, "_parse_yaml_file", _slow)
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+    with import_limits(ImportLimits(max_load_time=0.08)):
+        with pytest.raises(ImportLimitError, match="max_load_time"):
+            yaml.load("!import-all data/*.yml", extras_loader)
+
+
+def test_warn_only(tree, extras_loader):
+    limits = ImportLimits(max_files_per_pattern=2, max_total_bytes=10, max_import_depth=2, warn_only=True)
+    with import_limits(limits), import_budget() as budget:
+        with pytest.warns(ImportLimitWarning) as record:
+            data = yaml.load("a: !import-all data/*.yml\nb: !import chain0.yml\n", extras_loader)
+    assert len(data["a"]) == 5 and data["b"] == "end"
+    assert sorted({str(warning.message).split("=")[0] for warning in record}) == [
+        "Import limit max_files_per_pattern",
+        "Import limit max_import_depth",
+        "Import limit max_total_bytes",
+    ]
+    assert budget is not None and get_import_budget() is None
+    report = budget.report()
+    assert report["files_by_pattern"] == {"data/*.yml": 5}
+    assert report["max_depth"] == 5
+    assert report["bytes_read"] == sum(size for size in report["largest_files"].values())
+
+
+def test_unbounded_by_default(tree, extras_loader):
+    with import_budget() as budget:
+        assert len(yaml.load("!import-all data/*.yml", extras_loader)) == 5
+    assert budget is None
+
+
+def test_import_limits_validation():
+    with pytest.raises(ValueError, match="must not be negative"):
+        ImportLimits(max_total_bytes=-1)
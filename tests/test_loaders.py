@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from yaml_extras import CExtrasLoader, yaml_import
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML was built without libyaml")
+def test_c_extras_loader_uses_libyaml():
+    assert issubclass(CExtrasLoader, yaml.CSafeLoader)
+    assert not issubclass(CExtrasLoader, yaml.SafeLoader)
+
+
+def test_nested_imports_keep_loader_type(tmp_chdir, extras_loader):
+    instantiated: list[type] = []
+
+    class RecordingLoader(extras_loader):
+        def __init__(self, stream):
+            instantiated.append(type(self))
+            super().__init__(stream)
+
+    Path("leaf.yml").write_text("leaf: true\n")
+    Path("middle.yml").write_text("middle: !import leaf.yml\n")
+    data = yaml.load("root: !import middle.yml", RecordingLoader)
+    assert data == {"root": {"middle": {"leaf": True}}}
+    assert len(instantiated) == 3
+    assert set(instantiated) == {RecordingLoader}
+
+
+@pytest.mark.parametrize(
+    "mmap_threshold",
+    [pytest.param(8 * 1024 * 1024, id="bulk-read"), pytest.param(1, id="mmap")],
+)
+def test_imported_files_read_in_bulk_or_mapped(
+    mmap_threshold: int, tmp_chdir, reset_caches, extras_loader, monkeypatch
+):
+    monkeypatch.setattr(yaml_import, "MMAP_THRESHOLD", mmap_threshold)
+    Path("empty.yml").write_text("")
+    Path("crlf.yml").write_bytes(b"name: crlf\r\nitems:\r\n  - 1\r\n  - 2\r\n")
+    Path("anchors.yml").write_text("a: &a {v: 1}\nb: &b {v: é}\n", encoding="utf-8")
+    data = yaml.load(
+        "empty: !import empty.yml\ncrlf: !import crlf.yml\nb: !import.anchor anchors.yml &b\n", extras_loader
+    )
+    assert data == {"empty": None, "crlf": {"name": "crlf", "items": [1, 2]}, "b": {"v": "é"}}
+
+
+@pytest.mark.skipif(not Path("/proc/self/fd").is_dir(), reason="Requires /proc/self/fd")
+@pytest.mark.parametrize("mmap_threshold", [8 * 1024 * 1024, 1])
+def test_imported_files_closed_after_load(mmap_threshold: int, tmp_chdir, extras_loader, monkeypatch):
+    monkeypatch.setattr(yaml_import, "MMAP_THRESHOLD", mmap_threshold)
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+    Path("items").mkdir()
+    for i in range(20):
+        Path(f"items/{i}.yml").write_text(f"x: &x {i}\n")
+    open_fds = len(os.listdir("/proc/self/fd"))
+    for _ in range(5):
+        yaml.load("- !import-all items/*.yml\n- !import-all.anchor items/*.yml &x\n", extras_loader)
+    assert len(os.listdir("/proc/self/fd")) == open_fds
+
+
+def test_import_parse_error_names_file(tmp_chdir, reset_caches, extras_loader):
+    Path("broken.yml").write_text("a: [1, 2\n")
+    with pytest.raises(yaml.YAMLError, match="broken.yml"):
+        yaml.load("!import broken.yml", extras_loader)
@@ -0,0 +1,91 @@
+from pathlib import Path
+import threading
+
+import pytest
+import yaml
+
+from yaml_extras import yaml_import
+from yaml_extras.prefetch import ImportPrefetch
+
+
+@pytest.fixture
+def reads(monkeypatch) -> list[tuple[str, str]]:
+    """Disable the parse cache and record the name of every file read, along with the name of the
+    thread which read it."""
+    read_files: list[tuple[str, str]] = []
+    original = yaml_import._read_file
+
+    def _spy(path):
+        read_files.append((Path(path).name, threading.current_thread().name))
+        return original(path)
+
+    original_prefetch_read = yaml_import._prefetch_read
+
+    def _prefetch_spy(path):
+        read_files.append((Path(path).name, threading.current_thread().name))
+        return original_prefetch_read(path)
+
+    monkeypatch.setattr(yaml_import, "_read_file", _spy)
+    monkeypatch.setattr(yaml_import, "_prefetch_read", _prefetch_spy)
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+    return read_files
+
+
+def _write_tree() -> str:
+    Path("items").mkdir()
+    for i in range(3):
+        Path(f"items/{i}.yml").write_text(f"n: {i}\n")
+    Path("leaf.yml").write_text("leaf: true\n")
+    Path("middle.yml").write_text("middle: !import leaf.yml\n")
+    Path("anchors.yml").write_text("a: &a {v: 1}\n")
+    return "m: !import middle.yml\nitems: !import-all items/*.yml\na: !import.anchor anchors.yml &a\n"
+
+
+EXPECTED = {
+    "m": {"middle": {"leaf": True}},
+    "items": [{"n": 0}, {"n": 1}, {"n": 2}],
+    "a": {"v": 1},
+}
+
+
+def test_prefetch_read(tmp_chdir, reads, monkeypatch, extras_loader):
+    monkeypatch.setattr(yaml_import, "IMPORT_PREFETCH", ImportPrefetch("read"))
+    assert yaml.load(_write_tree(), extras_loader) == EXPECTED
+    threads = dict(reads)
+    assert sorted(threads) == ["0.yml", "1.yml", "2.yml", "anchors.yml", "leaf.yml", "middle.yml"]
+    # Files imported by the document are read in the background, while nested imports are only
+    # discovered once the file importing them is constructed
+    for name in ("0.yml", "1.yml", "2.yml", "anchors.yml", "middle.yml"):
+        assert threads[name].startswith("yaml-extras-prefetch")
+    assert reads.count(("middle.yml", threads["middle.yml"])) == 1
+
+
+def test_prefetch_parse(tmp_chdir, reads, monkeypatch, extras_loader):
+    monkeypatch.setattr(yaml_import, "IMPORT_PREFETCH", ImportPrefetch("parse", max_workers=2))
+    assert yaml.load(_write_tree(), extras_loader) == EXPECTED
+    # Nested imports are discovered by the workers which parse the files importing them
+    assert len(reads) == 6
+    assert all(thread.startswith("yaml-extras-prefetch") for _, thread in reads)
+
+
+def test_prefetch_failure_is_reported_by_constructor(tmp_chdir, reads, monkeypatch, extras_loader):
+    monkeypatch.setattr(yaml_import, "IMPORT_PREFETCH", ImportPrefetch("parse"))
+    Path("broken.yml").write_text("a: [\n")
+    with pytest.raises(FileNotFoundError):
+        yaml.load("!import missing.yml", extras_loader)
+    with pytest.raises(yaml.YAMLError, match="broken.yml"):
+        yaml.load("!import broken.yml", extras_loader)
+
+
+def test_prefetch_skips_lazy_imports(tmp_chdir, reads, monkeypatch, extras_loader):
+    monkeypatch.setattr(yaml_import, "IMPORT_PREFETCH", ImportPrefetch("read"))
+    monkeypatch.setattr(yaml_import, "LAZY_IMPORTS", True)
+    Path("leaf.yml").write_text("leaf: true\n")
+    data = yaml.load("!import leaf.yml", extras_loader)
+    assert reads == []
+    assert data == {"leaf": True}
+
+
+def test_prefetch_config():
+    with pytest.raises(ValueError, match="Unsupported prefetch mode"):
+        ImportPrefetch("eager")  # type: ignore
@@ -0,0 +1,140 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from yaml_extras import yaml_import
+from yaml_extras.reload import ReloadableDocument
+
+
+@pytest.fixture
+def parsed(monkeypatch) -> list[str]:
+    """Record the name of every file parsed."""
+    from yaml_extras import reload
+
+    parsed_files: list[str] = []
+    original = yaml_import._parse_yaml_file
+
+    def _spy(path, loader_type, anchor=None):
+        parsed_files.append(Path(path).name)
+        return original(path, loader_type, anchor)
+
+    monkeypatch.setattr(yaml_import, "_parse_yaml_file", _spy)
+    monkeypatch.setattr(reload, "_parse_yaml_file", _spy)
+    return parsed_files
+
+
+def _write(files: dict[str, str]) -> None:
+    for name, content in files.items():
+        Path(name).parent.mkdir(parents=True, exist_ok=True)
+        Path(name).write_text(content)
+
+
+def _fresh(extras_loader) -> dict:
+    return yaml.load(Path("root.yml").read_text(), extras_loader)
+
+
+def test_reload_leaf_in_place(tmp_chdir, reset_caches, parsed, extras_loader):
+    _write(
+        {
+            "root.yml": "a: !import a.yml\nb: !import b.yml\n",
+            "a.yml": "x: !import c.yml\n",
+            "b.yml": "y: 2\n",
+            "c.yml": "z: 3\n",
+        }
+    )
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    assert document.value == {"a": {"x": {"z": 3}}, "b": {"y": 2}}
+    a = document.value["a"]
+    parsed.clear()
+
+    _write({"c.yml": "z: 33\n"})
+    value = document.reload([Path("c.yml")])
+    assert parsed == ["c.yml"]
+    assert value == _fresh(extras_loader)
+    assert document.value["a"] is a
+
+
+def test_reload_intermediate_file_reuses_nested_imports(tmp_chdir, reset_caches, parsed, extras_loader):
+    _write({"root.yml": "a: !import a.yml\n", "a.yml": "x: !import c.yml\n", "c.yml": "z: 3\n"})
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    parsed.clear()
+
+    _write({"a.yml": "x: !import c.yml\nw: 4\n"})
+    assert document.reload([Path("a.yml")]) == {"a": {"x": {"z": 3}, "w": 4}}
+    assert parsed == ["a.yml"]
+
+
+def test_reload_glob(tmp_chdir, reset_caches, parsed, extras_loader):
+    _write({"root.yml": "items: !import-all items/*.yml\n", "items/1.yml": "n: 1\n", "items/2.yml": "n: 2\n"})
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    items = document.value["items"]
+    parsed.clear()
+
+    _write({"items/3.yml": "n: 3\n"})
+    assert document.reload([Path("items/3.yml")]) == {"items": [{"n": 1}, {"n": 2}, {"n": 3}]}
+    assert parsed == ["3.yml"]
+    assert document.value["items"] is items
+
+    Path("items/1.yml").unlink()
+    assert document.reload([Path("items/1.yml")]) == {"items": [{"n": 2}, {"n": 3}]}
+    assert parsed == ["3.yml"]
+
+
+def test_reload_unrelated_change(tmp_chdir, reset_caches, parsed, extras_loader):
+    _write({"root.yml": "items: !import-all items/*.yml\n", "items/1.yml": "n: 1\n", "other/x.yml": "x: 1\n"})
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    parsed.clear()
+
+    _write({"other/y.yml": "y: 1\n"})
+    assert document.reload([Path("other/y.yml"), Path("other/x.yml")]) == {"items": [{"n": 1}]}
+    assert parsed == []
+
+
+def test_reload_parameterized(tmp_chdir, reset_caches, parsed, extras_loader):
+    _write(
+        {
+            "root.yml": "items: !import-all-parameterized items/{name:*}.yml\n",
+            "items/a.yml": "n: 1\n",
+            "items/b.yml": "n: 2\n",
+        }
+    )
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    parsed.clear()
+
+    _write({"items/b.yml": "n: 22\n"})
+    assert document.reload([Path("items/b.yml")]) == {"items": [{"n": 1, "name": "a"}, {"n": 22, "name": "b"}]}
+    assert parsed == ["b.yml"]
+
+
+def test_reload_merged_import(tmp_chdir, reset_caches, parsed, extras_loader):
+    _write(
+        {
+            "root.yml": "<<: !import base.yml\nother: !import other.yml\n",
+            "base.yml": "a: 1\n",
+            "other.yml": "o: 1\n",
+        }
+    )
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    parsed.clear()
+
+    _write({"base.yml": "a: 11\nb: 2\n"})
+    assert document.reload([Path("base.yml")]) == {"a": 11, "b": 2, "other": {"o": 1}}
+    assert parsed == ["base.yml", "root.yml"]
+
+
+def test_reload_replaced_value(tmp_chdir, reset_caches, extras_loader):
+    _write({"root.yml": "- !import a.yml\n", "a.yml": "x: 1\n"})
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    root = document.value
+
+    _write({"a.yml": "just a scalar\n"})
+    assert document.reload([Path("a.yml")]) == ["just a scalar"]
+    assert document.value is root
+
+
+def test_reload_dependencies(tmp_chdir, reset_caches, extras_loader):
+    _write({"root.yml": "a: !import a.yml\nitems: !import-all items/*.yml\n", "a.yml": "1\n", "items/1.yml": "1\n"})
+    document = ReloadableDocument(Path("root.yml"), extras_loader)
+    assert {path.name for path in document.files()} == {"root.yml", "a.yml", "1.yml"}
+    assert tmp_chdir.resolve() / "items" in document.directories()
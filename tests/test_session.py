@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+import yaml
+
+from yaml_extras import session, yaml_import
+from yaml_extras.session import ImportCycleError, get_import_session
+
+
+@pytest.fixture
+def parsed(monkeypatch) -> list[str]:
+    """Disable the parse cache and record the name of every file parsed."""
+    parsed_files: list[str] = []
+    original = yaml_import._parse_yaml_file
+
+    def _spy(path, loader_type, anchor=None):
+        parsed_files.append(Path(path).name if anchor is None else f"{Path(path).name} &{anchor}")
+        return original(path, loader_type, anchor)
+
+    monkeypatch.setattr(yaml_import, "_parse_yaml_file", _spy)
+    monkeypatch.setattr(yaml_import, "PARSE_CACHE", None)
+    return parsed_files
+
+
+def test_session_deduplicates_diamond_imports(tmp_chdir, parsed, extras_loader):
+    Path("common.yml").write_text("shared: [1, 2]\n")
+    for name in ("a", "b", "c"):
+        Path(f"{name}.yml").write_text(f"<<: !import common.yml\nname: {name}\n")
+    Path("root.yml").write_text("a: !import a.yml\nb: !import b.yml\nc: !import c.yml\nd: !import common.yml\n")
+    data = yaml.load(Path("root.yml").read_text(), extras_loader)
+    assert data == {
+        "a": {"shared": [1, 2], "name": "a"},
+        "b": {"shared": [1, 2], "name": "b"},
+        "c": {"shared": [1, 2], "name": "c"},
+        "d": {"shared": [1, 2]},
+    }
+    assert sorted(parsed) == ["a.yml", "b.yml", "c.yml", "common.yml"]
+    # Every import receives its own copy
+    assert data["a"]["shared"] is not data["b"]["shared"]
+    assert get_import_session() is None
+
+
+def test_session_deduplicates_anchor_imports(tmp_chdir, parsed, extras_loader):
+    Path("lib.yml").write_text("x: &x {v: 1}\ny: &y {v: 2}\n")
+    Path("root.yml").write_text(
+        "- !import.anchor lib.yml &x\n- !import.anchor lib.yml &x\n- !import.anchor lib.yml &y\n"
+    )
+    assert yaml.load(Path("root.yml").read_text(), extras_loader) == [{"v": 1}, {"v": 1}, {"v": 2}]
+    assert parsed == ["lib.yml &x", "lib.yml &y"]
+
+
+@pytest.fixture
+def scans(monkeypatch) -> list[str]:
+    """Record the name of every file scanned for anchors."""
+    scanned_files: list[str] = []
+
+    class _ScannerSpy(yaml_import._AnchorScanner):
+        def __init__(self, path, loader_type):
+            scanned_files.append(Path(path).name)
+            super().__init__(path, loader_type)
+
+    monkeypatch.setattr(yaml_import, "_AnchorScanner", _ScannerSpy)
+    return scanned_files
+
+
+def test_session_scans_anchors_once(tmp_chdir, parsed, scans, extras_loader):
+    for name in ("a", "b"):
+        Path(f"{name}.yml").write_text(f"x: &x {{{name}: 1}}\ny: &y {{{name}: 2}}\nz: &z {{{name}: 3}}\n")
+    document = (
+        "- !import.anchor a.yml &x\n"
+        "- !import.anchors a.yml &y &z\n"
+        "- !import-all.anchor '*.yml &x'\n"
+        "- !import-all.anchor '*.yml &z'\n"
+    )
+    assert yaml.load(document, extras_loader) == [
+        {"a": 1},
+        {"y": {"a": 2}, "z": {"a": 3}},
+        [{"a": 1}, {"b": 1}],
+        [{"a": 3}, {"b": 3}],
+    ]
+    assert scans == ["a.yml", "b.yml"]
+    # A later load scans the files again
+    assert yaml.load("!import.anchor a.yml &y", extras_loader) == {"a": 2}
+    assert scans == ["a.yml", "b.yml", "a.yml"]
+
+
+def test_session_shares_directory_listings(tmp_chdir, monkeypatch, extras_loader):
+    from yaml_extras import file_utils
+
+    monkeypatch.setattr(file_utils, "GLOB_CACHE", None)
+    for path in ("configs/prod/a.yml", "configs/dev/b.yml", "configs/c.yml"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(f"name: {Path(path).stem}\n")
+    listings: list[int] = []
+    original = file_utils.directory_snapshot
+
+    @contextmanager
+    def _spy():
+        with original() as snapshot:
+            yield snapshot
+            listings.append(snapshot.listings)
+
+    monkeypatch.setattr(session, "directory_snapshot", _spy)
+    document = (
+        "all: !import-all configs/**/*.yml\n"
+        "named: !import-all-parameterized configs/**/{name:*}.yml\n"
+        "prod: !import-all configs/prod/*.yml\n"
+    )
+    data = yaml.load(document, extras_loader)
+    assert len(data["all"]) == len(data["named"]) == 3
+    assert data["prod"] == [{"name": "a"}]
+    assert listings == [3]
+
+
+def test_session_scoped_to_single_load(tmp_chdir, parsed, extras_loader):
+    Path("common.yml").write_text("v: 1\n")
+    assert yaml.load("!import common.yml", extras_loader) == {"v": 1}
+    Path("common.yml").write_text("v: 2\n")
+    assert yaml.load("!import common.yml", extras_loader) == {"v": 2}
+
+
+@pytest.mark.parametrize(
+    "files,expected_chain",
+    [
+        pytest.param(
+            {"root.yml": "!import a.yml", "a.yml": "b: !import b.yml\n", "b.yml": "a: !import a.yml\n"},
+            ["a.yml", "b.yml", "a.yml"],
+            id="indirect",
+        ),
+        pytest.param({"root.yml": "!import a.yml", "a.yml": "a: !import a.yml\n"}, ["a.yml", "a.yml"], id="self"),
+        pytest.param(
+            {"root.yml": "!import.anchor a.yml &x", "a.yml": "x: &x\n  y: !import.anchor a.yml &x\n"},
+            ["a.yml &x", "a.yml &x"],
+            id="anchor",
+        ),
+        pytest.param(
+            {"root.yml": "!import-all dir/*.yml", "dir/a.yml": "!import-all dir/*.yml\n"},
+            ["a.yml", "a.yml"],
+            id="glob",
+        ),
+    ],
+)
+def test_import_cycle(files: dict[str, str], expected_chain: list[str], tmp_chdir, reset_caches, extras_loader):
+    for name, content in files.items():
+        Path(name).parent.mkdir(parents=True, exist_ok=True)
+        Path(name).write_text(content)
+    with pytest.raises(ImportCycleError) as exc_info:
+        yaml.load(Path("root.yml").read_text(), extras_loader)
+    chain = [path.name if anchor is None else f"{path.name} &{anchor}" for path, anchor in exc_info.value.chain]
+    assert chain == expected_chain
+    assert "Import cycle detected" in str(exc_info.value)
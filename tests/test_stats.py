@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+import yaml
+
+from yaml_extras.stats import TagStats, collect_import_stats, get_import_stats
+
+
+def test_stats_per_tag(tmp_chdir, reset_caches, extras_loader):
+    Path("items").mkdir()
+    for i in range(3):
+        Path(f"items/{i}.yml").write_text(f"n: {i}\n")
+    Path("leaf.yml").write_text("leaf: true\n")
+    Path("middle.yml").write_text("middle: !import leaf.yml\n")
+    Path("anchors.yml").write_text("a: &a {v: 1}\n")
+    document = "m: !import middle.yml\nitems: !import-all items/*.yml\na: !import.anchor anchors.yml &a\n"
+    with collect_import_stats() as stats:
+        yaml.load(document, extras_loader)
+    assert get_import_stats() is None
+
+    by_source = {tag.source: tag for tag in stats.tags}
+    assert [tag.source for tag in stats.tags] == ["middle.yml", "leaf.yml", "items/*.yml", "anchors.yml &a"]
+    assert by_source["items/*.yml"].tag == "!import-all"
+    assert by_source["items/*.yml"].files_matched == 3
+    assert sorted(f.path.name for f in by_source["items/*.yml"].files) == ["0.yml", "1.yml", "2.yml"]
+    assert by_source["items/*.yml"].bytes_read == sum(len(f"n: {i}\n") for i in range(3))
+    assert by_source["anchors.yml &a"].files[0].anchor == "a"
+    for tag in stats.tags:
+        assert tag.cache_misses == tag.files_matched
+        assert tag.cache_hits == 0
+        assert tag.parse_time > 0 and tag.construct_time > 0
+    # The time spent constructing a file includes its nested imports
+    assert by_source["middle.yml"].total_time >= by_source["leaf.yml"].total_time
+    assert by_source["middle.yml"].construct_time >= by_source["leaf.yml"].construct_time
+    # The report is JSON-serializable
+    assert json.loads(json.dumps(stats.report()))[2]["files_matched"] == 3
+
+
+def test_stats_cache_hits(tmp_chdir, reset_caches, monkeypatch, extras_loader):
+    from yaml_extras import cache
+
+    # The file is freshly modified, so disable the racy window to let it be cached
+    monkeypatch.setattr(cache, "_RACY_WINDOW_NS", 0)
+    Path("common.yml").write_text("v: 1\n")
+    yaml.load("!import common.yml", extras_loader)
+    with collect_import_stats() as stats:
+        yaml.load("a: !import common.yml\nb: !import common.yml\n", extras_loader)
+    assert [(tag.cache_hits, tag.cache_misses, tag.bytes_read) for tag in stats.tags] == [(1, 0, 0), (1, 0, 0)]
+
+
+def test_stats_callback(tmp_chdir, reset_caches, extras_loader):
+    Path("leaf.yml").write_text("1\n")
+    Path("middle.yml").write_text("!import leaf.yml\n")
+    resolved: list[TagStats] = []
+    with collect_import_stats(callback=resolved.append) as stats:
+        assert yaml.load("!import middle.yml", extras_loader) == 1
+    # Nested tags are resolved before the tags which import them
+    assert [tag.source for tag in resolved] == ["leaf.yml", "middle.yml"]
+    assert stats.slowest(1) == [stats.tags[0]]
+
+
+def test_stats_disabled(tmp_chdir, reset_caches, extras_loader):
+    Path("leaf.yml").write_text("1\n")
+    with collect_import_stats() as stats:
+        pass
+    assert yaml.load("!import leaf.yml", extras_loader) == 1
+    assert stats.tags == []
@@ -1,16 +1,109 @@
-from io import StringIO
+from functools import partial
+from typing import Any, Mapping
 
 import yaml
 
 from yaml_extras import yaml_import
+from yaml_extras.cache import copy_value
+from yaml_extras.lazy import LazyImport
+from yaml_extras.session import import_session
+from yaml_extras.stats import get_import_stats
 
+_CONSTRUCTED_TAG = "tag:yaml-extras,2024:constructed"
 
-class ExtrasLoader(yaml.SafeLoader):
+
+class _ConstructedNode(yaml.ScalarNode):
+    """Placeholder node wrapping a value which has already been constructed, so that it can be
+    spliced into a node graph without being represented and constructed a second time."""
+
+    def __init__(self, value: Any):
+        super().__init__(_CONSTRUCTED_TAG, value)
+        self.consumed = False
+
+
+def _construct_constructed(loader: yaml.Loader, node: _ConstructedNode) -> Any:
+    # A node graph may be constructed more than once in a load, e.g. an anchor imported both on its
+    # own and within an enclosing anchor, in which case later constructions receive a copy.
+    if node.consumed:
+        return copy_value(node.value)
+    node.consumed = True
+    return node.value
+
+
+def _as_merge_node(value: Any) -> yaml.Node:
+    """Wrap an imported value in a node which PyYAML's merge logic can consume. Mappings and
+    sequences of mappings are shallowly wrapped, with their keys and values kept as-is; any other
+    value is left for PyYAML to reject as an invalid merge source. Frozen mappings and tuples (see
+    `set_shared_imports`) are merged like dicts and lists.
+
+    Args:
+        value (Any): Imported value to be merged.
+
+    Returns:
+        yaml.Node: Node wrapping the imported value.
+    """
+    if isinstance(value, LazyImport):
+        value = value.resolve()
+    if isinstance(value, yaml_import.ImportAllStream):
+        value = list(value)
+    if isinstance(value, Mapping):
+        return yaml.MappingNode(
+            "tag:yaml.org,2002:map",
+            [(_ConstructedNode(key), _ConstructedNode(item)) for key, item in value.items()],
+        )
+    if isinstance(value, (list, tuple)):
+        return yaml.SequenceNode("tag:yaml.org,2002:seq", [_as_merge_node(item) for item in value])
+    return _ConstructedNode(value)
+
+
+class _ExtrasLoaderMixin:
+    """Behavior shared by the pure-Python and libyaml-accelerated loaders: registering the
+    constructors for the reserved tags, and patching the "<<" merge key logic to support imports."""
 
     def __init__(self, stream):
-        super().__init__(stream)
+        super().__init__(stream)  # type: ignore
         for tag, constructor in yaml_import.RESERVED_TAGS.items():
             self.add_constructor(tag, constructor())  # type: ignore
+        self.add_constructor(_CONSTRUCTED_TAG, _construct_constructed)  # type: ignore
+        self._merging_imports = False
+
+    def construct_document(self, node: yaml.Node) -> Any:
+        """Construct a document within an import session, which is shared by every import performed
+        while constructing it (including imports nested within imported files), so that each file is
+        only loaded once per document, and import cycles are detected. When import prefetching is
+        enabled, the files imported by the document start loading in the background first.
+
+        Args:
+            node (yaml.Node): Root node of the document.
+
+        Returns:
+            Any: The constructed document.
+        """
+        with import_session():
+            if yaml_import.get_import_prefetch() is not None:
+                yaml_import._prefetch_imports(node, type(self))  # type: ignore
+            return super().construct_document(node)  # type: ignore
+
+    def construct_object(self, node: yaml.Node, deep: bool = False) -> Any:
+        """Construct a node, reporting every import to the active statistics collector (if any), and
+        to the active import observer (if any), which records the import graph of the document for
+        incremental reloads.
+
+        Args:
+            node (yaml.Node): The node to construct.
+            deep (bool): Whether to construct nested nodes immediately. Defaults to False.
+
+        Returns:
+            Any: The constructed object.
+        """
+        if node.tag not in yaml_import.RESERVED_TAGS or node in self.constructed_objects:  # type: ignore
+            return super().construct_object(node, deep)  # type: ignore
+        construct = partial(super().construct_object, node, deep)  # type: ignore
+        if (stats := get_import_stats()) is not None:
+            construct = partial(stats.observe_tag, node, construct)
+        if (observer := yaml_import._IMPORT_OBSERVER.get()) is None:
+            return construct()
+        return observer.observe_import(type(self), node, self._merging_imports, construct)
 
     def flatten_mapping(self, node: yaml.MappingNode):
         """The `flatten_mapping` implementation, which handles the "<<" merge key logic in PyYAML,
@@ -18,25 +111,44 @@ class ExtrasLoader(yaml.SafeLoader):
         tag. The expected behavior is for the contents of the files to be loaded via import before
         merging the results.
 
+        Each import is constructed exactly once, and its result is spliced into the node graph as
+        already-constructed nodes for PyYAML's merge logic to consume.
+
         Args:
             node (yaml.MappingNode): The node to flatten.
         """
         for i in range(len(node.value)):
             key_node, value_node = node.value[i]
             if key_node.tag == "tag:yaml.org,2002:merge":
+                self._merging_imports = True
                 if isinstance(value_node, yaml.ScalarNode) and value_node.tag in yaml_import.RESERVED_TAGS:
-                    imported_value = self.construct_object(value_node)
-                    data_buffer = StringIO()
-                    imported_repr = yaml.SafeDumper(data_buffer).represent_data(imported_value)
-                    node.value[i] = (key_node, imported_repr)
+                    imported_value = self.construct_object(value_node)  # type: ignore
+                    node.value[i] = (key_node, _as_merge_node(imported_value))
                 if isinstance(value_node, yaml.SequenceNode):
                     for j in range(len(value_node.value)):
                         subnode = value_node.value[j]
                         if isinstance(subnode, yaml.ScalarNode) and subnode.tag in yaml_import.RESERVED_TAGS:
-                            imported_value = self.construct_object(subnode)
-                            data_buffer = StringIO()
-                            imported_repr = yaml.SafeDumper(data_buffer).represent_data(imported_value)
-                            value_node.value[j] = imported_repr
+                            imported_value = self.construct_object(subnode)  # type: ignore
+                            value_node.value[j] = _as_merge_node(imported_value)
                     value_node.value.reverse()
                     node.value[i] = (key_node, value_node)
-        super().flatten_mapping(node)
+                self._merging_imports = False
+        super().flatten_mapping(node)  # type: ignore
+
+
+class ExtrasLoader(_ExtrasLoaderMixin, yaml.SafeLoader):
+    """Safe YAML loader which supports the `yaml-extras` tags, built on the pure-Python
+    `yaml.SafeLoader`."""
+
+
+if yaml.__with_libyaml__:
+
+    class CExtrasLoader(_ExtrasLoaderMixin, yaml.CSafeLoader):  # type: ignore
+        """Safe YAML loader which supports the `yaml-extras` tags, built on the libyaml-accelerated
+        `yaml.CSafeLoader`. Tag and merge semantics are identical to `ExtrasLoader`.
+
+        When PyYAML was built without libyaml, this name is an alias of `ExtrasLoader`.
+        """
+
+else:  # pragma: no cover
+    CExtrasLoader = ExtrasLoader  # type: ignore
@@ -0,0 +1,46 @@
+"""
+Command-line interface of `yaml-extras`.
+
+- `yaml-extras bundle <path>`: resolve a document and write its bundle and manifest.
+- `yaml-extras check <path>`: exit with status 1 if the bundle of a document is missing or stale.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+import yaml_extras
+from yaml_extras import bundle, yaml_import
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="yaml-extras", description="Utilities for yaml-extras documents.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in (
+        ("bundle", "Resolve a document and write its bundle and manifest."),
+        ("check", "Check whether the bundle of a document is up-to-date."),
+    ):
+        subparser = subparsers.add_parser(command, help=help_text)
+        subparser.add_argument("path", type=Path, help="Path to the root document.")
+        subparser.add_argument("-o", "--output", type=Path, default=None, help="Path to the bundle.")
+        subparser.add_argument("--loader", choices=["ExtrasLoader", "CExtrasLoader"], default="ExtrasLoader")
+        subparser.add_argument("--relative-dir", type=Path, default=None, help="Directory to resolve imports in.")
+    args = parser.parse_args(argv)
+
+    loader_type = getattr(yaml_extras, args.loader)
+    if args.relative_dir is not None:
+        yaml_import.set_import_relative_dir(args.relative_dir.resolve())
+    bundle_path = args.output if args.output is not None else bundle.default_bundle_path(args.path)
+    if args.command == "bundle":
+        bundle.build_bundle(args.path, bundle_path, loader_type)
+        print(f"Wrote {bundle_path}")
+        return 0
+    if bundle.is_bundle_current(args.path, bundle_path, loader_type):
+        print(f"{bundle_path} is up-to-date")
+        return 0
+    print(f"{bundle_path} is missing or stale")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
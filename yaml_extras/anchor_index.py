@@ -0,0 +1,300 @@
+"""
+This module implements persistent "anchor indexes", which let the `!import.anchor` and
+`!import-all.anchor` tags load an anchor from a very large file without parsing the file from its
+start. An index maps each anchor defined in a file to the byte range of the node it marks, and to
+the column that node starts at, so that the node can be parsed on its own.
+
+Indexes are built on demand, the first time an anchor is imported from a large enough file (see
+`yaml_import.set_anchor_index_threshold`), and stored as JSON in a sidecar file next to the indexed
+file, e.g. "defs.yml.anchors.json" for "defs.yml". An index is only used while the size and
+modification time of the file match the ones it was built for; when only the modification time
+changed, the file is hashed and compared by contents instead, so that touching a file does not force
+the index to be rebuilt.
+
+Each entry also records a digest of the parser events of its node. When a node is loaded through
+the index, the events of the byte range are checked against this digest, and the file is parsed
+from its start as before if they differ, e.g. because the node refers to an anchor defined
+elsewhere in the file. Anchors which are defined more than once in a file are never loaded through
+the index.
+"""
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+import threading
+from typing import Callable, Iterable, Iterator
+
+import yaml
+
+from yaml_extras.cache import _sha256, _write_atomic
+
+ANCHOR_INDEX_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class AnchorIndexEntry:
+    """Location of the node marked by an anchor within an indexed file.
+
+    Attributes:
+        start (int): Byte offset of the start of the node, including its anchor and tag.
+        end (int): Byte offset of the end of the node.
+        column (int): Column at which the node starts, which is restored by indenting the node with
+            as many spaces when it is parsed on its own.
+        digest (str | None): Digest of the parser events of the node, or None if the anchor is
+            defined more than once in the file.
+    """
+
+    start: int
+    end: int
+    column: int
+    digest: str | None
+
+
+@dataclass
+class AnchorIndex:
+    """Index of the anchors defined in a YAML file, stored as JSON in a sidecar file.
+
+    Attributes:
+        size (int): Size of the indexed file in bytes.
+        mtime_ns (int): Modification time of the indexed file in nanoseconds.
+        sha256 (str): Hex digest of the SHA-256 hash of the indexed file contents.
+        anchors (dict[str, AnchorIndexEntry]): Location of the node marked by each anchor.
+        version (int): Format version of the index. Defaults to the current format version.
+
+    Methods:
+        from_events: Build the index of a file from the parser events of its contents.
+        read: Read an index from a JSON file.
+        write: Write the index to a JSON file.
+        is_current: Return whether the indexed file is unchanged.
+    """
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    anchors: dict[str, AnchorIndexEntry]
+    version: int = ANCHOR_INDEX_FORMAT_VERSION
+
+    @classmethod
+    def from_events(cls, path: Path, events: Iterable[yaml.Event]) -> "AnchorIndex":
+        """Build the index of a file from the parser events of its contents.
+
+        Args:
+            path (Path): Path to the indexed file.
+            events (Iterable[yaml.Event]): Parser events of the whole file.
+
+        Returns:
+            AnchorIndex: Index of the anchors defined in the file.
+        """
+        # Regions of every anchored node, keyed by anchor: (start mark, end mark, event digest)
+        regions: dict[str, tuple[yaml.Mark, yaml.Mark, str | None]] = {}
+        open_regions: list[tuple[str, yaml.Mark, "hashlib._Hash", list[int]]] = []
+        for event in events:
+            if isinstance(event, (yaml.ScalarEvent, yaml.CollectionStartEvent)) and event.anchor is not None:
+                open_regions.append((event.anchor, event.start_mark, new_event_digest(), [0]))
+            if not open_regions:
+                continue
+            key = repr(event_key(event)).encode()
+            for _, _, digest, depth in open_regions:
+                digest.update(key)
+                if isinstance(event, yaml.CollectionStartEvent):
+                    depth[0] += 1
+                elif isinstance(event, yaml.CollectionEndEvent):
+                    depth[0] -= 1
+            while open_regions and open_regions[-1][3][0] == 0:
+                anchor, start_mark, digest, _ = open_regions.pop()
+                if anchor in regions:
+                    # Anchors defined more than once are resolved by a full parse
+                    regions[anchor] = (regions[anchor][0], regions[anchor][1], None)
+                else:
+                    regions[anchor] = (start_mark, event.end_mark, digest.hexdigest())
+
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size == 0:
+                return cls(stat.st_size, stat.st_mtime_ns, hashlib.sha256().hexdigest(), {})
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                marks = {(m.line, m.column) for start, end, _ in regions.values() for m in (start, end)}
+                offsets = dict(_byte_offsets(data, sorted(marks)))
+                sha256 = hashlib.sha256(data).hexdigest()
+        anchors = {
+            anchor: AnchorIndexEntry(
+                offsets[start.line, start.column], offsets[end.line, end.column], start.column, digest
+            )
+            for anchor, (start, end, digest) in regions.items()
+        }
+        return cls(stat.st_size, stat.st_mtime_ns, sha256, anchors)
+
+    @classmethod
+    def read(cls, path: Path) -> "AnchorIndex":
+        """Read an index from a JSON file.
+
+        Args:
+            path (Path): Path to the index.
+
+        Raises:
+            ValueError: If the index is malformed.
+
+        Returns:
+            AnchorIndex: Index read from the file.
+        """
+        try:
+            data = json.loads(Path(path).read_text())
+            return cls(
+                size=data["size"],
+                mtime_ns=data["mtime_ns"],
+                sha256=data["sha256"],
+                anchors={anchor: AnchorIndexEntry(**entry) for anchor, entry in data["anchors"].items()},
+                version=data["version"],
+            )
+        except (KeyError, TypeError, AttributeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Failed to read anchor index {path}: {e}") from e
+
+    def write(self, path: Path) -> None:
+        """Write the index to a JSON file.
+
+        Args:
+            path (Path): Path to the index.
+        """
+        _write_atomic(Path(path), (json.dumps(asdict(self)) + "\n").encode())
+
+    def is_current(self, path: Path) -> bool:
+        """Return whether the indexed file is unchanged. A file whose modification time changed is
+        hashed and compared by contents, and the refreshed modification time is recorded in the
+        index, so that an unchanged file is only hashed once.
+
+        Args:
+            path (Path): Path to the indexed file.
+
+        Returns:
+            bool: True if the index is still up-to-date.
+        """
+        if self.version != ANCHOR_INDEX_FORMAT_VERSION:
+            return False
+        try:
+            stat = os.stat(path)
+            if stat.st_size != self.size:
+                return False
+            if stat.st_mtime_ns != self.mtime_ns:
+                if _sha256(Path(path)) != self.sha256:
+                    return False
+                self.mtime_ns = stat.st_mtime_ns
+        except OSError:
+            return False
+        return True
+
+
+def event_key(event: yaml.Event) -> tuple:
+    """Return the parts of a parser event which determine the node it composes into, leaving out
+    its position and presentation style.
+
+    Args:
+        event (yaml.Event): Parser event.
+
+    Returns:
+        tuple: Key of the event.
+    """
+    return (
+        type(event).__name__,
+        getattr(event, "anchor", None),
+        getattr(event, "tag", None),
+        getattr(event, "implicit", None),
+        getattr(event, "value", None),
+    )
+
+
+def new_event_digest() -> "hashlib._Hash":
+    """Return an empty digest of parser events, as recorded for each entry of an anchor index.
+
+    Returns:
+        hashlib._Hash: Empty digest.
+    """
+    return hashlib.blake2b(digest_size=16)
+
+
+def hash_node_events(events: Iterable[yaml.Event], digest: "hashlib._Hash") -> Iterator[yaml.Event]:
+    """Yield parser events, updating a digest with the node events among them, i.e. leaving out
+    the events which start and end streams and documents.
+
+    Args:
+        events (Iterable[yaml.Event]): Parser events.
+        digest (hashlib._Hash): Digest to update.
+
+    Yields:
+        yaml.Event: The parser events.
+    """
+    for event in events:
+        if isinstance(event, (yaml.NodeEvent, yaml.CollectionEndEvent)):
+            digest.update(repr(event_key(event)).encode())
+        yield event
+
+
+def _byte_offsets(data: mmap.mmap, marks: list[tuple[int, int]]) -> Iterator[tuple[tuple[int, int], int]]:
+    """Convert (line, column) marks, sorted in order, into byte offsets within UTF-8 encoded
+    data."""
+    line, line_start = 0, 0
+    for mark_line, column in marks:
+        while line < mark_line:
+            newline = data.find(b"\n", line_start)
+            if newline == -1:
+                break
+            line, line_start = line + 1, newline + 1
+        line_end = data.find(b"\n", line_start)
+        prefix = data[line_start : line_end if line_end != -1 else len(data)].decode("utf-8", errors="replace")
+        yield (mark_line, column), line_start + len(prefix[:column].encode("utf-8", errors="replace"))
+
+
+def anchor_index_path(path: Path) -> Path:
+    """Return the location of the sidecar index of a file.
+
+    Args:
+        path (Path): Path to the indexed file.
+
+    Returns:
+        Path: Path to the index, e.g. "defs.yml.anchors.json" for "defs.yml".
+    """
+    return Path(path).with_name(Path(path).name + ".anchors.json")
+
+
+_INDEXES: dict[Path, AnchorIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_anchor_index(path: Path, build: Callable[[], AnchorIndex]) -> AnchorIndex:
+    """Return the current index of a file: the one already read by this process, or else the one
+    stored in its sidecar file, or else a new one, which is written to the sidecar file.
+
+    Args:
+        path (Path): Resolved path to the indexed file.
+        build (Callable[[], AnchorIndex]): Function which builds a new index of the file.
+
+    Returns:
+        AnchorIndex: Current index of the file.
+    """
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(path)
+    if index is not None and index.is_current(path):
+        return index
+    sidecar = anchor_index_path(path)
+    try:
+        index = AnchorIndex.read(sidecar)
+    except (OSError, ValueError):
+        index = None
+    if index is None or not index.is_current(path):
+        index = build()
+        try:
+            index.write(sidecar)
+        except OSError:
+            # The index still serves this process when the directory is read-only
+            pass
+    with _INDEXES_LOCK:
+        _INDEXES[path] = index
+    return index
+
+
+def clear_anchor_indexes() -> None:
+    """Forget the anchor indexes read by this process. Sidecar files are left in place."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
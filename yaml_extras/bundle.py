@@ -0,0 +1,296 @@
+"""
+This module implements precompiled "bundles" of fully resolved documents. Loading a document with
+the `!import` family of tags can require reading and parsing hundreds of files; a bundle stores the
+fully resolved result in a binary file (a pickle) which loads in milliseconds, alongside a manifest
+of every file and glob expansion the document depends on.
+
+`load_bundle` checks the manifest before using the bundle, and transparently rebuilds it when any
+dependency has changed. Files are first compared by size and modification time, and only hashed
+when those differ, so that a file which was touched (e.g. by a fresh checkout) but left unchanged
+does not force a rebuild.
+
+Bundles are pickles, so they must only ever be loaded from trusted locations.
+"""
+
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import pickle
+from typing import Any, Type
+
+import yaml
+
+from yaml_extras import ExtrasLoader
+from yaml_extras.cache import FileSignature, GlobSignature, _sha256, _write_atomic, track_dependencies
+from yaml_extras.lazy import materialize
+from yaml_extras.yaml_import import _parse_yaml_file, get_import_relative_dir
+
+BUNDLE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestFile:
+    """Entry of a bundle manifest describing a file the bundled document depends on.
+
+    Attributes:
+        path (str): Resolved path to the file.
+        size (int): Size of the file in bytes.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        sha256 (str): Hex digest of the SHA-256 hash of the file contents.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class ManifestGlob:
+    """Entry of a bundle manifest describing a path pattern expanded by the bundled document.
+
+    Attributes:
+        pattern (str): Path pattern which was expanded.
+        relative_to (str | None): Directory the pattern was expanded relative to.
+        paths (list[str]): Paths which matched the pattern, in order.
+    """
+
+    pattern: str
+    relative_to: str | None
+    paths: list[str]
+
+
+@dataclass
+class BundleManifest:
+    """Manifest of everything a bundled document depends on, stored as JSON next to the bundle.
+
+    Attributes:
+        root (str): Resolved path to the root document.
+        loader (str): Fully qualified name of the loader type used to load the document.
+        relative_dir (str): Directory which imports were resolved relative to.
+        files (list[ManifestFile]): Files the document depends on, including the root document.
+        globs (list[ManifestGlob]): Path patterns the document expanded.
+        version (int): Format version of the bundle. Defaults to the current format version.
+
+    Methods:
+        read: Read a manifest from a JSON file.
+        write: Write the manifest to a JSON file.
+        is_current: Return whether every dependency is unchanged.
+    """
+
+    root: str
+    loader: str
+    relative_dir: str
+    files: list[ManifestFile]
+    globs: list[ManifestGlob]
+    version: int = BUNDLE_FORMAT_VERSION
+
+    @classmethod
+    def read(cls, path: Path) -> "BundleManifest":
+        """Read a manifest from a JSON file.
+
+        Args:
+            path (Path): Path to the manifest.
+
+        Raises:
+            ValueError: If the manifest is malformed.
+
+        Returns:
+            BundleManifest: Manifest read from the file.
+        """
+        try:
+            data = json.loads(Path(path).read_text())
+            return cls(
+                root=data["root"],
+                loader=data["loader"],
+                relative_dir=data["relative_dir"],
+                files=[ManifestFile(**file) for file in data["files"]],
+                globs=[ManifestGlob(**glob) for glob in data["globs"]],
+                version=data["version"],
+            )
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Failed to read bundle manifest {path}: {e}") from e
+
+    def write(self, path: Path) -> None:
+        """Write the manifest to a JSON file.
+
+        Args:
+            path (Path): Path to the manifest.
+        """
+        _write_atomic(Path(path), (json.dumps(asdict(self), indent=2) + "\n").encode())
+
+    def is_current(self) -> bool:
+        """Return whether every dependency is unchanged. Files whose size and modification time are
+        unchanged are assumed to be unchanged; files whose modification time changed are hashed and
+        compared by contents. Refreshed modification times are recorded in the manifest, so that an
+        unchanged file is only hashed once.
+
+        Returns:
+            bool: True if the bundled document is still up-to-date.
+        """
+        for i, file in enumerate(self.files):
+            try:
+                stat = os.stat(file.path)
+            except OSError:
+                return False
+            if stat.st_size != file.size:
+                return False
+            if stat.st_mtime_ns != file.mtime_ns:
+                if _sha256(Path(file.path)) != file.sha256:
+                    return False
+                self.files[i] = ManifestFile(file.path, file.size, stat.st_mtime_ns, file.sha256)
+        for glob in self.globs:
+            relative_to = Path(glob.relative_to) if glob.relative_to is not None else None
+            if not GlobSignature(glob.pattern, relative_to, tuple(Path(p) for p in glob.paths)).is_current():
+                return False
+        return True
+
+
+def _loader_name(loader_type: type) -> str:
+    return f"{loader_type.__module__}.{loader_type.__qualname__}"
+
+
+def default_bundle_path(path: Path) -> Path:
+    """Return the default location of the bundle of a document, next to the document itself.
+
+    Args:
+        path (Path): Path to the root document.
+
+    Returns:
+        Path: Path to the bundle, e.g. "config.yml.bundle" for "config.yml".
+    """
+    return Path(path).with_name(Path(path).name + ".bundle")
+
+
+def manifest_path(bundle_path: Path) -> Path:
+    """Return the location of the manifest of a bundle.
+
+    Args:
+        bundle_path (Path): Path to the bundle.
+
+    Returns:
+        Path: Path to the manifest, e.g. "config.yml.bundle.manifest.json".
+    """
+    return Path(bundle_path).with_name(Path(bundle_path).name + ".manifest.json")
+
+
+def build_bundle(
+    path: Path,
+    bundle_path: Path | None = None,
+    loader_type: Type[yaml.Loader] = ExtrasLoader,
+) -> Any:
+    """Load a document, resolving every nested import, and write the result to a bundle along with
+    its manifest. Lazy imports are materialized before the result is written.
+
+    Args:
+        path (Path): Path to the root document.
+        bundle_path (Path | None): Path to write the bundle to. Defaults to None, which writes it
+            next to the document (see `default_bundle_path`).
+        loader_type (Type[yaml.Loader]): YAML loader type. Defaults to ExtrasLoader.
+
+    Raises:
+        ValueError: If the resolved document cannot be pickled.
+
+    Returns:
+        Any: The resolved document.
+    """
+    path = Path(path).resolve()
+    bundle_path = Path(bundle_path) if bundle_path is not None else default_bundle_path(path)
+    with track_dependencies() as deps:
+        value = materialize(_parse_yaml_file(path, loader_type))
+    deps.add(FileSignature.from_path(path))
+
+    files: dict[str, ManifestFile] = {}
+    globs: list[ManifestGlob] = []
+    for dep in deps:
+        if isinstance(dep, FileSignature):
+            file_path = str(dep.path)
+            if file_path not in files:
+                files[file_path] = ManifestFile(file_path, dep.size, dep.mtime_ns, _sha256(dep.path))
+        elif isinstance(dep, GlobSignature):
+            relative_to = str(dep.relative_to) if dep.relative_to is not None else None
+            globs.append(ManifestGlob(dep.pattern, relative_to, [str(p) for p in dep.paths]))
+    manifest = BundleManifest(
+        root=str(path),
+        loader=_loader_name(loader_type),
+        relative_dir=str(get_import_relative_dir()),
+        files=sorted(files.values(), key=lambda file: file.path),
+        globs=sorted(globs, key=lambda glob: (glob.pattern, glob.relative_to or "")),
+    )
+    try:
+        contents = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise ValueError(f"Failed to bundle {path}: {e}") from e
+    _write_atomic(bundle_path, contents)
+    manifest.write(manifest_path(bundle_path))
+    return value
+
+
+def _current_manifest(path: Path, bundle_path: Path, loader_type: type) -> BundleManifest | None:
+    try:
+        manifest = BundleManifest.read(manifest_path(bundle_path))
+    except (OSError, ValueError):
+        return None
+    if (
+        manifest.version != BUNDLE_FORMAT_VERSION
+        or manifest.root != str(path)
+        or manifest.loader != _loader_name(loader_type)
+        or manifest.relative_dir != str(get_import_relative_dir())
+    ):
+        return None
+    mtimes = [file.mtime_ns for file in manifest.files]
+    if not manifest.is_current():
+        return None
+    if [file.mtime_ns for file in manifest.files] != mtimes:
+        manifest.write(manifest_path(bundle_path))
+    return manifest
+
+
+def is_bundle_current(
+    path: Path,
+    bundle_path: Path | None = None,
+    loader_type: Type[yaml.Loader] = ExtrasLoader,
+) -> bool:
+    """Return whether the bundle of a document exists and is up-to-date.
+
+    Args:
+        path (Path): Path to the root document.
+        bundle_path (Path | None): Path to the bundle. Defaults to None, which looks for it next to
+            the document (see `default_bundle_path`).
+        loader_type (Type[yaml.Loader]): YAML loader type. Defaults to ExtrasLoader.
+
+    Returns:
+        bool: True if the bundle can be loaded without rebuilding it.
+    """
+    path = Path(path).resolve()
+    bundle_path = Path(bundle_path) if bundle_path is not None else default_bundle_path(path)
+    return bundle_path.exists() and _current_manifest(path, bundle_path, loader_type) is not None
+
+
+def load_bundle(
+    path: Path,
+    bundle_path: Path | None = None,
+    loader_type: Type[yaml.Loader] = ExtrasLoader,
+) -> Any:
+    """Load a document from its bundle, rebuilding the bundle first if it is missing or if any file
+    or glob expansion the document depends on has changed.
+
+    Args:
+        path (Path): Path to the root document.
+        bundle_path (Path | None): Path to the bundle. Defaults to None, which keeps it next to the
+            document (see `default_bundle_path`).
+        loader_type (Type[yaml.Loader]): YAML loader type. Defaults to ExtrasLoader.
+
+    Returns:
+        Any: The resolved document.
+    """
+    path = Path(path).resolve()
+    bundle_path = Path(bundle_path) if bundle_path is not None else default_bundle_path(path)
+    if _current_manifest(path, bundle_path, loader_type) is not None:
+        try:
+            with bundle_path.open("rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+    return build_bundle(path, bundle_path, loader_type)
@@ -0,0 +1,368 @@
+"""
+This module implements the process-wide cache of parsed YAML files which backs the `!import` family
+of tags. When the same fragment is imported by many documents, or when a document is reloaded, the
+file is only parsed once for as long as it (and everything it imports in turn) remains unchanged.
+
+Entries are looked up by the resolved path of the file, the loader type used to parse it, and an
+optional variant (e.g. the anchor being extracted). Each entry remembers the size and modification
+time of the file it was parsed from, as well as the signatures of every file and glob expansion
+which was resolved while constructing it, so a change to a deeply nested import still invalidates
+the cached result of the document at the top of the import tree. Results depending on a file
+modified too recently before it was parsed are not cached at all, since the file may be rewritten
+with the same size within the resolution of its timestamp, without its modification time changing.
+
+The cache evicts its least recently used entries when either its entry count or the approximate
+number of bytes it holds (measured as the size of the source files) exceeds the configured bounds.
+By default, values are copied on the way out so that callers which mutate their results can never
+corrupt the cached copy.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import copy
+from dataclasses import dataclass, field
+import datetime
+import hashlib
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Hashable, Iterator, Protocol
+
+from yaml_extras.file_utils import PathPattern
+from yaml_extras.frozen import FrozenDict
+
+
+class Dependency(Protocol):
+    """Protocol for anything a cached value may depend on, which can be asked whether it is still
+    up-to-date."""
+
+    def is_current(self) -> bool: ...
+
+
+@dataclass(frozen=True)
+class FileSignature:
+    """Snapshot of the identity of a file on disk, used to detect when the file has changed.
+
+    Attributes:
+        path (Path): Resolved path to the file.
+        size (int): Size of the file in bytes.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+
+    Methods:
+        from_path: Take the signature of a file as it currently exists on disk.
+        is_current: Return whether the file on disk still matches this signature.
+    """
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def from_path(cls, path: Path) -> "FileSignature":
+        """Take the signature of a file as it currently exists on disk.
+
+        Args:
+            path (Path): Path to the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+
+        Returns:
+            FileSignature: Signature of the file.
+        """
+        stat = os.stat(path)
+        return cls(Path(path), stat.st_size, stat.st_mtime_ns)
+
+    def is_current(self) -> bool:
+        """Return whether the file on disk still matches this signature.
+
+        Returns:
+            bool: True if the file exists with the same size and modification time.
+        """
+        try:
+            return FileSignature.from_path(self.path) == self
+        except OSError:
+            return False
+
+
+def _sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _write_atomic(path: Path, contents: bytes) -> None:
+    # Write to a temporary file first, so that a concurrent reader never sees a partial file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(contents)
+    os.replace(tmp_path, path)
+
+
+@dataclass(frozen=True)
+class GlobSignature:
+    """Snapshot of the files matched by a path pattern, used to detect when files matching the
+    pattern are added or removed.
+
+    Attributes:
+        pattern (str): Path pattern which was expanded.
+        relative_to (Path | None): Directory the pattern was expanded relative to.
+        paths (tuple[Path, ...]): Paths which matched the pattern, in order.
+
+    Methods:
+        is_current: Return whether the pattern still matches the same paths.
+    """
+
+    pattern: str
+    relative_to: Path | None
+    paths: tuple[Path, ...]
+
+    def is_current(self) -> bool:
+        """Return whether the pattern still matches the same paths.
+
+        Returns:
+            bool: True if expanding the pattern again yields the same paths.
+        """
+        results = PathPattern(self.pattern, self.relative_to).results()
+        return tuple(result.path for result in results) == self.paths
+
+
+_DEPENDENCY_STACK: ContextVar[tuple[set[Dependency], ...]] = ContextVar("_DEPENDENCY_STACK", default=())
+
+
+@contextmanager
+def track_dependencies() -> Iterator[set[Dependency]]:
+    """Context manager which collects every dependency noted (via `note_dependency`) while it is
+    active. Trackers nest: dependencies noted in an inner tracker are also propagated to the outer
+    tracker once the inner one exits.
+
+    Yields:
+        set[Dependency]: The set of dependencies noted so far.
+    """
+    deps: set[Dependency] = set()
+    token = _DEPENDENCY_STACK.set(_DEPENDENCY_STACK.get() + (deps,))
+    try:
+        yield deps
+    finally:
+        _DEPENDENCY_STACK.reset(token)
+        note_dependency(*deps)
+
+
+def note_dependency(*deps: Dependency) -> None:
+    """Record that the value currently being constructed depends on the given dependencies. Has no
+    effect when no tracker is active.
+
+    Args:
+        *deps (Dependency): Dependencies to record.
+    """
+    stack = _DEPENDENCY_STACK.get()
+    if stack:
+        stack[-1].update(deps)
+
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), datetime.date, datetime.datetime)
+
+
+def copy_value(value: Any, memo: dict[int, Any] | None = None) -> Any:
+    """Copy a value as constructed by a YAML loader. This is a faster equivalent of `copy.deepcopy`
+    for the plain containers and scalars PyYAML produces, which preserves shared references and
+    recursive structures created by anchors and aliases. Unrecognized types fall back to
+    `copy.deepcopy`. Frozen values (see the `frozen` module) are shared rather than copied.
+
+    Args:
+        value (Any): Value to copy.
+        memo (dict[int, Any] | None): Mapping of already-copied object ids. Defaults to None.
+
+    Returns:
+        Any: Copy of the value which shares no mutable state with the original.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES) or type(value) is FrozenDict:
+        return value
+    if memo is None:
+        memo = {}
+    if (value_id := id(value)) in memo:
+        return memo[value_id]
+    if type(value) is dict:
+        result_dict: dict = {}
+        memo[value_id] = result_dict
+        for key, item in value.items():
+            result_dict[key] = copy_value(item, memo)
+        return result_dict
+    if type(value) is list:
+        result_list: list = []
+        memo[value_id] = result_list
+        result_list.extend(copy_value(item, memo) for item in value)
+        return result_list
+    if type(value) is set:
+        result_set = set(value)
+        memo[value_id] = result_set
+        return result_set
+    if type(value) is tuple:
+        result_tuple = tuple(copy_value(item, memo) for item in value)
+        if all(copied is item for copied, item in zip(result_tuple, value)):
+            # Tuples holding only immutable values (e.g. frozen sequences) are shared as-is
+            result_tuple = value
+        memo[value_id] = result_tuple
+        return result_tuple
+    return copy.deepcopy(value, memo)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing the effectiveness of a `ParseCache`.
+
+    Attributes:
+        hits (int): Number of lookups which were served from the cache.
+        misses (int): Number of lookups which required parsing the file.
+        evictions (int): Number of entries dropped to respect the cache bounds.
+        entries (int): Number of entries currently held.
+        size_bytes (int): Approximate number of bytes currently held.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+# Files modified this recently before being parsed may be modified again within the resolution of
+# their timestamps without their signature changing, so results depending on them are not cached.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class _CacheEntry:
+    signature: FileSignature
+    dependencies: frozenset[Dependency]
+    value: Any
+
+    def is_current(self, signature: FileSignature) -> bool:
+        return self.signature == signature and all(dep.is_current() for dep in self.dependencies)
+
+
+@dataclass
+class ParseCache:
+    """Bounded, thread-safe LRU cache of parsed YAML files.
+
+    Attributes:
+        max_entries (int): Maximum number of entries to hold. Defaults to 1024.
+        max_bytes (int): Maximum approximate number of bytes to hold, measured as the total size of
+            the cached source files. Defaults to 64 MiB.
+        copy_on_read (bool): Whether to hand out copies of the cached values, so that callers may
+            freely mutate their results. Only disable this if every caller treats the results as
+            read-only. Defaults to True.
+
+    Methods:
+        get_or_load: Return the cached value for a file, parsing it on a miss.
+        invalidate: Drop every entry for a given file.
+        clear: Drop every entry and reset the statistics.
+        stats: Return a snapshot of the cache statistics.
+    """
+
+    max_entries: int = 1024
+    max_bytes: int = 64 * 1024 * 1024
+    copy_on_read: bool = True
+    _entries: OrderedDict[Hashable, _CacheEntry] = field(default_factory=OrderedDict, init=False, repr=False)
+    _stats: CacheStats = field(default_factory=CacheStats, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get_or_load(
+        self,
+        path: Path,
+        loader_type: type,
+        load: Callable[[], Any],
+        variant: Hashable = None,
+    ) -> Any:
+        """Return the cached value for a file, calling `load` to parse it on a miss. Dependencies
+        noted while `load` runs are stored alongside the value and checked on every later lookup.
+        The value is not stored if the file, or any file it depends on, was modified too recently
+        for its signature to be trusted.
+
+        Args:
+            path (Path): Path to the file being loaded.
+            loader_type (type): YAML loader type used to parse the file.
+            load (Callable[[], Any]): Function which parses the file when it is not cached.
+            variant (Hashable): Additional key distinguishing different values loaded from the same
+                file, e.g. the anchor being extracted. Defaults to None.
+
+        Returns:
+            Any: Value loaded from the file.
+        """
+        signature = FileSignature.from_path(Path(path).resolve())
+        key = (signature.path, loader_type, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_current(signature):
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+            else:
+                entry = None
+                self._stats.misses += 1
+        if entry is not None:
+            note_dependency(signature, *entry.dependencies)
+            return copy_value(entry.value) if self.copy_on_read else entry.value
+
+        started_ns = time.time_ns()
+        with track_dependencies() as deps:
+            value = load()
+        note_dependency(signature)
+        racy = any(
+            isinstance(dep, FileSignature) and dep.mtime_ns >= started_ns - _RACY_WINDOW_NS
+            for dep in (signature, *deps)
+        )
+        entry = _CacheEntry(signature, frozenset(deps), copy_value(value) if self.copy_on_read else value)
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._stats.size_bytes -= previous.signature.size
+            if racy:
+                return value
+            self._entries[key] = entry
+            self._stats.size_bytes += signature.size
+            self._evict()
+        return value
+
+    def invalidate(self, path: Path) -> None:
+        """Drop every entry (for any loader type or variant) parsed from the given file.
+
+        Args:
+            path (Path): Path to the file.
+        """
+        resolved = Path(path).resolve()
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.signature.path == resolved]:
+                self._stats.size_bytes -= self._entries.pop(key).signature.size
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache statistics.
+
+        Returns:
+            CacheStats: Copy of the current statistics.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+                size_bytes=self._stats.size_bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        # Caller must hold the lock. Always keep the most recent entry, even if it alone exceeds the
+        # byte bound, so that a single oversized file still benefits from caching.
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._stats.size_bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._stats.size_bytes -= evicted.signature.size
+            self._stats.evictions += 1
@@ -23,31 +23,111 @@ around `pathlib.Path` objects that also store optional metadata. This metadata i
 named wildcards in the pattern.
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 import re
-from typing import Any
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Literal, Mapping
+
+from yaml_extras.filesystem import DirEntry, get_filesystem, uses_os_filesystem
+from yaml_extras.governor import check_files_matched, get_import_limits
 
 
-@dataclass
 class PathWithMetadata:
-    """Custom dataclass to store a Path object with optional metadata.
+    """Immutable record of a path matched by a path pattern, with the values captured by the named
+    wildcards in the pattern as optional metadata.
+
+    The captured values are stored as a tuple aligned with the names of the wildcards, which is
+    shared by every match of the same pattern, and the read-only metadata view is only built when it
+    is first accessed. The hash is computed once and cached, so that matches are cheap to use as
+    dict keys or set members, even for patterns which match very many files.
 
     Attributes:
         path (Path): Path object.
-        metadata (Any): Optional metadata. Defaults to None.
+        names (tuple[str, ...]): Names of the named wildcards in the pattern.
+        values (tuple[str, ...]): Values captured by the named wildcards, aligned with `names`.
+        metadata (Mapping[str, str] | None): Read-only view of the values captured by the named
+            wildcards, keyed by name, or None if the pattern has no named wildcards.
 
     Methods:
+        from_values: Build a PathWithMetadata object from the values captured by the named wildcards.
         __hash__: Return the hash of the PathWithMetadata object, which is the hash of the path and
-            string representation of the metadata.
+            the captured values, cached after the first call.
     """
 
+    __slots__ = ("path", "names", "values", "_metadata", "_hash")
+
     path: Path
-    metadata: Any = None
+    names: tuple[str, ...]
+    values: tuple[str, ...]
 
-    def __hash__(self):
-        return hash((self.path, str(self.metadata)))
+    def __init__(self, path: Path, metadata: Mapping[str, str] | None = None):
+        self._set(path, tuple(metadata or ()), tuple((metadata or {}).values()))
+
+    @classmethod
+    def from_values(cls, path: Path, names: tuple[str, ...], values: tuple[str, ...]) -> "PathWithMetadata":
+        """Build a PathWithMetadata object from the values captured by the named wildcards, without
+        building the metadata view.
+
+        Args:
+            path (Path): Path object.
+            names (tuple[str, ...]): Names of the named wildcards in the pattern.
+            values (tuple[str, ...]): Values captured by the named wildcards, aligned with `names`.
+
+        Returns:
+            PathWithMetadata: The PathWithMetadata object.
+        """
+        result = cls.__new__(cls)
+        result._set(path, names, values)
+        return result
+
+    def _set(self, path: Path, names: tuple[str, ...], values: tuple[str, ...]) -> None:
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "names", names)
+        object.__setattr__(self, "values", values)
+        object.__setattr__(self, "_metadata", None)
+        object.__setattr__(self, "_hash", None)
+
+    @property
+    def metadata(self) -> Mapping[str, str] | None:
+        """Read-only view of the values captured by the named wildcards, keyed by name, or None if
+        the pattern has no named wildcards. Built on first access."""
+        if not self.names:
+            return None
+        if self._metadata is None:
+            object.__setattr__(self, "_metadata", MappingProxyType(dict(zip(self.names, self.values))))
+        return self._metadata
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Cannot assign to field {name!r} of an immutable PathWithMetadata")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PathWithMetadata):
+            return NotImplemented
+        if self.path != other.path:
+            return False
+        if self.names == other.names:
+            return self.values == other.values
+        return self.metadata == other.metadata
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((self.path, frozenset(zip(self.names, self.values)))))
+        return self._hash  # type: ignore
+
+    def __repr__(self) -> str:
+        metadata = dict(self.metadata) if self.metadata is not None else None
+        return f"PathWithMetadata(path={self.path!r}, metadata={metadata!r})"
+
+    def __reduce__(self) -> tuple:
+        return (PathWithMetadata.from_values, (self.path, self.names, self.values))
 
 
 NAMED_WILDCARD_PATTERN: re.Pattern = re.compile(r"\{(?P<name>\w+):(?P<wildcard>\*\*?)\}")
@@ -57,6 +137,505 @@ REGEX_COUNTERPART: dict[str, str] = {
 }
 
 
+def _list_dir(path: Path) -> list[DirEntry]:
+    """List a directory through the current filesystem (see the `filesystem` module), e.g. with a
+    single `os.scandir` call, sorted by name so that the order of the matches is deterministic."""
+    return get_filesystem().list_dir(path)
+
+
+@dataclass(frozen=True)
+class _PatternSegment:
+    kind: Literal["literal", "wildcard", "recursive"]
+    text: str
+    regex: re.Pattern | None = None
+    name: str | None = None
+
+
+def _translate_wildcard_segment(segment: str) -> re.Pattern:
+    """Translate a single path segment containing wildcards into a regular expression matching a
+    single file name, with a named group for each named wildcard."""
+    parts: list[str] = []
+    position = 0
+    for match in NAMED_WILDCARD_PATTERN.finditer(segment):
+        parts.append(_translate_glob_text(segment[position : match.start()]))
+        # Within a segment, "**" cannot cross directories, so it behaves like "*" (as in pathlib)
+        parts.append(f"(?P<{match.group('name')}>[^/]*)")
+        position = match.end()
+    parts.append(_translate_glob_text(segment[position:]))
+    return re.compile("".join(parts))
+
+
+def _translate_glob_text(text: str) -> str:
+    result: list[str] = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "*":
+            while i + 1 < len(text) and text[i + 1] == "*":
+                i += 1
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[" and (end := text.find("]", i + 2)) != -1:
+            content = text[i + 1 : end]
+            if content.startswith("!"):
+                content = "^" + content[1:]
+            result.append("[" + content.replace("\\", "\\\\") + "]")
+            i = end
+        else:
+            result.append(re.escape(char))
+        i += 1
+    return "".join(result)
+
+
+def _has_wildcard(segment: str) -> bool:
+    return any(char in segment for char in "*?[")
+
+
+class _CompiledPattern:
+    """Compiled form of a path pattern, which matches paths by walking the directory tree once with
+    `os.scandir`. Literal segments are resolved directly without listing their parent directory,
+    wildcard segments are matched against each directory entry with a precompiled regular
+    expression, and named wildcards are captured during the same walk.
+
+    Matching follows the semantics of `pathlib.Path.glob`: "*" matches within a single path segment,
+    a "**" segment matches zero or more directories (without following symbolic links), and hidden
+    files are not treated specially.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.is_absolute = pattern.startswith("/")
+        self.segments: list[_PatternSegment] = []
+        names: list[str] = []
+        for segment in pattern.split("/"):
+            if segment in ("", "."):
+                continue
+            if full_match := NAMED_WILDCARD_PATTERN.fullmatch(segment):
+                if full_match.group("wildcard") == "**":
+                    self.segments.append(_PatternSegment("recursive", segment, name=full_match.group("name")))
+                else:
+                    self.segments.append(_PatternSegment("wildcard", segment, _translate_wildcard_segment(segment)))
+                names.append(full_match.group("name"))
+            elif segment == "**":
+                self.segments.append(_PatternSegment("recursive", segment))
+            elif NAMED_WILDCARD_PATTERN.search(segment) or _has_wildcard(segment):
+                self.segments.append(_PatternSegment("wildcard", segment, _translate_wildcard_segment(segment)))
+                names.extend(match.group("name") for match in NAMED_WILDCARD_PATTERN.finditer(segment))
+            else:
+                self.segments.append(_PatternSegment("literal", segment))
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate named wildcards in path pattern: {pattern}")
+        self.names: tuple[str, ...] = tuple(names)
+        # Leading literal segments are joined onto the root directly, pruning the walk to the
+        # pattern's literal prefix.
+        prefix_length = 0
+        while prefix_length < len(self.segments) - 1 and self.segments[prefix_length].kind == "literal":
+            prefix_length += 1
+        self.prefix = Path(*(segment.text for segment in self.segments[:prefix_length]))
+        self.segments = self.segments[prefix_length:]
+        self._may_repeat = sum(segment.kind == "recursive" for segment in self.segments) > 1
+
+    def walk(
+        self,
+        root: Path,
+        list_dir: Callable[[Path], list[DirEntry]] | None = None,
+        observed_dirs: dict[Path, int | None] | None = None,
+    ) -> Iterator[tuple[Path, dict[str, str]]]:
+        """Walk the directory tree under `root`, lazily yielding every path which matches the
+        pattern along with the values captured by its named wildcards.
+
+        Args:
+            root (Path): Directory to match the pattern relative to.
+            list_dir (Callable[[Path], list[DirEntry]] | None): Function listing the entries of a
+                directory. Defaults to None, which lists directories through the active directory
+                snapshot (see `directory_snapshot`), or else with a sorted `os.scandir`.
+            observed_dirs (dict[Path, int | None] | None): If given, filled with the modification
+                time (or None, if missing) of every directory whose contents the results depend on.
+                Defaults to None.
+
+        Yields:
+            tuple[Path, dict[str, str]]: Matching path and captured named wildcards.
+        """
+        if not self.segments:
+            return
+        if list_dir is None and (snapshot := _DIRECTORY_SNAPSHOT.get()) is not None:
+            state = _WalkState(snapshot.list_dir, observed_dirs, snapshot.mtime_ns)
+        else:
+            state = _WalkState(list_dir or _list_dir, observed_dirs)
+        base = Path("/") if self.is_absolute else root
+        state.observe(base)
+        for part in self.prefix.parts:
+            base = base / part
+            state.observe(base)
+        if not get_filesystem().is_dir(base):
+            return
+        seen: set[Path] = set()
+        for path, captures in self._match(base, 0, {}, state):
+            if self._may_repeat:
+                if path in seen:
+                    continue
+                seen.add(path)
+            yield path, captures
+
+    def walk_results(
+        self,
+        root: Path,
+        list_dir: Callable[[Path], list[DirEntry]] | None = None,
+        observed_dirs: dict[Path, int | None] | None = None,
+    ) -> Iterator["PathWithMetadata"]:
+        """Walk the directory tree under `root` (see `walk`), lazily yielding every match as a
+        PathWithMetadata object whose captured values are aligned with the names of the pattern.
+
+        Yields:
+            PathWithMetadata: PathWithMetadata objects matching the pattern.
+        """
+        names = self.names
+        for path, captures in self.walk(root, list_dir, observed_dirs):
+            yield PathWithMetadata.from_values(path, names, tuple(captures[name] for name in names))
+
+    def _match(
+        self,
+        directory: Path,
+        index: int,
+        captures: dict[str, str],
+        state: "_WalkState",
+    ) -> Iterator[tuple[Path, dict[str, str]]]:
+        segment = self.segments[index]
+        is_last = index == len(self.segments) - 1
+        if segment.kind == "literal":
+            path = directory / segment.text
+            state.observe(directory)
+            if is_last:
+                if get_filesystem().exists(path):
+                    yield path, captures
+            elif get_filesystem().is_dir(path):
+                yield from self._match(path, index + 1, captures, state)
+        elif segment.kind == "wildcard":
+            assert segment.regex is not None
+            for entry in state.list_dir(directory):
+                if is_last or entry.is_dir:
+                    if match := segment.regex.fullmatch(entry.name):
+                        matched = captures | match.groupdict() if match.groupdict() else captures
+                        if is_last:
+                            yield directory / entry.name, matched
+                        else:
+                            yield from self._match(directory / entry.name, index + 1, matched, state)
+        else:
+            yield from self._match_recursive(directory, (), index, is_last, captures, state)
+
+    def _match_recursive(
+        self,
+        directory: Path,
+        consumed: tuple[str, ...],
+        index: int,
+        is_last: bool,
+        captures: dict[str, str],
+        state: "_WalkState",
+    ) -> Iterator[tuple[Path, dict[str, str]]]:
+        segment = self.segments[index]
+        matched = captures | {segment.name: "/".join(consumed)} if segment.name else captures
+        # A "**" segment first matches zero directories, then each subdirectory in turn
+        if is_last:
+            yield directory, matched
+        else:
+            yield from self._match(directory, index + 1, matched, state)
+        for entry in state.list_dir(directory):
+            if entry.is_dir and not entry.is_symlink:
+                yield from self._match_recursive(
+                    directory / entry.name, consumed + (entry.name,), index, is_last, captures, state
+                )
+
+
+class _WalkState:
+    """State of a single walk: the directory listings made so far, so that each directory is listed
+    at most once, and the directories whose contents the results depend on."""
+
+    def __init__(
+        self,
+        list_dir: Callable[[Path], list[DirEntry]],
+        observed_dirs: dict[Path, int | None] | None,
+        dir_mtime_ns: Callable[[Path], int | None] | None = None,
+    ):
+        self._list_dir = list_dir
+        self._listings: dict[Path, list[DirEntry]] = {}
+        self._observed_dirs = observed_dirs
+        self._dir_mtime_ns = dir_mtime_ns or _dir_mtime_ns
+
+    def observe(self, directory: Path) -> None:
+        if self._observed_dirs is not None and directory not in self._observed_dirs:
+            self._observed_dirs[directory] = self._dir_mtime_ns(directory)
+
+    def list_dir(self, directory: Path) -> list[DirEntry]:
+        if (entries := self._listings.get(directory)) is None:
+            # Observe before listing, so that a change racing with the listing invalidates it
+            self.observe(directory)
+            entries = self._listings[directory] = self._list_dir(directory)
+        return entries
+
+
+def _dir_mtime_ns(directory: Path) -> int | None:
+    return stat.mtime_ns if (stat := get_filesystem().stat(directory)) is not None else None
+
+
+class DirectorySnapshot:
+    """Load-scoped snapshot of directory listings, shared by every path pattern matched while a
+    single document is loaded (see `directory_snapshot`), so that each directory is listed with
+    `os.scandir` at most once per load, however many patterns cover it.
+
+    The modification time of each directory is recorded before it is listed, and reported in place
+    of its current modification time to the glob cache, so that a directory modified after it was
+    listed invalidates every cached result derived from the snapshot.
+
+    Attributes:
+        listings (int): Number of directories listed so far.
+
+    Methods:
+        list_dir: Return the entries of a directory, listing it on first use.
+        mtime_ns: Return the modification time of a directory, as first observed.
+    """
+
+    def __init__(self):
+        self.listings = 0
+        self._entries: dict[Path, list[DirEntry]] = {}
+        self._mtimes: dict[Path, int | None] = {}
+        self._lock = threading.Lock()
+
+    def list_dir(self, directory: Path) -> list[DirEntry]:
+        """Return the entries of a directory, sorted by name, listing it on first use. Missing or
+        unreadable directories are treated as empty.
+
+        Args:
+            directory (Path): Directory to list.
+
+        Returns:
+            list[DirEntry]: Entries of the directory.
+        """
+        with self._lock:
+            entries = self._entries.get(directory)
+        if entries is None:
+            self.mtime_ns(directory)
+            listed = _list_dir(directory)
+            with self._lock:
+                if (entries := self._entries.get(directory)) is None:
+                    entries = self._entries[directory] = listed
+                    self.listings += 1
+        return entries
+
+    def mtime_ns(self, directory: Path) -> int | None:
+        """Return the modification time of a directory (or None, if missing) as first observed
+        during the load.
+
+        Args:
+            directory (Path): Directory to stat.
+
+        Returns:
+            int | None: Modification time in nanoseconds.
+        """
+        with self._lock:
+            if directory in self._mtimes:
+                return self._mtimes[directory]
+        mtime_ns = _dir_mtime_ns(directory)
+        with self._lock:
+            return self._mtimes.setdefault(directory, mtime_ns)
+
+
+_DIRECTORY_SNAPSHOT: ContextVar[DirectorySnapshot | None] = ContextVar("_DIRECTORY_SNAPSHOT", default=None)
+
+
+def get_directory_snapshot() -> DirectorySnapshot | None:
+    """Return the directory snapshot of the document currently being loaded, if any.
+
+    Returns:
+        DirectorySnapshot | None: Current directory snapshot, or None outside of a load.
+    """
+    return _DIRECTORY_SNAPSHOT.get()
+
+
+@contextmanager
+def directory_snapshot() -> Iterator[DirectorySnapshot]:
+    """Context manager which opens a directory snapshot, unless one is already active, in which case
+    the active snapshot is reused. Every path pattern matched within the context lists directories
+    through the snapshot.
+
+    Yields:
+        DirectorySnapshot: The active directory snapshot.
+    """
+    if (snapshot := _DIRECTORY_SNAPSHOT.get()) is not None:
+        yield snapshot
+        return
+    snapshot = DirectorySnapshot()
+    token = _DIRECTORY_SNAPSHOT.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _DIRECTORY_SNAPSHOT.reset(token)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> _CompiledPattern:
+    return _CompiledPattern(pattern)
+
+
+@dataclass
+class GlobCacheStats:
+    """Counters describing the effectiveness of a `GlobCache`.
+
+    Attributes:
+        hits (int): Number of lookups which were served from the cache.
+        misses (int): Number of lookups which required walking the directory tree.
+        stale (int): Number of entries found to be out of date, because a directory they depend on
+            was modified.
+        evictions (int): Number of entries dropped to respect the cache bound.
+        entries (int): Number of entries currently held.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+
+@dataclass
+class _GlobCacheEntry:
+    results: tuple["PathWithMetadata", ...]
+    observed_dirs: dict[Path, int | None]
+    created: float
+    racy: bool
+
+    def is_current(self, ttl: float | None) -> bool:
+        if ttl is not None and time.monotonic() - self.created < ttl:
+            return True
+        if self.racy:
+            return False
+        return all(_dir_mtime_ns(directory) == mtime_ns for directory, mtime_ns in self.observed_dirs.items())
+
+
+# Directories modified this recently before a walk may be modified again within the resolution of
+# their timestamps without the modification time changing, so results depending on them are not
+# trusted on a later lookup.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class GlobCache:
+    """Bounded, thread-safe LRU cache of the results of path patterns.
+
+    Entries are keyed by the pattern and the directory it is matched relative to. Each entry
+    remembers the modification time of every directory whose contents its results depend on, and is
+    discarded on lookup if any of them has changed, so that added or removed files are picked up.
+
+    Attributes:
+        max_entries (int): Maximum number of entries to hold. Defaults to 256.
+        ttl (float | None): Number of seconds during which an entry is trusted without checking the
+            modification times of its directories. Defaults to None, which checks them on every
+            lookup.
+
+    Methods:
+        results: Return the results of a path pattern, walking the directory tree on a miss.
+        clear: Drop every entry and reset the statistics.
+        stats: Return a snapshot of the cache statistics.
+    """
+
+    max_entries: int = 256
+    ttl: float | None = None
+    _entries: OrderedDict[tuple[str, Path], _GlobCacheEntry] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _stats: GlobCacheStats = field(default_factory=GlobCacheStats, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def results(self, pattern: str, relative_to: Path, max_results: int | None = None) -> list["PathWithMetadata"]:
+        """Return the results of a path pattern, walking the directory tree on a miss.
+
+        Args:
+            pattern (str): Path pattern to match.
+            relative_to (Path): Directory to match the pattern relative to.
+            max_results (int | None): If given, a walk is stopped as soon as it finds more results
+                than this, in which case the truncated results are returned without being cached.
+                Defaults to None.
+
+        Returns:
+            list[PathWithMetadata]: List of PathWithMetadata objects matching the pattern.
+        """
+        key = (pattern, relative_to)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_current(self.ttl):
+                del self._entries[key]
+                self._stats.stale += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return list(entry.results)
+            self._stats.misses += 1
+
+        started_ns = time.time_ns()
+        observed_dirs: dict[Path, int | None] = {}
+        walk = _compile_pattern(pattern).walk_results(relative_to, observed_dirs=observed_dirs)
+        results = tuple(walk if max_results is None else islice(walk, max_results + 1))
+        if max_results is not None and len(results) > max_results:
+            return list(results)
+        racy = any(
+            mtime_ns is not None and mtime_ns >= started_ns - _RACY_WINDOW_NS for mtime_ns in observed_dirs.values()
+        )
+        with self._lock:
+            self._entries[key] = _GlobCacheEntry(results, observed_dirs, time.monotonic(), racy)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+        return list(results)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = GlobCacheStats()
+
+    def stats(self) -> GlobCacheStats:
+        """Return a snapshot of the cache statistics.
+
+        Returns:
+            GlobCacheStats: Copy of the current statistics.
+        """
+        with self._lock:
+            return GlobCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                stale=self._stats.stale,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+GLOB_CACHE: GlobCache | None = GlobCache()
+
+
+def get_glob_cache() -> GlobCache | None:
+    """Read a global variable to get the cache of path pattern results.
+
+    Returns:
+        GlobCache | None: Current glob cache, or None if caching is disabled.
+    """
+    global GLOB_CACHE
+    return GLOB_CACHE
+
+
+def set_glob_cache(cache: GlobCache | None) -> None:
+    """Set a global variable to change the cache of path pattern results.
+
+    Args:
+        cache (GlobCache | None): New glob cache, or None to disable caching.
+    """
+    global GLOB_CACHE
+    GLOB_CACHE = cache
+
+
 @dataclass
 class PathPattern:
     """Custom implementation of unix-like glob search on pathlib.Path objects. Returned paths may
@@ -77,12 +656,14 @@ class PathPattern:
 
     Methods:
         __hash__: Return the hash of the PathPattern object, which is the hash of the string glob
-            pattern.
+            pattern and the directory it is relative to.
         names: Return all named wildcards in the pattern.
         as_regex: Convert a pattern to a regular expression which should match all paths that match
             the UNIX glob pattern.
-        glob_results: Return all paths that match the pattern using standard pathlib.Path.glob()
-            method, returning simple Paths without metadata.
+        glob_results: Return all paths that match the pattern, returning simple Paths without
+            metadata.
+        iter_results: Lazily yield all paths that match the pattern, including metadata, without
+            caching them.
         results: Return all paths that match the pattern, including the metadata parsed from the
             named wildcards in the pattern.
     """
@@ -91,7 +672,7 @@ class PathPattern:
     relative_to: Path | None = None
 
     def __hash__(self):
-        return hash(self.pattern)
+        return hash((self.pattern, self.relative_to))
 
     @property
     def names(self) -> list[str]:
@@ -147,28 +728,62 @@ class PathPattern:
         re_pattern = f"{re_pattern}$"
         return re.compile(re_pattern)
 
-    @lru_cache
     def glob_results(self) -> list[Path]:
-        """Return all paths that match the pattern using standard pathlib.Path.glob() method,
-        returning simple Paths without metadata.
+        """Return all paths that match the pattern, returning simple Paths without metadata.
 
         Returns:
             list[Path]: List of pathlib.Path objects matching the pattern.
         """
-        global NAMED_WILDCARD_PATTERN
-        pattern_without_names = re.sub(NAMED_WILDCARD_PATTERN, r"\2", self.pattern)
-        relative_to = self.relative_to or Path.cwd()
-        return list(relative_to.glob(pattern_without_names))
+        return [path_w_metadata.path for path_w_metadata in self.results()]
+
+    def iter_results(self) -> Iterator[PathWithMetadata]:
+        """Lazily yield all paths that match the pattern, including metadata. The directory tree is
+        only walked as far as the iteration proceeds, and nothing is cached, so this is suited to
+        patterns which match very many files that are only visited once.
+
+        The pattern is compiled once into a matcher which walks the directory tree a single time
+        with `os.scandir`, pruning it to the pattern's literal prefix and capturing the named
+        wildcards along the way. Within each directory, matches are yielded in order of name.
+
+        Yields:
+            PathWithMetadata: PathWithMetadata objects matching the pattern.
+        """
+        walk = _compile_pattern(self.pattern).walk_results(self.relative_to or Path.cwd())
+        yield from _limit_results(self.pattern, walk)
 
-    @lru_cache
     def results(self) -> list[PathWithMetadata]:
-        """Return all paths that match the pattern, including metadata.
+        """Return all paths that match the pattern, including metadata. Results are served from the
+        glob cache (see `set_glob_cache`) for as long as the directories they were found in are left
+        unmodified.
 
         Returns:
             list[PathWithMetadata]: List of PathWithMetadata objects matching the pattern.
         """
-        paths_to_metadata: dict[Path, Any] = {path: None for path in self.glob_results()}
-        for path in paths_to_metadata.keys():
-            if match := PathPattern.as_regex(self.pattern).search(str(path)):
-                paths_to_metadata[path] = match.groupdict() or None
-        return [PathWithMetadata(path, meta) for path, meta in paths_to_metadata.items()]
+        cache = get_glob_cache()
+        if cache is None or not uses_os_filesystem():
+            return list(self.iter_results())
+        if (limits := get_import_limits()) is None:
+            return cache.results(self.pattern, self.relative_to or Path.cwd())
+        max_results = limits.max_files_per_pattern if not limits.warn_only else None
+        results = cache.results(self.pattern, self.relative_to or Path.cwd(), max_results)
+        check_files_matched(self.pattern, len(results))
+        return results
+
+
+def _limit_results(pattern: str, results: Iterator[PathWithMetadata]) -> Iterator[PathWithMetadata]:
+    """Yield the results of a path pattern, checking their number against the limits on the
+    resources used by a load (see the `governor` module), so that a walk which matches too many
+    files is stopped as soon as it exceeds the limit."""
+    if (limits := get_import_limits()) is None:
+        yield from results
+        return
+    maximum = limits.max_files_per_pattern
+    count = 0
+    for result in results:
+        count += 1
+        if maximum is not None and count > maximum:
+            check_files_matched(pattern, count)
+            # Only reached in "warn only" mode, which warns once and carries on
+            maximum = None
+        yield result
+    check_files_matched(pattern, count)
@@ -0,0 +1,443 @@
+"""
+This module implements the filesystem backends through which the import tags list directories, stat
+paths and read files. By default, every import goes to the operating system's filesystem, but a
+different backend can be set process-wide with `set_filesystem`, or for the current context only
+with `use_filesystem`:
+
+- `OSFileSystem`: The operating system's filesystem (the default).
+- `MemoryFileSystem`: An in-memory tree of files, e.g. for tests or for documents generated on the
+  fly.
+- `ArchiveFileSystem`: The contents of a zip or tar archive, which is opened once and listed from
+  its central directory (or member list), so that a whole tree of configuration files can be
+  shipped and loaded as a single file.
+
+In-memory and archive trees are mounted at a root directory, which defaults to the current working
+directory when the backend is created, so that relative imports resolve into the tree as they would
+on disk. Paths outside of the root do not exist in the tree.
+
+The parse cache, the glob cache, anchor indexes, incremental reloads and bundles all track files
+through their modification times on disk, so they are only used with the operating system's
+filesystem.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import os
+from pathlib import Path, PurePosixPath
+import stat as stat_module
+import tarfile
+import threading
+import time
+from typing import Iterator, Mapping
+import zipfile
+
+
+@dataclass(frozen=True)
+class DirEntry:
+    """Entry of a directory listing.
+
+    Attributes:
+        name (str): Name of the entry within its directory.
+        is_dir (bool): Whether the entry is a directory.
+        is_symlink (bool): Whether the entry is a symbolic link.
+    """
+
+    name: str
+    is_dir: bool
+    is_symlink: bool
+
+
+@dataclass(frozen=True)
+class FileStat:
+    """Status of a path.
+
+    Attributes:
+        size (int): Size of the file in bytes, or 0 for a directory.
+        mtime_ns (int): Modification time in nanoseconds.
+        is_dir (bool): Whether the path is a directory.
+    """
+
+    size: int
+    mtime_ns: int
+    is_dir: bool
+
+
+class FileSystem:
+    """Base class of the filesystem backends through which imports list directories, stat paths and
+    read files.
+
+    Methods:
+        list_dir: Return the entries of a directory, sorted by name.
+        stat: Return the status of a path, or None if it does not exist.
+        read_bytes: Return the contents of a file.
+        is_dir: Return whether a path is an existing directory.
+        exists: Return whether a path exists.
+    """
+
+    def list_dir(self, path: Path) -> list[DirEntry]:
+        """Return the entries of a directory, sorted by name so that the order of the matches of a
+        path pattern is deterministic. Missing or unreadable directories are treated as empty.
+
+        Args:
+            path (Path): Directory to list.
+
+        Returns:
+            list[DirEntry]: Entries of the directory.
+        """
+        raise NotImplementedError
+
+    def stat(self, path: Path) -> FileStat | None:
+        """Return the status of a path.
+
+        Args:
+            path (Path): Path to stat.
+
+        Returns:
+            FileStat | None: Status of the path, or None if it does not exist.
+        """
+        raise NotImplementedError
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Return the contents of a file.
+
+        Args:
+            path (Path): Path to the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IsADirectoryError: If the path is a directory.
+
+        Returns:
+            bytes: Contents of the file.
+        """
+        raise NotImplementedError
+
+    def is_dir(self, path: Path) -> bool:
+        """Return whether a path is an existing directory.
+
+        Args:
+            path (Path): Path to check.
+
+        Returns:
+            bool: True if the path is a directory.
+        """
+        return (stat := self.stat(path)) is not None and stat.is_dir
+
+    def exists(self, path: Path) -> bool:
+        """Return whether a path exists.
+
+        Args:
+            path (Path): Path to check.
+
+        Returns:
+            bool: True if the path exists.
+        """
+        return self.stat(path) is not None
+
+
+class OSFileSystem(FileSystem):
+    """The operating system's filesystem, which is the default backend."""
+
+    def list_dir(self, path: Path) -> list[DirEntry]:
+        entries: list[DirEntry] = []
+        try:
+            with os.scandir(path) as scandir_it:
+                for entry in scandir_it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    entries.append(DirEntry(entry.name, is_dir, entry.is_symlink()))
+        except OSError:
+            return []
+        entries.sort(key=lambda entry: entry.name)
+        return entries
+
+    def stat(self, path: Path) -> FileStat | None:
+        try:
+            result = os.stat(path)
+        except OSError:
+            return None
+        is_dir = stat_module.S_ISDIR(result.st_mode)
+        return FileStat(0 if is_dir else result.st_size, result.st_mtime_ns, is_dir)
+
+    def read_bytes(self, path: Path) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def is_dir(self, path: Path) -> bool:
+        return os.path.isdir(path)
+
+    def exists(self, path: Path) -> bool:
+        return os.path.exists(path)
+
+
+class _TreeFileSystem(FileSystem):
+    """Base class of the backends which hold a tree of files mounted at a root directory. Files are
+    keyed by their POSIX path relative to the root, and every directory is keyed by its path, with
+    the root itself keyed by the empty string."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(os.path.abspath(root if root is not None else Path.cwd()))
+        self._files: dict[str, tuple[int, int]] = {}
+        self._dirs: dict[str, dict[str, bool]] = {"": {}}
+        self._dir_mtimes: dict[str, int] = {"": time.time_ns()}
+        self._lock = threading.RLock()
+
+    def _key(self, path: Path) -> str | None:
+        relative = os.path.relpath(os.path.abspath(path), self.root)
+        if relative == ".":
+            return ""
+        if relative == ".." or relative.startswith(".." + os.sep):
+            return None
+        return PurePosixPath(*Path(relative).parts).as_posix()
+
+    def _add(self, key: str, size: int, mtime_ns: int) -> None:
+        parts = key.split("/")
+        for depth in range(len(parts)):
+            parent, name = "/".join(parts[:depth]), parts[depth]
+            is_dir = depth < len(parts) - 1
+            if name not in self._dirs[parent]:
+                self._dir_mtimes[parent] = mtime_ns
+            self._dirs[parent][name] = is_dir
+            if is_dir:
+                child = "/".join(parts[: depth + 1])
+                self._dirs.setdefault(child, {})
+                self._dir_mtimes.setdefault(child, mtime_ns)
+        self._files[key] = (size, mtime_ns)
+
+    def list_dir(self, path: Path) -> list[DirEntry]:
+        with self._lock:
+            if (key := self._key(path)) is None or (names := self._dirs.get(key)) is None:
+                return []
+            return [DirEntry(name, is_dir, False) for name, is_dir in sorted(names.items())]
+
+    def stat(self, path: Path) -> FileStat | None:
+        with self._lock:
+            if (key := self._key(path)) is None:
+                return None
+            if key in self._dirs:
+                return FileStat(0, self._dir_mtimes[key], True)
+            if (file := self._files.get(key)) is not None:
+                return FileStat(file[0], file[1], False)
+            return None
+
+    def read_bytes(self, path: Path) -> bytes:
+        with self._lock:
+            key = self._key(path)
+            if key is not None and key in self._dirs:
+                raise IsADirectoryError(f"Is a directory: '{path}'")
+            if key is None or key not in self._files:
+                raise FileNotFoundError(f"No such file or directory: '{path}'")
+            return self._read(key)
+
+    def _read(self, key: str) -> bytes:
+        raise NotImplementedError
+
+
+class MemoryFileSystem(_TreeFileSystem):
+    """In-memory tree of files, mounted at a root directory. E.g.,
+
+    ```python
+    fs = MemoryFileSystem({"config.yml": "db: !import db.yml\\n", "db.yml": "host: localhost\\n"})
+    with use_filesystem(fs):
+        data = yaml.load("!import config.yml", ExtrasLoader)
+    ```
+
+    Attributes:
+        root (Path): Directory at which the tree is mounted.
+
+    Methods:
+        write: Add or replace a file in the tree.
+    """
+
+    def __init__(self, files: Mapping[str, str | bytes] | None = None, root: Path | None = None):
+        """Create a tree from a mapping of paths, relative to the root, to file contents.
+
+        Args:
+            files (Mapping[str, str | bytes] | None): Contents of each file, keyed by its path
+                relative to the root. Text is encoded as UTF-8. Defaults to None.
+            root (Path | None): Directory at which the tree is mounted. Defaults to None, which
+                mounts it at the current working directory.
+        """
+        super().__init__(root)
+        self._contents: dict[str, bytes] = {}
+        for path, contents in (files or {}).items():
+            self.write(self.root / path, contents)
+
+    def write(self, path: Path, contents: str | bytes) -> None:
+        """Add or replace a file in the tree, creating its parent directories.
+
+        Args:
+            path (Path): Path to the file, which must be within the root.
+            contents (str | bytes): Contents of the file. Text is encoded as UTF-8.
+
+        Raises:
+            ValueError: If the path is outside of the root, or is a directory.
+        """
+        data = contents.encode("utf-8") if isinstance(contents, str) else bytes(contents)
+        with self._lock:
+            key = self._key(path)
+            if not key or key in self._dirs:
+                raise ValueError(f"Cannot write a file at {path} in a tree mounted at {self.root}")
+            self._add(key, len(data), time.time_ns())
+            self._contents[key] = data
+
+    def _read(self, key: str) -> bytes:
+        return self._contents[key]
+
+    def __getstate__(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if key != "_lock"}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+
+class ArchiveFileSystem(_TreeFileSystem):
+    """Read-only tree of the files within a zip or tar archive (optionally compressed), mounted at a
+    root directory. The archive is opened once, and its tree is built from its central directory
+    (or member list) without reading any of the files; each file is then read from the open archive
+    on demand. E.g.,
+
+    ```python
+    with ArchiveFileSystem("configs.zip") as fs, use_filesystem(fs):
+        data = yaml.load("!import-all services/*.yml", ExtrasLoader)
+    ```
+
+    Attributes:
+        archive_path (Path): Path to the archive.
+        root (Path): Directory at which the tree is mounted.
+
+    Methods:
+        close: Close the archive.
+    """
+
+    def __init__(self, archive_path: Path | str, root: Path | None = None):
+        """Open an archive and build its tree.
+
+        Args:
+            archive_path (Path | str): Path to a zip or tar archive.
+            root (Path | None): Directory at which the tree is mounted. Defaults to None, which
+                mounts it at the current working directory.
+
+        Raises:
+            ValueError: If the file is neither a zip nor a tar archive.
+        """
+        super().__init__(root)
+        self.archive_path = Path(archive_path)
+        self._open()
+
+    def _open(self) -> None:
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._members: dict[str, zipfile.ZipInfo | tarfile.TarInfo] = {}
+        if zipfile.is_zipfile(self.archive_path):
+            self._zip = zipfile.ZipFile(self.archive_path)
+            for info in self._zip.infolist():
+                if not info.is_dir():
+                    mtime_ns = int(time.mktime(info.date_time + (0, 0, -1))) * 1_000_000_000
+                    self._add_member(info.filename, info, info.file_size, mtime_ns)
+        elif tarfile.is_tarfile(self.archive_path):
+            self._tar = tarfile.open(self.archive_path)
+            for member in self._tar.getmembers():
+                if member.isfile():
+                    self._add_member(member.name, member, member.size, int(member.mtime) * 1_000_000_000)
+        else:
+            raise ValueError(f"Unsupported archive format: {self.archive_path}")
+
+    def _add_member(self, name: str, member: zipfile.ZipInfo | tarfile.TarInfo, size: int, mtime_ns: int) -> None:
+        key = PurePosixPath(name.lstrip("/")).as_posix()
+        if key in (".", "") or ".." in key.split("/"):
+            return
+        self._add(key, size, mtime_ns)
+        self._members[key] = member
+
+    def _read(self, key: str) -> bytes:
+        member = self._members[key]
+        if self._zip is not None:
+            return self._zip.read(member)  # type: ignore
+        if self._tar is not None and (f := self._tar.extractfile(member)) is not None:  # type: ignore
+            with f:
+                return f.read()
+        raise ValueError(f"Archive {self.archive_path} is closed")
+
+    def close(self) -> None:
+        """Close the archive. Files can no longer be read once it is closed."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+            if self._tar is not None:
+                self._tar.close()
+            self._zip = self._tar = None
+
+    def __enter__(self) -> "ArchiveFileSystem":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        return {"archive_path": self.archive_path, "root": self.root}
+
+    def __setstate__(self, state: dict) -> None:
+        # The archive is opened again, e.g. within a worker process
+        self.__init__(state["archive_path"], state["root"])  # type: ignore
+
+
+FILESYSTEM: FileSystem = OSFileSystem()
+
+# Filesystem for the current context, overriding the process-wide default set by `set_filesystem`.
+_CONTEXT_FILESYSTEM: ContextVar[FileSystem | None] = ContextVar("_CONTEXT_FILESYSTEM", default=None)
+
+
+def get_filesystem() -> FileSystem:
+    """Read the filesystem through which imports are read: the one set for the current context with
+    `use_filesystem`, if any, or else the process-wide default set with `set_filesystem`.
+
+    Returns:
+        FileSystem: Current filesystem backend.
+    """
+    global FILESYSTEM
+    if (filesystem := _CONTEXT_FILESYSTEM.get()) is not None:
+        return filesystem
+    return FILESYSTEM
+
+
+def set_filesystem(filesystem: FileSystem | None) -> None:
+    """Set a global variable to change the filesystem through which imports are read.
+
+    Args:
+        filesystem (FileSystem | None): New filesystem backend, or None to restore the operating
+            system's filesystem (the default).
+    """
+    global FILESYSTEM
+    FILESYSTEM = filesystem if filesystem is not None else OSFileSystem()
+
+
+@contextmanager
+def use_filesystem(filesystem: FileSystem) -> Iterator[FileSystem]:
+    """Context manager which sets the filesystem through which imports are read in the current
+    context only, i.e. for the current thread or asyncio task.
+
+    Args:
+        filesystem (FileSystem): Filesystem backend.
+
+    Yields:
+        FileSystem: The filesystem backend.
+    """
+    token = _CONTEXT_FILESYSTEM.set(filesystem)
+    try:
+        yield filesystem
+    finally:
+        _CONTEXT_FILESYSTEM.reset(token)
+
+
+def uses_os_filesystem() -> bool:
+    """Return whether imports are currently read from the operating system's filesystem.
+
+    Returns:
+        bool: True if the current filesystem is an `OSFileSystem`.
+    """
+    return isinstance(get_filesystem(), OSFileSystem)
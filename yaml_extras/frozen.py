@@ -0,0 +1,185 @@
+"""
+This module implements the immutable containers used by shared imports (see
+`yaml_import.set_shared_imports`). When shared imports are enabled, the contents of each imported
+file are frozen: mappings become `FrozenDict` instances, sequences become tuples and sets become
+frozensets. Frozen values can be handed out to every import of the same file without being copied,
+since no import can mutate them.
+
+Frozen mappings are also interned process-wide by their content, so identical content imported from
+different files (or repeated within the same file) resolves to a single shared structure, and memory
+use scales with the amount of unique content rather than with the number of imports. Interned
+mappings are only held weakly, and are released once nothing refers to them.
+
+Interning distinguishes values which compare equal but differ in type, such as `1`, `1.0` and
+`True`, as well as mappings which hold the same items in a different order.
+
+Lazy imports (see `yaml_import.set_lazy_imports`) nested within a frozen file are resolved when the
+file is frozen, since a frozen value must not change once it is shared. Only the outermost imports
+of a document remain lazy when both options are enabled.
+"""
+
+import datetime
+import threading
+from typing import Any, Hashable, Iterator, Mapping
+import weakref
+
+from yaml_extras.lazy import LazyImport
+
+_SCALAR_TYPES = (str, bytes, int, float, bool, type(None), datetime.date, datetime.datetime)
+
+
+class FrozenDict(Mapping):
+    """Immutable, hashable mapping which preserves insertion order. Compares equal to any mapping
+    with the same items, including a plain `dict`.
+    """
+
+    __slots__ = ("_data", "_hash", "_key", "__weakref__")
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._data: dict = dict(*args, **kwargs)
+        self._hash: int | None = None
+        self._key: Hashable | None = None
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenDict):
+            return self is other or self._data == other._data
+        if isinstance(other, dict):
+            return self._data == other
+        if isinstance(other, Mapping):
+            return self._data == dict(other.items())
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({self._data!r})"
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return (FrozenDict, (self._data,))
+
+    def __or__(self, other: Any) -> "FrozenDict":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return FrozenDict({**self._data, **other})
+
+    def thaw(self) -> dict:
+        """Return a mutable deep copy of the mapping, with every nested frozen value thawed.
+
+        Returns:
+            dict: Mutable copy of the mapping.
+        """
+        return thaw(self)
+
+
+_INTERNED: "weakref.WeakValueDictionary[Hashable, FrozenDict]" = weakref.WeakValueDictionary()
+_INTERN_LOCK = threading.Lock()
+
+
+def _content_key(value: Any) -> Hashable | None:
+    """Key identifying a frozen value by its content and the types of its scalars, or None if the
+    value holds anything which cannot be keyed, e.g. an unresolved lazy import."""
+    if isinstance(value, _SCALAR_TYPES):
+        return (type(value), value)
+    if type(value) is FrozenDict:
+        return value._key
+    if type(value) is tuple:
+        keys = tuple(_content_key(item) for item in value)
+        return None if None in keys else (tuple, keys)
+    if type(value) is frozenset:
+        keys = frozenset(_content_key(item) for item in value)
+        return None if None in keys else (frozenset, keys)
+    return None
+
+
+def _intern(mapping: FrozenDict) -> FrozenDict:
+    keys = []
+    for key, item in mapping._data.items():
+        if (key_key := _content_key(key)) is None or (item_key := _content_key(item)) is None:
+            return mapping
+        keys.append((key_key, item_key))
+    mapping._key = (FrozenDict, tuple(keys))
+    with _INTERN_LOCK:
+        return _INTERNED.setdefault(mapping._key, mapping)
+
+
+def freeze(value: Any, memo: dict[int, Any] | None = None) -> Any:
+    """Freeze a value as constructed by a YAML loader: dicts become interned `FrozenDict` instances,
+    lists become tuples and sets become frozensets, recursively. `LazyImport` proxies are resolved
+    and their contents frozen in their place. Scalars and already-frozen values are returned as-is,
+    as are values of unrecognized types.
+
+    Args:
+        value (Any): Value to freeze.
+        memo (dict[int, Any] | None): Mapping of already-frozen object ids. Defaults to None.
+
+    Raises:
+        ValueError: If the value contains itself, e.g. through a recursive alias.
+
+    Returns:
+        Any: Frozen value.
+    """
+    if isinstance(value, _SCALAR_TYPES) or type(value) is FrozenDict:
+        return value
+    if type(value) is LazyImport:
+        return freeze(value.resolve(), memo)
+    if memo is None:
+        memo = {}
+    if (value_id := id(value)) in memo:
+        if memo[value_id] is None:
+            raise ValueError("Failed to freeze a recursive structure")
+        return memo[value_id]
+    result: Any
+    if type(value) is dict:
+        memo[value_id] = None
+        result = _intern(FrozenDict({freeze(key, memo): freeze(item, memo) for key, item in value.items()}))
+    elif type(value) in (list, tuple):
+        memo[value_id] = None
+        result = tuple(freeze(item, memo) for item in value)
+        if type(value) is tuple and all(frozen is item for frozen, item in zip(result, value)):
+            result = value
+    elif type(value) in (set, frozenset):
+        result = frozenset(value)
+    else:
+        return value
+    memo[value_id] = result
+    return result
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a frozen value: `FrozenDict` instances become dicts, tuples
+    become lists and frozensets become sets, recursively.
+
+    Args:
+        value (Any): Value to thaw.
+
+    Returns:
+        Any: Mutable copy of the value.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if type(value) is tuple or type(value) is list:
+        return [thaw(item) for item in value]
+    if type(value) is frozenset:
+        return set(value)
+    return value
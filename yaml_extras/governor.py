@@ -0,0 +1,343 @@
+"""
+This module implements the resource governor, which bounds the resources a single load may use, so
+that one overly broad glob (e.g. `!import-all data/**/*.yml` over a huge tree) or a runaway chain of
+nested imports fails fast with a clear error rather than exhausting the process. The governor is
+disabled by default, and enabled by setting `ImportLimits` process-wide with `set_import_limits`,
+or for the current context only with `import_limits`:
+
+``` python
+from yaml_extras.governor import ImportLimits, set_import_limits
+
+set_import_limits(ImportLimits(max_files_per_pattern=10_000, max_total_bytes=256 * 1024 * 1024))
+```
+
+The limits are:
+
+- The number of files matched by a single path pattern, enforced while the directory tree is
+  walked, so that the walk stops as soon as the limit is exceeded.
+- The total number of bytes read from imported files during a load.
+- The depth of nested imports, i.e. the length of the chain of files importing each other.
+- The wall time of a load, checked whenever a file is imported or a pattern is expanded.
+
+An exceeded limit raises an `ImportLimitError`. In "warn only" mode, an `ImportLimitWarning` is
+issued instead (once per limit and source), and the load carries on. Either way, the message
+reports where the budget went, e.g. the largest files read so far when the byte budget is exceeded.
+The budget of the current load is available from `get_import_budget`, e.g. to log its report.
+
+The limits bound the resources a load actually uses: files served from the parse cache are not read
+again, and do not import their nested files again. Files loaded by worker processes (see
+`set_import_executor`) do not count toward the byte budget of the load.
+
+To keep the budget of a load after it completes, e.g. to log where it went, open it around the load
+with `import_budget`:
+
+``` python
+with import_budget() as budget:
+    data = yaml.load(f, ExtrasLoader)
+print(budget.report())
+```
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import heapq
+from pathlib import Path
+import threading
+import time
+from typing import Any, Iterator
+import warnings
+
+
+@dataclass(frozen=True)
+class ImportLimits:
+    """Limits on the resources used by a single load. Every limit defaults to None, which leaves the
+    resource unbounded.
+
+    Attributes:
+        max_files_per_pattern (int | None): Maximum number of files matched by a single path
+            pattern.
+        max_total_bytes (int | None): Maximum total number of bytes read from imported files during
+            a load.
+        max_import_depth (int | None): Maximum depth of nested imports. A file imported by the
+            document being loaded is at depth 1.
+        max_load_time (float | None): Maximum wall time of a load, in seconds.
+        warn_only (bool): Whether to issue an `ImportLimitWarning` rather than raise an
+            `ImportLimitError` when a limit is exceeded. Defaults to False.
+    """
+
+    max_files_per_pattern: int | None = None
+    max_total_bytes: int | None = None
+    max_import_depth: int | None = None
+    max_load_time: float | None = None
+    warn_only: bool = False
+
+    def __post_init__(self):
+        for name in ("max_files_per_pattern", "max_total_bytes", "max_import_depth", "max_load_time"):
+            if (value := getattr(self, name)) is not None and value < 0:
+                raise ValueError(f"{name} must not be negative, got {value}")
+
+
+class ImportLimitError(ValueError):
+    """Raised when a load exceeds one of its `ImportLimits`.
+
+    Attributes:
+        limit (str): Name of the exceeded limit, e.g. "max_total_bytes".
+        value (float): Amount of the resource used.
+        maximum (float): Configured limit.
+        source (str): What exceeded the limit, e.g. the path pattern or the file being imported.
+    """
+
+    def __init__(self, limit: str, value: float, maximum: float, source: str, detail: str = ""):
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        self.source = source
+        super().__init__(_describe(limit, value, maximum, source, detail))
+
+
+class ImportLimitWarning(UserWarning):
+    """Issued instead of raising an `ImportLimitError` when the limits are in "warn only" mode."""
+
+
+def _describe(limit: str, value: float, maximum: float, source: str, detail: str) -> str:
+    message = f"Import limit {limit}={maximum:g} exceeded by {source}: {value:g}"
+    return f"{message}. {detail}" if detail else message
+
+
+class ImportBudget:
+    """Resources used by a single load, checked against its `ImportLimits`.
+
+    Attributes:
+        limits (ImportLimits): Limits of the load.
+        bytes_read (int): Total number of bytes read from imported files.
+        max_depth (int): Deepest level of nested imports reached.
+        files_by_pattern (dict[str, int]): Number of files matched by each path pattern.
+        bytes_by_file (dict[Path, int]): Number of bytes read from each file.
+
+    Methods:
+        elapsed: Return the wall time of the load so far, in seconds.
+        add_bytes: Count bytes read from a file toward the budget.
+        check_depth: Check the depth of an import against the limit.
+        check_time: Check the wall time of the load against the limit.
+        exceeded: Raise an `ImportLimitError`, or issue an `ImportLimitWarning` in "warn only" mode.
+        report: Return a JSON-serializable summary of where the budget went.
+    """
+
+    def __init__(self, limits: ImportLimits):
+        self.limits = limits
+        self.bytes_read = 0
+        self.max_depth = 0
+        self.files_by_pattern: dict[str, int] = {}
+        self.bytes_by_file: dict[Path, int] = {}
+        self._started = time.monotonic()
+        self._warned: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """Return the wall time of the load so far.
+
+        Returns:
+            float: Elapsed time in seconds.
+        """
+        return time.monotonic() - self._started
+
+    def add_bytes(self, path: Path, size: int) -> None:
+        """Count bytes read from a file toward the budget.
+
+        Args:
+            path (Path): Path to the file read.
+            size (int): Number of bytes read.
+
+        Raises:
+            ImportLimitError: If the total number of bytes read exceeds the limit.
+        """
+        with self._lock:
+            self.bytes_read += size
+            self.bytes_by_file[Path(path)] = self.bytes_by_file.get(Path(path), 0) + size
+            bytes_read = self.bytes_read
+        if (maximum := self.limits.max_total_bytes) is not None and bytes_read > maximum:
+            largest = ", ".join(f"{path} ({size} bytes)" for path, size in self._largest_files(3))
+            self.exceeded("max_total_bytes", bytes_read, maximum, str(path), f"Largest files read: {largest}")
+
+    def check_depth(self, chain: tuple[tuple[Path, str | None], ...]) -> None:
+        """Check the depth of an import against the limit.
+
+        Args:
+            chain (tuple[tuple[Path, str | None], ...]): Chain of imports leading to the import, from
+                the outermost import to the import itself.
+
+        Raises:
+            ImportLimitError: If the chain is deeper than the limit.
+        """
+        with self._lock:
+            self.max_depth = max(self.max_depth, len(chain))
+        if (maximum := self.limits.max_import_depth) is not None and len(chain) > maximum:
+            path, anchor = chain[-1]
+            source = f"{path} &{anchor}" if anchor is not None else str(path)
+            shown = " -> ".join(str(path) for path, _ in chain[-5:])
+            self.exceeded("max_import_depth", len(chain), maximum, source, f"Import chain: ... -> {shown}")
+
+    def check_time(self, source: str) -> None:
+        """Check the wall time of the load against the limit.
+
+        Args:
+            source (str): What is being imported or expanded when the time is checked.
+
+        Raises:
+            ImportLimitError: If the load has taken longer than the limit.
+        """
+        if (maximum := self.limits.max_load_time) is not None and (elapsed := self.elapsed()) > maximum:
+            self.exceeded("max_load_time", round(elapsed, 3), maximum, source, self._summary())
+
+    def exceeded(self, limit: str, value: float, maximum: float, source: str, detail: str = "") -> None:
+        """Raise an `ImportLimitError`, or issue an `ImportLimitWarning` (once per limit and source)
+        if the limits are in "warn only" mode.
+
+        Args:
+            limit (str): Name of the exceeded limit.
+            value (float): Amount of the resource used.
+            maximum (float): Configured limit.
+            source (str): What exceeded the limit.
+            detail (str): Where the budget went. Defaults to "".
+
+        Raises:
+            ImportLimitError: Unless the limits are in "warn only" mode.
+        """
+        if not self.limits.warn_only:
+            raise ImportLimitError(limit, value, maximum, source, detail)
+        with self._lock:
+            if (limit, source) in self._warned:
+                return
+            self._warned.add((limit, source))
+        warnings.warn(_describe(limit, value, maximum, source, detail), ImportLimitWarning, stacklevel=2)
+
+    def report(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary of where the budget went.
+
+        Returns:
+            dict[str, Any]: Elapsed time, bytes read (in total and for the largest files), deepest
+                level of nested imports, and number of files matched by each pattern.
+        """
+        with self._lock:
+            return {
+                "elapsed": self.elapsed(),
+                "bytes_read": self.bytes_read,
+                "largest_files": {str(path): size for path, size in self._largest_files(10)},
+                "max_depth": self.max_depth,
+                "files_by_pattern": dict(self.files_by_pattern),
+            }
+
+    def _largest_files(self, n: int) -> list[tuple[Path, int]]:
+        return heapq.nlargest(n, self.bytes_by_file.items(), key=lambda item: item[1])
+
+    def _summary(self) -> str:
+        report = self.report()
+        return (
+            f"Read {report['bytes_read']} bytes from {len(self.bytes_by_file)} files, "
+            f"matched {sum(report['files_by_pattern'].values())} files with "
+            f"{len(report['files_by_pattern'])} patterns, reaching import depth {report['max_depth']}"
+        )
+
+
+IMPORT_LIMITS: ImportLimits | None = None
+
+# Limits for the current context, overriding the process-wide default set by `set_import_limits`.
+_CONTEXT_LIMITS: ContextVar[ImportLimits | None] = ContextVar("_CONTEXT_LIMITS", default=None)
+_IMPORT_BUDGET: ContextVar[ImportBudget | None] = ContextVar("_IMPORT_BUDGET", default=None)
+
+
+def get_import_limits() -> ImportLimits | None:
+    """Read the limits on the resources used by a load: the ones set for the current context with
+    `import_limits`, if any, or else the process-wide default set with `set_import_limits`.
+
+    Returns:
+        ImportLimits | None: Current limits, or None if loads are unbounded.
+    """
+    global IMPORT_LIMITS
+    if (limits := _CONTEXT_LIMITS.get()) is not None:
+        return limits
+    return IMPORT_LIMITS
+
+
+def set_import_limits(limits: ImportLimits | None) -> None:
+    """Set a global variable to change the limits on the resources used by a load.
+
+    Args:
+        limits (ImportLimits | None): New limits, or None to leave loads unbounded (the default).
+    """
+    global IMPORT_LIMITS
+    IMPORT_LIMITS = limits
+
+
+@contextmanager
+def import_limits(limits: ImportLimits) -> Iterator[ImportLimits]:
+    """Context manager which sets the limits on the resources used by a load in the current context
+    only, i.e. for the current thread or asyncio task.
+
+    Args:
+        limits (ImportLimits): Limits to apply.
+
+    Yields:
+        ImportLimits: The limits.
+    """
+    token = _CONTEXT_LIMITS.set(limits)
+    try:
+        yield limits
+    finally:
+        _CONTEXT_LIMITS.reset(token)
+
+
+def get_import_budget() -> ImportBudget | None:
+    """Return the budget of the load currently in progress, if any.
+
+    Returns:
+        ImportBudget | None: Current budget, or None outside of a load or if loads are unbounded.
+    """
+    return _IMPORT_BUDGET.get()
+
+
+@contextmanager
+def import_budget() -> Iterator[ImportBudget | None]:
+    """Context manager which opens the budget of a load, if any limits are set and no budget is
+    already open, in which case the open budget is reused.
+
+    Yields:
+        ImportBudget | None: The open budget, or None if loads are unbounded.
+    """
+    if (budget := _IMPORT_BUDGET.get()) is not None or (limits := get_import_limits()) is None:
+        yield budget
+        return
+    budget = ImportBudget(limits)
+    token = _IMPORT_BUDGET.set(budget)
+    try:
+        yield budget
+    finally:
+        _IMPORT_BUDGET.reset(token)
+
+
+def check_files_matched(pattern: str, count: int) -> None:
+    """Check the number of files matched by a path pattern so far against the limit, and record it
+    in the budget of the current load, if any.
+
+    Args:
+        pattern (str): Path pattern being expanded.
+        count (int): Number of files matched so far.
+
+    Raises:
+        ImportLimitError: If the pattern matched more files than the limit.
+    """
+    if (limits := get_import_limits()) is None:
+        return
+    budget = _IMPORT_BUDGET.get() or ImportBudget(limits)
+    with budget._lock:
+        budget.files_by_pattern[pattern] = max(budget.files_by_pattern.get(pattern, 0), count)
+    if (maximum := limits.max_files_per_pattern) is not None and count > maximum:
+        budget.exceeded(
+            "max_files_per_pattern",
+            count,
+            maximum,
+            pattern,
+            "The directory walk was stopped at the limit" if not limits.warn_only else "",
+        )
+    budget.check_time(pattern)
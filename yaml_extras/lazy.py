@@ -0,0 +1,157 @@
+"""
+This module implements the lazy proxies returned by the `!import` and `!import.anchor` tags when lazy
+imports are enabled (see `set_lazy_imports` in the `yaml_import` module).
+
+A `LazyImport` stands in for the contents of an imported file, and only reads and parses the file
+the first time the proxy is accessed. It behaves like the mapping, sequence or scalar it stands in for
+with respect to item access, iteration, membership, length, equality and attribute lookup (e.g.
+`.keys()` or `.append()`), but it is not an instance of `dict` or `list`. Use `materialize` to
+replace every proxy within a loaded document by its contents, e.g. before serializing it.
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Iterator
+
+_UNRESOLVED = object()
+
+
+class LazyImport:
+    """Transparent proxy for the contents of an imported file, which is only loaded on first access.
+
+    Attributes:
+        description (str): Human-readable description of what is being imported, e.g. the path.
+
+    Methods:
+        resolve: Load the contents (once) and return them, leaving nested proxies untouched.
+        materialize: Load the contents and every nested proxy, and return the plain value.
+        is_resolved: Return whether the contents have been loaded yet.
+    """
+
+    __slots__ = ("description", "_load", "_value", "_lock")
+
+    def __init__(self, load: Callable[[], Any], description: str):
+        self.description = description
+        self._load = load
+        self._value: Any = _UNRESOLVED
+        self._lock = threading.Lock()
+
+    @property
+    def is_resolved(self) -> bool:
+        """Return whether the contents have been loaded yet.
+
+        Returns:
+            bool: True if the contents have been loaded.
+        """
+        return self._value is not _UNRESOLVED
+
+    def resolve(self) -> Any:
+        """Load the contents (only the first time this is called) and return them. Nested proxies
+        within the contents are left untouched.
+
+        Returns:
+            Any: Contents of the imported file.
+        """
+        if self._value is _UNRESOLVED:
+            with self._lock:
+                if self._value is _UNRESOLVED:
+                    self._value = self._load()
+                    self._load = None  # type: ignore
+        return self._value
+
+    def materialize(self) -> Any:
+        """Load the contents and every nested proxy within them, and return the plain value.
+
+        Returns:
+            Any: Contents of the imported file, free of any proxies.
+        """
+        return materialize(self)
+
+    def __copy__(self) -> "LazyImport":
+        return self.__deepcopy__({})
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        # An unresolved proxy is copied as a new proxy which loads its own contents, so that copies
+        # never share mutable state; a resolved proxy is copied as a copy of its contents.
+        with self._lock:
+            if self._value is _UNRESOLVED:
+                return LazyImport(self._load, self.description)
+        return copy.deepcopy(self._value, memo)
+
+    def __reduce__(self) -> tuple:
+        return (_identity, (self.materialize(),))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.resolve()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.resolve()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self.resolve()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.resolve()
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyImport):
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    def __repr__(self) -> str:
+        if self.is_resolved:
+            return repr(self._value)
+        return f"LazyImport({self.description!r})"
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def materialize(value: Any, memo: dict[int, Any] | None = None) -> Any:
+    """Resolve every `LazyImport` proxy within a value, replacing the proxies found in dicts and
+    lists in place, and return the plain value.
+
+    Args:
+        value (Any): Value which may be or contain `LazyImport` proxies.
+        memo (dict[int, Any] | None): Mapping of already-visited object ids. Defaults to None.
+
+    Returns:
+        Any: The value, free of any proxies.
+    """
+    if memo is None:
+        memo = {}
+    if isinstance(value, LazyImport):
+        value = value.resolve()
+    if not isinstance(value, (dict, list)):
+        return value
+    if (value_id := id(value)) in memo:
+        return memo[value_id]
+    memo[value_id] = value
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = materialize(item, memo)
+    else:
+        for index, item in enumerate(value):
+            value[index] = materialize(item, memo)
+    return value
@@ -0,0 +1,105 @@
+"""
+This module implements the background prefetcher used when import prefetching is enabled (see
+`set_import_prefetch` in the `yaml_import` module).
+
+PyYAML composes the whole node graph of a document before any of it is constructed, so every
+import tag in the document is known before the first constructor runs. When prefetching is enabled,
+the composed document is scanned for import tags as soon as its construction starts, their paths
+and patterns are expanded, and the files they target are read (and, optionally, parsed) on a thread
+pool. The I/O then overlaps with the construction of the rest of the document, and by the time a
+constructor reaches an import, its file is usually already in memory.
+
+A prefetcher belongs to a single load: it is shared by every import in the load through the import
+session, and it is shut down (and any prefetched data it still holds is dropped) when the load
+completes. Prefetching is purely an optimization: a file which failed to prefetch is read again by
+its constructor, which reports the failure as usual.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable, Hashable, Literal
+
+
+@dataclass(frozen=True)
+class ImportPrefetch:
+    """Configuration for prefetching the files imported by a document in the background.
+
+    Attributes:
+        mode (Literal["read", "parse"]): What to prefetch. "read" reads the contents of each file
+            into memory. "parse" also composes each file into a node graph, and prefetches the files
+            imported by that file in turn.
+        max_workers (int | None): Maximum number of worker threads. Defaults to None, which uses the
+            default of `concurrent.futures.ThreadPoolExecutor`.
+    """
+
+    mode: Literal["read", "parse"]
+    max_workers: int | None = None
+
+    def __post_init__(self):
+        if self.mode not in ("read", "parse"):
+            raise ValueError(f"Unsupported prefetch mode: {self.mode}")
+
+
+class ImportPrefetcher:
+    """Thread pool which prefetches files for a single load, and holds the results until the
+    constructors of their imports take them.
+
+    Attributes:
+        config (ImportPrefetch): Prefetch configuration.
+
+    Methods:
+        submit: Start prefetching a result in the background, unless it is already being prefetched.
+        take: Return a prefetched result, waiting for it if it is still being prefetched.
+        close: Shut down the thread pool and drop every result which was not taken.
+    """
+
+    def __init__(self, config: ImportPrefetch):
+        self.config = config
+        self._executor = ThreadPoolExecutor(config.max_workers, thread_name_prefix="yaml-extras-prefetch")
+        self._futures: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, key: Hashable, fetch: Callable[[], Any]) -> None:
+        """Start prefetching a result in the background, unless a result for the same key has
+        already been submitted. The fetch function runs in a copy of the current context.
+
+        Args:
+            key (Hashable): Key identifying the result, e.g. the resolved path of a file.
+            fetch (Callable[[], Any]): Function which fetches the result.
+        """
+        with self._lock:
+            if self._closed or key in self._futures:
+                return
+            self._futures[key] = self._executor.submit(contextvars.copy_context().run, fetch)
+
+    def take(self, key: Hashable) -> Any | None:
+        """Return a prefetched result, waiting for it if it is still being prefetched. Each result
+        can only be taken once.
+
+        Args:
+            key (Hashable): Key identifying the result.
+
+        Returns:
+            Any | None: The prefetched result, or None if it was never submitted, was already
+                taken, or failed to be fetched.
+        """
+        with self._lock:
+            future = self._futures.pop(key, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # The constructor reads the file again, and reports the failure itself
+            return None
+
+    def close(self) -> None:
+        """Shut down the thread pool, cancelling any prefetch which has not started yet, and drop
+        every result which was not taken."""
+        with self._lock:
+            self._closed = True
+            self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
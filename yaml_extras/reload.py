@@ -0,0 +1,372 @@
+"""
+This module implements incremental reloads of documents which use the `!import` family of tags.
+
+A `ReloadableDocument` records the import graph of a document while loading it: which file every
+import tag read, which files matched every glob, and which directories each glob expansion depends
+on. When some files change, `ReloadableDocument.reload` re-reads only those files, re-expands only
+the globs they may affect, and reuses the values of every other import.
+
+Imported mappings and sequences are updated in place, so references into the document held by the
+application stay current. Whenever an import cannot be updated in place (e.g. a file whose contents
+changed from a mapping to a scalar, or an import merged with the "<<" merge key), the file
+containing the import tag is re-read instead, reusing the values of its other imports.
+
+While recording, imports are always loaded eagerly, sequentially and without the parse cache.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Type
+
+import yaml
+
+from yaml_extras import ExtrasLoader
+from yaml_extras.file_utils import PathPattern, PathWithMetadata, _compile_pattern, _limit_results
+from yaml_extras.yaml_import import (
+    _IMPORT_OBSERVER,
+    RESERVED_TAGS,
+    _parse_yaml_file,
+    get_import_relative_dir,
+    import_relative_dir,
+)
+
+# Tags whose constructed value holds the values of the files they read as-is, so that updating one
+# of those values in place is enough to update the import.
+_SHARES_SOURCE_VALUES = {"!import", "!import.anchor", "!import-all", "!import-all.anchor"}
+
+
+class _Status(Enum):
+    UNCHANGED = 0
+    UPDATED = 1  # Contents changed, but the value was updated in place
+    REPLACED = 2  # The value is a new object, so whatever holds it must be rebuilt
+
+
+@dataclass
+class GlobRecord:
+    """Record of the expansion of a path pattern by an import tag.
+
+    Attributes:
+        pattern (str): Path pattern which was expanded.
+        relative_to (Path): Directory the pattern was expanded relative to.
+        paths (tuple[Path, ...]): Resolved paths which matched the pattern, in order.
+        directories (frozenset[Path]): Resolved directories whose contents the expansion depends on.
+
+    Methods:
+        may_be_affected: Return whether any of the changed paths could alter the expansion.
+    """
+
+    pattern: str
+    relative_to: Path
+    paths: tuple[Path, ...]
+    directories: frozenset[Path]
+
+    def may_be_affected(self, changed: set[Path]) -> bool:
+        """Return whether any of the changed paths could alter the expansion, i.e. whether any of
+        them matched the pattern, or lies in (or is) a directory the expansion depends on.
+
+        Args:
+            changed (set[Path]): Resolved paths which changed.
+
+        Returns:
+            bool: True if the pattern should be expanded again.
+        """
+        return any(
+            path in self.directories or path.parent in self.directories or path in self.paths for path in changed
+        )
+
+
+@dataclass
+class SourceRecord:
+    """Record of a file (or an anchor within it) read while loading a document.
+
+    Attributes:
+        path (Path): Resolved path to the file.
+        anchor (str | None): Anchor which was loaded from the file, or None for the whole file.
+        loader_type (Type[yaml.Loader]): YAML loader type the file was read with.
+        relative_dir (Path): Relative directory for imports within the file.
+        imports (list[ImportRecord]): Imports within the file, in the order they were constructed.
+        value (Any): Value loaded from the file.
+    """
+
+    path: Path
+    anchor: str | None
+    loader_type: Type[yaml.Loader]
+    relative_dir: Path
+    imports: list["ImportRecord"] = field(default_factory=list)
+    value: Any = None
+
+
+@dataclass
+class ImportRecord:
+    """Record of an import tag constructed while loading a document.
+
+    Attributes:
+        tag (str): Import tag, e.g. "!import-all".
+        argument (str): Argument of the tag, e.g. "data/*.yml".
+        loader_type (Type[yaml.Loader]): YAML loader type the tag was constructed with.
+        relative_dir (Path): Relative directory the argument was resolved against.
+        merged (bool): Whether the import is the value of a "<<" merge key.
+        sources (list[SourceRecord]): Files read by the import, in order.
+        glob (GlobRecord | None): Expansion of the path pattern of the import, if any.
+        value (Any): Value constructed by the import.
+    """
+
+    tag: str
+    argument: str
+    loader_type: Type[yaml.Loader]
+    relative_dir: Path
+    merged: bool = False
+    sources: list[SourceRecord] = field(default_factory=list)
+    glob: GlobRecord | None = None
+    value: Any = None
+
+    @property
+    def key(self) -> tuple:
+        return (self.tag, self.argument, self.relative_dir, self.merged)
+
+
+class _ImportRecorder:
+    """Import observer which records the import graph while a document (or a part of it) is loaded,
+    under a given holder record.
+
+    Records found in the reuse pools are reused, along with their values, instead of being loaded
+    again, but only directly under the holder."""
+
+    def __init__(
+        self,
+        holder: SourceRecord | ImportRecord,
+        reuse_imports: Iterable[ImportRecord] = (),
+        reuse_sources: Iterable[SourceRecord] = (),
+    ):
+        self._stack: list[SourceRecord | ImportRecord] = [holder]
+        self._reuse_imports: dict[tuple, list[ImportRecord]] = {}
+        for record in reuse_imports:
+            self._reuse_imports.setdefault(record.key, []).append(record)
+        self._reuse_sources: dict[tuple, list[SourceRecord]] = {}
+        for source in reuse_sources:
+            self._reuse_sources.setdefault((source.path, source.anchor), []).append(source)
+
+    def observe_import(
+        self, loader_type: Type[yaml.Loader], node: yaml.Node, merged: bool, construct: Callable[[], Any]
+    ) -> Any:
+        parent = self._stack[-1]
+        if not isinstance(parent, SourceRecord) or not isinstance(node, yaml.ScalarNode):
+            return construct()
+        record = ImportRecord(node.tag, node.value, loader_type, get_import_relative_dir(), merged)
+        if len(self._stack) == 1 and (reusable := self._reuse_imports.get(record.key)):
+            record = reusable.pop(0)
+            parent.imports.append(record)
+            return record.value
+        parent.imports.append(record)
+        self._stack.append(record)
+        try:
+            record.value = construct()
+        finally:
+            self._stack.pop()
+        return record.value
+
+    def observe_file(
+        self, path: Path, loader_type: Type[yaml.Loader], anchor: str | None, read: Callable[[], Any]
+    ) -> Any:
+        parent = self._stack[-1]
+        if not isinstance(parent, ImportRecord):
+            return read()
+        source = SourceRecord(Path(path).resolve(), anchor, loader_type, get_import_relative_dir())
+        if len(self._stack) == 1 and (reusable := self._reuse_sources.get((source.path, anchor))):
+            source = reusable.pop(0)
+            parent.sources.append(source)
+            return source.value
+        parent.sources.append(source)
+        self._stack.append(source)
+        try:
+            source.value = read()
+        finally:
+            self._stack.pop()
+        return source.value
+
+    def expand_glob(self, path_pattern: PathPattern) -> list[PathWithMetadata]:
+        results, glob = _expand_glob(path_pattern.pattern, path_pattern.relative_to or Path.cwd())
+        if isinstance(parent := self._stack[-1], ImportRecord):
+            parent.glob = glob
+        return results
+
+
+def _expand_glob(pattern: str, relative_to: Path) -> tuple[list[PathWithMetadata], GlobRecord]:
+    observed_dirs: dict[Path, int | None] = {}
+    walk = _compile_pattern(pattern).walk_results(relative_to, observed_dirs=observed_dirs)
+    results = list(_limit_results(pattern, walk))
+    glob = GlobRecord(
+        pattern,
+        relative_to,
+        tuple(result.path.resolve() for result in results),
+        frozenset(directory.resolve() for directory in observed_dirs),
+    )
+    return results, glob
+
+
+@contextmanager
+def _recording(recorder: _ImportRecorder, relative_dir: Path) -> Iterator[None]:
+    token = _IMPORT_OBSERVER.set(recorder)
+    try:
+        with import_relative_dir(relative_dir):
+            yield
+    finally:
+        _IMPORT_OBSERVER.reset(token)
+
+
+def _update_in_place(old: Any, new: Any) -> bool:
+    if old is new:
+        return True
+    if type(old) is dict and type(new) is dict:
+        old.clear()
+        old.update(new)
+        return True
+    if type(old) is list and type(new) is list:
+        old[:] = new
+        return True
+    return False
+
+
+def _record_source(
+    path: Path,
+    anchor: str | None,
+    loader_type: Type[yaml.Loader],
+    relative_dir: Path,
+    reuse_imports: Iterable[ImportRecord] = (),
+) -> SourceRecord:
+    source = SourceRecord(path, anchor, loader_type, relative_dir)
+    with _recording(_ImportRecorder(source, reuse_imports=reuse_imports), relative_dir):
+        source.value = _parse_yaml_file(path, loader_type, anchor)
+    return source
+
+
+def _record_import(record: ImportRecord, reuse_sources: Iterable[SourceRecord] = ()) -> ImportRecord:
+    new_record = ImportRecord(record.tag, record.argument, record.loader_type, record.relative_dir, record.merged)
+    loader = record.loader_type("")
+    try:
+        with _recording(_ImportRecorder(new_record, reuse_sources=reuse_sources), record.relative_dir):
+            constructor = RESERVED_TAGS[record.tag]()
+            new_record.value = constructor(loader, yaml.ScalarNode(record.tag, record.argument))
+    finally:
+        loader.dispose()  # type: ignore
+    return new_record
+
+
+class ReloadableDocument:
+    """Document loaded from a file, along with the graph of everything it imports, which can be
+    reloaded incrementally when some of the files it depends on change.
+
+    Attributes:
+        path (Path): Resolved path to the root document.
+        loader_type (Type[yaml.Loader]): YAML loader type used to load the document.
+        relative_dir (Path): Relative directory for imports within the document.
+        value (Any): Current contents of the document.
+
+    Methods:
+        reload: Update the document after some files changed, rebuilding only what they affect.
+        files: Return every file the document currently depends on.
+        directories: Return every directory whose contents the glob imports depend on.
+    """
+
+    def __init__(self, path: Path, loader_type: Type[yaml.Loader] = ExtrasLoader):
+        """Load a document from a file, recording its import graph.
+
+        Args:
+            path (Path): Path to the root document.
+            loader_type (Type[yaml.Loader]): YAML loader type. Defaults to ExtrasLoader.
+        """
+        self.path = Path(path).resolve()
+        self.loader_type = loader_type
+        self.relative_dir = get_import_relative_dir()
+        self._root = _record_source(self.path, None, loader_type, self.relative_dir)
+
+    @property
+    def value(self) -> Any:
+        return self._root.value
+
+    def reload(self, changed_paths: Iterable[Path]) -> Any:
+        """Update the document after some files changed (or were added or removed), re-reading only
+        the changed files, re-expanding only the globs they may affect, and reusing every other
+        import. Imported mappings and sequences are updated in place where possible.
+
+        If reading a file fails, the exception is raised and the document may be left partially
+        updated; it should then be loaded again from scratch.
+
+        Args:
+            changed_paths (Iterable[Path]): Paths to the files which changed, were added or were
+                removed.
+
+        Returns:
+            Any: Current contents of the document.
+        """
+        changed = {Path(path).resolve() for path in changed_paths}
+        if changed:
+            self._refresh_source(self._root, changed)
+        return self.value
+
+    def files(self) -> set[Path]:
+        """Return every file the document currently depends on, including the root document.
+
+        Returns:
+            set[Path]: Resolved paths to the files.
+        """
+        return {source.path for source in self._sources()}
+
+    def directories(self) -> set[Path]:
+        """Return every directory whose contents the glob imports of the document depend on, e.g. to
+        watch them for added or removed files.
+
+        Returns:
+            set[Path]: Resolved paths to the directories.
+        """
+        return {directory for record in self._imports() if record.glob for directory in record.glob.directories}
+
+    def _sources(self) -> Iterator[SourceRecord]:
+        stack = [self._root]
+        while stack:
+            source = stack.pop()
+            yield source
+            stack.extend(child for record in source.imports for child in record.sources)
+
+    def _imports(self) -> Iterator[ImportRecord]:
+        for source in self._sources():
+            yield from source.imports
+
+    def _refresh_source(self, source: SourceRecord, changed: set[Path]) -> _Status:
+        statuses = [self._refresh_import(record, changed) for record in source.imports]
+        if source.path in changed or any(
+            status is _Status.REPLACED or (record.merged and status is not _Status.UNCHANGED)
+            for record, status in zip(source.imports, statuses)
+        ):
+            new_source = _record_source(
+                source.path, source.anchor, source.loader_type, source.relative_dir, reuse_imports=source.imports
+            )
+            source.imports = new_source.imports
+            if _update_in_place(source.value, new_source.value):
+                return _Status.UPDATED
+            source.value = new_source.value
+            return _Status.REPLACED
+        return _Status.UNCHANGED if all(status is _Status.UNCHANGED for status in statuses) else _Status.UPDATED
+
+    def _refresh_import(self, record: ImportRecord, changed: set[Path]) -> _Status:
+        glob_changed = False
+        kept_paths = None
+        if record.glob is not None and record.glob.may_be_affected(changed):
+            _, glob = _expand_glob(record.glob.pattern, record.glob.relative_to)
+            glob_changed = glob.paths != record.glob.paths
+            kept_paths = set(glob.paths)
+        sources = [source for source in record.sources if kept_paths is None or source.path in kept_paths]
+        statuses = [self._refresh_source(source, changed) for source in sources]
+        if not glob_changed:
+            if all(status is _Status.UNCHANGED for status in statuses):
+                return _Status.UNCHANGED
+            if record.tag in _SHARES_SOURCE_VALUES and _Status.REPLACED not in statuses:
+                return _Status.UPDATED
+        new_record = _record_import(record, reuse_sources=sources)
+        record.sources, record.glob = new_record.sources, new_record.glob
+        if not record.merged and _update_in_place(record.value, new_record.value):
+            return _Status.UPDATED
+        record.value = new_record.value
+        return _Status.REPLACED
@@ -0,0 +1,202 @@
+"""
+This module implements the load-scoped import session, which is shared by every import performed
+while a single document is loaded, including imports nested within imported files.
+
+The session memoizes each imported file (and each file and anchor pair), so that a file imported
+from many places in the same import tree (e.g. a common base file in a "diamond" hierarchy) is only
+read and parsed once per load. Each import receives its own copy of the memoized value, so results
+never share mutable state.
+
+The session also holds helper objects shared by every import in the load, such as the scanner
+over the anchors of a file, so that several anchors imported from the same file are all extracted
+in a single pass over it.
+
+Every path pattern matched during the session lists directories through a shared directory
+snapshot, so that overlapping `!import-all*` patterns list each directory only once per load.
+
+The session also tracks the chain of files currently being imported, so that an import cycle is
+reported with a clear `ImportCycleError` showing the chain, rather than recursing until Python's
+recursion limit is reached.
+
+Both are held in context variables, so concurrent loads in other threads or asyncio tasks each get
+their own session.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+import threading
+from typing import Any, Callable, Hashable, Iterator
+
+from yaml_extras.cache import Dependency, copy_value, note_dependency, track_dependencies
+from yaml_extras.file_utils import directory_snapshot
+from yaml_extras.governor import get_import_budget, import_budget
+
+
+class ImportCycleError(ValueError):
+    """Raised when a file (or an anchor within it) imports itself, directly or indirectly.
+
+    Attributes:
+        chain (tuple[tuple[Path, str | None], ...]): Chain of imports which forms the cycle, from
+            the first occurrence of the repeated import to the repeated import itself.
+    """
+
+    def __init__(self, chain: tuple[tuple[Path, str | None], ...]):
+        self.chain = chain
+        super().__init__(f"Import cycle detected: {' -> '.join(_describe(path, anchor) for path, anchor in chain)}")
+
+
+def _describe(path: Path, anchor: str | None) -> str:
+    return f"{path} &{anchor}" if anchor is not None else str(path)
+
+
+@dataclass
+class _SessionEntry:
+    value: Any
+    dependencies: frozenset[Dependency]
+
+
+@dataclass
+class ImportSession:
+    """Memo of the files imported while a single document is loaded.
+
+    Attributes:
+        hits (int): Number of imports which were served from the memo.
+        misses (int): Number of imports which required loading the file.
+
+    Methods:
+        get_or_load: Return a copy of the memoized value for an import, loading it on a miss.
+        shared: Return a helper object shared by every import in the session, creating it on first
+            use.
+        close: Close every shared helper object.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    _entries: dict[Hashable, _SessionEntry] = field(default_factory=dict, init=False, repr=False)
+    _shared: dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return the memoized value for an import, calling `load` on a miss. The first import
+        receives the loaded value itself, and every later import receives a copy of it.
+
+        Args:
+            key (Hashable): Key identifying the import, e.g. the resolved path, anchor and loader.
+            load (Callable[[], Any]): Function which loads the value on a miss.
+
+        Returns:
+            Any: Value of the import.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            note_dependency(*entry.dependencies)
+            return copy_value(entry.value)
+        with track_dependencies() as deps:
+            value = load()
+        with self._lock:
+            self._entries.setdefault(key, _SessionEntry(value, frozenset(deps)))
+        return value
+
+    def shared(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """Return a helper object shared by every import in the session, e.g. the scanner over the
+        anchors of a file, calling `create` to create it on first use. Objects with a `close` method
+        are closed when the session ends.
+
+        Args:
+            key (Hashable): Key identifying the helper object.
+            create (Callable[[], Any]): Function which creates the helper object.
+
+        Returns:
+            Any: The shared helper object.
+        """
+        with self._lock:
+            helper = self._shared.get(key)
+        if helper is None:
+            # Created outside of the lock, since creating a helper may itself use other helpers
+            created = create()
+            with self._lock:
+                helper = self._shared.setdefault(key, created)
+            if helper is not created and callable(close := getattr(created, "close", None)):
+                close()
+        return helper
+
+    def close(self) -> None:
+        """Close every shared helper object which has a `close` method."""
+        with self._lock:
+            helpers = list(self._shared.values())
+            self._shared.clear()
+        for helper in helpers:
+            if callable(close := getattr(helper, "close", None)):
+                close()
+
+
+_IMPORT_SESSION: ContextVar[ImportSession | None] = ContextVar("_IMPORT_SESSION", default=None)
+_IMPORT_CHAIN: ContextVar[tuple[tuple[Path, str | None], ...]] = ContextVar("_IMPORT_CHAIN", default=())
+
+
+def get_import_session() -> ImportSession | None:
+    """Return the import session of the document currently being loaded, if any.
+
+    Returns:
+        ImportSession | None: Current import session, or None outside of a load.
+    """
+    return _IMPORT_SESSION.get()
+
+
+@contextmanager
+def import_session() -> Iterator[ImportSession]:
+    """Context manager which opens an import session, unless one is already active, in which case
+    the active session is reused. The session is closed when the outermost context exits. A new
+    session also opens a directory snapshot (see `file_utils.directory_snapshot`), so that every
+    path pattern matched during the load shares the same directory listings, and the budget of the
+    load (see `governor.import_budget`), if any limits are set.
+
+    Yields:
+        ImportSession: The active import session.
+    """
+    if (session := _IMPORT_SESSION.get()) is not None:
+        yield session
+        return
+    session = ImportSession()
+    token = _IMPORT_SESSION.set(session)
+    try:
+        with directory_snapshot(), import_budget():
+            yield session
+    finally:
+        _IMPORT_SESSION.reset(token)
+        session.close()
+
+
+@contextmanager
+def import_frame(path: Path, anchor: str | None = None) -> Iterator[None]:
+    """Context manager which marks a file (or an anchor within it) as being imported for its
+    duration, checking the depth of the import and the wall time of the load against the budget of
+    the load, if any.
+
+    Args:
+        path (Path): Resolved path to the file.
+        anchor (str | None): Anchor being imported, or None for the whole file. Defaults to None.
+
+    Raises:
+        ImportCycleError: If the file (and anchor) is already being imported further up the chain.
+        ImportLimitError: If the import is nested too deeply, or the load has taken too long.
+    """
+    chain = _IMPORT_CHAIN.get()
+    frame = (path, anchor)
+    if frame in chain:
+        raise ImportCycleError(chain[chain.index(frame) :] + (frame,))
+    if (budget := get_import_budget()) is not None:
+        budget.check_depth(chain + (frame,))
+        budget.check_time(_describe(path, anchor))
+    token = _IMPORT_CHAIN.set(chain + (frame,))
+    try:
+        yield
+    finally:
+        _IMPORT_CHAIN.reset(token)
@@ -0,0 +1,268 @@
+"""
+This module implements an optional statistics collector for the `!import` family of tags, which
+records how long each tag took to resolve, which files it loaded, how many bytes were read, and how
+much time was spent parsing and constructing each file.
+
+Collection is enabled for the current context (i.e. the current thread or asyncio task) with the
+`collect_import_stats` context manager. The collected statistics are available as a structured
+report once the load completes, and an optional callback is invoked as each tag is resolved, e.g.
+to log slow imports while a large document is still loading.
+
+Files loaded by worker processes (see `set_import_executor`) and files of lazy imports which are
+only read after the load completes are counted as matched, but their timings are not recorded.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+import yaml
+
+
+@dataclass
+class FileStats:
+    """Statistics for a single file (or an anchor within it) loaded by an import tag.
+
+    Attributes:
+        path (Path): Resolved path to the file.
+        anchor (str | None): Anchor loaded from the file, or None for the whole file.
+        cached (bool): True if the value was served by the parse cache or the import session, in
+            which case the file was not read.
+        bytes_read (int): Number of bytes read from the file.
+        parse_time (float): Seconds spent parsing the file into a node graph.
+        construct_time (float): Seconds spent constructing the node graph, including the time spent
+            resolving the imports nested within the file.
+    """
+
+    path: Path
+    anchor: str | None = None
+    cached: bool = True
+    bytes_read: int = 0
+    parse_time: float = 0.0
+    construct_time: float = 0.0
+
+
+@dataclass
+class TagStats:
+    """Statistics for a single import tag resolved while loading a document.
+
+    Attributes:
+        tag (str): The tag, e.g. "!import-all".
+        source (str): The argument of the tag, i.e. the path or pattern being imported.
+        files (list[FileStats]): Statistics for each file loaded by the tag.
+        files_matched (int): Number of files matched by the tag.
+        total_time (float): Seconds spent resolving the tag, including nested imports.
+
+    Methods:
+        as_dict: Summarize the statistics as a JSON-serializable dictionary.
+    """
+
+    tag: str
+    source: str
+    files: list[FileStats] = field(default_factory=list)
+    files_matched: int = 0
+    total_time: float = 0.0
+    _globbed: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def bytes_read(self) -> int:
+        """Total number of bytes read by the tag."""
+        return sum(f.bytes_read for f in self.files)
+
+    @property
+    def parse_time(self) -> float:
+        """Total seconds spent parsing the files loaded by the tag."""
+        return sum(f.parse_time for f in self.files)
+
+    @property
+    def construct_time(self) -> float:
+        """Total seconds spent constructing the files loaded by the tag."""
+        return sum(f.construct_time for f in self.files)
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of files which were served by the parse cache or the import session."""
+        return sum(f.cached for f in self.files)
+
+    @property
+    def cache_misses(self) -> int:
+        """Number of files which were read and parsed."""
+        return sum(not f.cached for f in self.files)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize the statistics as a JSON-serializable dictionary.
+
+        Returns:
+            dict[str, Any]: Summary of the tag, with its per-file statistics under "files".
+        """
+        return {
+            "tag": self.tag,
+            "source": self.source,
+            "files_matched": self.files_matched,
+            "bytes_read": self.bytes_read,
+            "parse_time": self.parse_time,
+            "construct_time": self.construct_time,
+            "total_time": self.total_time,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "files": [{**asdict(f), "path": str(f.path)} for f in self.files],
+        }
+
+
+@dataclass
+class ImportStats:
+    """Collector of statistics for the import tags resolved while collection is enabled.
+
+    Attributes:
+        tags (list[TagStats]): Statistics for each resolved tag, in the order the tags were
+            started. Tags nested within imported files are listed after the tag which imported them.
+        callback (Callable[[TagStats], None] | None): Function called with the statistics of each
+            tag as soon as it is resolved. Defaults to None.
+
+    Methods:
+        report: Summarize the statistics of every tag as a list of JSON-serializable dictionaries.
+        slowest: Return the tags which took the longest to resolve.
+        observe_tag: Resolve an import tag, recording its statistics.
+    """
+
+    tags: list[TagStats] = field(default_factory=list)
+    callback: Callable[[TagStats], None] | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def report(self) -> list[dict[str, Any]]:
+        """Summarize the statistics of every tag as a list of JSON-serializable dictionaries.
+
+        Returns:
+            list[dict[str, Any]]: One summary per tag (see `TagStats.as_dict`).
+        """
+        with self._lock:
+            return [tag.as_dict() for tag in self.tags]
+
+    def slowest(self, n: int = 10) -> list[TagStats]:
+        """Return the tags which took the longest to resolve.
+
+        Args:
+            n (int): Maximum number of tags to return. Defaults to 10.
+
+        Returns:
+            list[TagStats]: Up to `n` tags, from slowest to fastest.
+        """
+        with self._lock:
+            return sorted(self.tags, key=lambda tag: tag.total_time, reverse=True)[:n]
+
+    def observe_tag(self, node: yaml.Node, construct: Callable[[], Any]) -> Any:
+        """Resolve an import tag, recording its statistics and passing them to the callback once
+        it is resolved.
+
+        Args:
+            node (yaml.Node): The node of the import tag.
+            construct (Callable[[], Any]): Function which constructs the node.
+
+        Returns:
+            Any: The constructed object.
+        """
+        tag_stats = TagStats(node.tag, str(node.value))
+        with self._lock:
+            self.tags.append(tag_stats)
+        token = _CURRENT_TAG.set(tag_stats)
+        start = time.perf_counter()
+        try:
+            return construct()
+        finally:
+            tag_stats.total_time = time.perf_counter() - start
+            _CURRENT_TAG.reset(token)
+            if not tag_stats._globbed:
+                tag_stats.files_matched = len(tag_stats.files)
+            if self.callback is not None:
+                self.callback(tag_stats)
+
+    def _add_file(self, tag_stats: TagStats, file_stats: FileStats) -> None:
+        # Files matched by an `!import-all` family tag may be loaded by several worker threads.
+        with self._lock:
+            tag_stats.files.append(file_stats)
+
+
+_IMPORT_STATS: ContextVar[ImportStats | None] = ContextVar("_IMPORT_STATS", default=None)
+_CURRENT_TAG: ContextVar[TagStats | None] = ContextVar("_CURRENT_TAG", default=None)
+_CURRENT_FILE: ContextVar[FileStats | None] = ContextVar("_CURRENT_FILE", default=None)
+
+
+def get_import_stats() -> ImportStats | None:
+    """Return the statistics collector of the current context, if collection is enabled.
+
+    Returns:
+        ImportStats | None: Current statistics collector, or None if collection is disabled.
+    """
+    return _IMPORT_STATS.get()
+
+
+@contextmanager
+def collect_import_stats(callback: Callable[[TagStats], None] | None = None) -> Iterator[ImportStats]:
+    """Context manager which collects statistics for every import tag resolved in the current
+    context while it is active.
+
+    Args:
+        callback (Callable[[TagStats], None] | None): Function called with the statistics of each
+            tag as soon as it is resolved. Defaults to None.
+
+    Yields:
+        ImportStats: The statistics collector, whose report is complete once the context exits.
+    """
+    stats = ImportStats(callback=callback)
+    token = _IMPORT_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _IMPORT_STATS.reset(token)
+
+
+@contextmanager
+def record_file(path: Path, anchor: str | None = None) -> Iterator[FileStats | None]:
+    """Context manager which records the loading of a file by the import tag currently being
+    resolved. Does nothing outside of an import tag, or when collection is disabled.
+
+    Args:
+        path (Path): Resolved path to the file.
+        anchor (str | None): Anchor loaded from the file, or None for the whole file. Defaults to
+            None.
+
+    Yields:
+        FileStats | None: Statistics for the file, or None if they are not being recorded.
+    """
+    stats = _IMPORT_STATS.get()
+    tag_stats = _CURRENT_TAG.get()
+    if stats is None or tag_stats is None:
+        yield None
+        return
+    file_stats = FileStats(path, anchor)
+    stats._add_file(tag_stats, file_stats)
+    token = _CURRENT_FILE.set(file_stats)
+    try:
+        yield file_stats
+    finally:
+        _CURRENT_FILE.reset(token)
+
+
+def current_file_stats() -> FileStats | None:
+    """Return the statistics of the file currently being loaded, if they are being recorded.
+
+    Returns:
+        FileStats | None: Statistics of the current file, or None.
+    """
+    return _CURRENT_FILE.get()
+
+
+def note_files_matched(count: int) -> None:
+    """Add to the number of files matched by the import tag currently being resolved, e.g. after
+    expanding a glob pattern.
+
+    Args:
+        count (int): Number of files matched.
+    """
+    if _IMPORT_STATS.get() is not None and (tag_stats := _CURRENT_TAG.get()) is not None:
+        tag_stats._globbed = True
+        tag_stats.files_matched += count
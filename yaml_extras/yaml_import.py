@@ -7,21 +7,61 @@ The following tags are supported:
 - `!import`: Import the entire contents of a file into the current document.
 - `!import.anchor`: Import a specific anchor from within a file.
 - `!import-all`: Import all files that match a pattern as a sequence of objects.
+- `!import-all.stream`: Import all files that match a pattern as an iterable view, which loads one
+  file at a time as it is iterated.
 - `!import-all.anchor`: Import a specific anchor from all files that match a pattern as a sequence
   of objects.
 - `!import-all-parameterized`: Import all files that match a pattern as a sequence of objects,
   including merging the named wildcards into the results.
 """
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+import contextvars
 from dataclasses import dataclass
+from functools import partial
+import io
+import mmap
+import os
 from pathlib import Path
-from typing import IO, Any, Callable, Type
+import threading
+import time
+from typing import IO, Any, Callable, Iterator, Literal, Mapping, Type
 import yaml
 
+from yaml_extras.anchor_index import AnchorIndex, get_anchor_index, hash_node_events, new_event_digest
+from yaml_extras.cache import Dependency, FileSignature, GlobSignature, ParseCache, note_dependency, track_dependencies
 from yaml_extras.file_utils import PathPattern, PathWithMetadata
+from yaml_extras.filesystem import FileSystem, get_filesystem, use_filesystem, uses_os_filesystem
+from yaml_extras.frozen import freeze
+from yaml_extras.governor import ImportLimitError, get_import_budget
+from yaml_extras.lazy import LazyImport
+from yaml_extras.prefetch import ImportPrefetch, ImportPrefetcher
+from yaml_extras.session import ImportCycleError, get_import_session, import_frame
+from yaml_extras.stats import current_file_stats, note_files_matched, record_file
 
 
 IMPORT_RELATIVE_DIR: Callable[[], Path] = Path.cwd
+PARSE_CACHE: ParseCache | None = ParseCache()
+IMPORT_EXECUTOR: "ImportExecutor | None" = None
+LAZY_IMPORTS: bool = False
+SHARED_IMPORTS: bool = False
+MMAP_THRESHOLD: int = 8 * 1024 * 1024
+ANCHOR_INDEX_THRESHOLD: int | None = None
+IMPORT_PREFETCH: ImportPrefetch | None = None
+
+# Set by the `reload` module while it records the import graph of a document. While an observer is
+# active, every import is loaded eagerly, sequentially and without the parse cache, so that the
+# observer sees every file as it is read.
+_IMPORT_OBSERVER: contextvars.ContextVar[Any] = contextvars.ContextVar("_IMPORT_OBSERVER", default=None)
+
+
+# Relative directory for imports in the current context, overriding the process-wide default set by
+# `set_import_relative_dir`. Concurrent loads in different threads or asyncio tasks may each set
+# their own with `import_relative_dir`.
+_CONTEXT_RELATIVE_DIR: contextvars.ContextVar[Path | None] = contextvars.ContextVar(
+    "_CONTEXT_RELATIVE_DIR", default=None
+)
 
 
 def _reset_import_relative_dir() -> None:
@@ -30,17 +70,23 @@ def _reset_import_relative_dir() -> None:
 
 
 def get_import_relative_dir() -> Path:
-    """Read a global variable to get the current relative directory for imports.
+    """Read the current relative directory for imports: the one set for the current context with
+    `import_relative_dir`, if any, or else the process-wide default set with
+    `set_import_relative_dir`.
 
     Returns:
         Path: Current relative directory for imports.
     """
     global IMPORT_RELATIVE_DIR
+    if (path := _CONTEXT_RELATIVE_DIR.get()) is not None:
+        return path
     return IMPORT_RELATIVE_DIR()
 
 
 def set_import_relative_dir(path: Path) -> None:
-    """Set a global variable to change the current relative directory for imports.
+    """Set a global variable to change the process-wide default relative directory for imports. To
+    load documents rooted in different directories concurrently, use `import_relative_dir`
+    instead.
 
     Args:
         path (Path): New relative directory for imports.
@@ -49,42 +95,802 @@ def set_import_relative_dir(path: Path) -> None:
     IMPORT_RELATIVE_DIR = lambda: path
 
 
+@contextmanager
+def import_relative_dir(path: Path) -> Iterator[Path]:
+    """Context manager which sets the relative directory for imports in the current context only,
+    i.e. for the current thread or asyncio task, leaving the process-wide default and every other
+    context untouched. Worker threads of a "thread" import executor inherit it.
+
+    Args:
+        path (Path): Relative directory for imports.
+
+    Yields:
+        Path: The relative directory for imports.
+    """
+    token = _CONTEXT_RELATIVE_DIR.set(Path(path))
+    try:
+        yield Path(path)
+    finally:
+        _CONTEXT_RELATIVE_DIR.reset(token)
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Read a global variable to get the cache of parsed files used by the import tags.
+
+    Returns:
+        ParseCache | None: Current parse cache, or None if caching is disabled.
+    """
+    global PARSE_CACHE
+    return PARSE_CACHE
+
+
+def set_parse_cache(cache: ParseCache | None) -> None:
+    """Set a global variable to change the cache of parsed files used by the import tags.
+
+    Args:
+        cache (ParseCache | None): New parse cache, or None to disable caching.
+    """
+    global PARSE_CACHE
+    PARSE_CACHE = cache
+
+
+@dataclass(frozen=True)
+class ImportExecutor:
+    """Configuration for loading the files matched by the `!import-all` family of tags in parallel.
+
+    A "thread" executor suits I/O-bound workloads (e.g. slow or networked filesystems), while a
+    "process" executor suits parse-bound workloads, since each worker process parses its files
+    without contending for the GIL. With a "process" executor, the loader type must be importable by
+    the worker processes and the loaded values must be picklable; files are loaded sequentially
+    within each worker.
+
+    Results are always returned in the same order as the matched files.
+
+    Attributes:
+        kind (Literal["thread", "process"]): Kind of executor to load files with.
+        max_workers (int | None): Maximum number of workers. Defaults to None, which uses the
+            default of the underlying `concurrent.futures` executor.
+
+    Methods:
+        load_files: Load a list of files (or an anchor from each of them) in parallel.
+    """
+
+    kind: Literal["thread", "process"]
+    max_workers: int | None = None
+
+    def __post_init__(self):
+        if self.kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor kind: {self.kind}")
+
+    def load_files(self, paths: list[Path], loader_type: Type[yaml.Loader], anchor: str | None = None) -> list[Any]:
+        """Load a list of files, or an anchor from each of them, in parallel.
+
+        Args:
+            paths (list[Path]): Paths to the files to be loaded.
+            loader_type (Type[yaml.Loader]): YAML loader type.
+            anchor (str | None): Anchor to load from each file, or None to load the whole files.
+                Defaults to None.
+
+        Raises:
+            ValueError: If any of the files fails to load, naming the failing path.
+
+        Returns:
+            list[Any]: Loaded contents, in the same order as `paths`.
+        """
+        executor: Executor
+        if self.kind == "thread":
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                # Each worker runs in a copy of the current context, so that dependency tracking
+                # and other context-local state carry over into the worker threads.
+                futures = [
+                    executor.submit(contextvars.copy_context().run, _load_yaml_file_or_raise, path, loader_type, anchor)
+                    for path in paths
+                ]
+                return [future.result() for future in futures]
+        with ProcessPoolExecutor(self.max_workers) as executor:
+            chunksize = max(1, len(paths) // (4 * (self.max_workers or os.cpu_count() or 1)))
+            results = list(
+                executor.map(
+                    _load_yaml_file_in_worker,
+                    paths,
+                    [loader_type] * len(paths),
+                    [anchor] * len(paths),
+                    [get_import_relative_dir()] * len(paths),
+                    [get_filesystem()] * len(paths),
+                    chunksize=chunksize,
+                )
+            )
+        values = []
+        for value, deps in results:
+            note_dependency(*deps)
+            values.append(value)
+        return values
+
+
+def get_lazy_imports() -> bool:
+    """Read a global variable to get whether the `!import` and `!import.anchor` tags defer loading
+    their files until first access.
+
+    Returns:
+        bool: True if lazy imports are enabled.
+    """
+    global LAZY_IMPORTS
+    return LAZY_IMPORTS
+
+
+def set_lazy_imports(enabled: bool) -> None:
+    """Set a global variable to change whether the `!import` and `!import.anchor` tags defer
+    loading their files until first access. When enabled, these tags construct a `LazyImport` proxy
+    instead of the file's contents.
+
+    Args:
+        enabled (bool): True to enable lazy imports, False to load imports eagerly (the default).
+    """
+    global LAZY_IMPORTS
+    LAZY_IMPORTS = enabled
+
+
+def get_shared_imports() -> bool:
+    """Read a global variable to get whether imported files are frozen into shared, immutable
+    structures.
+
+    Returns:
+        bool: True if shared imports are enabled.
+    """
+    global SHARED_IMPORTS
+    return SHARED_IMPORTS
+
+
+def set_shared_imports(enabled: bool) -> None:
+    """Set a global variable to change whether imported files are frozen into shared, immutable
+    structures (see the `frozen` module). When enabled, every import of the same file (and any
+    identical content imported from other files) resolves to the same `FrozenDict` and tuple-backed
+    structure, rather than to a separate copy of plain dicts and lists. Lazy imports nested within
+    an imported file are resolved when the file is frozen.
+
+    Args:
+        enabled (bool): True to enable shared imports, False to import mutable copies (the default).
+    """
+    global SHARED_IMPORTS
+    SHARED_IMPORTS = enabled
+
+
+def get_anchor_index_threshold() -> int | None:
+    """Read a global variable to get the minimum size of the files from which anchors are loaded
+    through a persistent anchor index.
+
+    Returns:
+        int | None: Minimum file size in bytes, or None if anchor indexes are disabled.
+    """
+    global ANCHOR_INDEX_THRESHOLD
+    return ANCHOR_INDEX_THRESHOLD
+
+
+def set_anchor_index_threshold(min_size: int | None) -> None:
+    """Set a global variable to change the minimum size of the files from which the
+    `!import.anchor` and `!import-all.anchor` tags load anchors through a persistent anchor index
+    (see the `anchor_index` module), rather than by parsing the file from its start.
+
+    Args:
+        min_size (int | None): Minimum file size in bytes, or None to disable anchor indexes (the
+            default).
+    """
+    global ANCHOR_INDEX_THRESHOLD
+    ANCHOR_INDEX_THRESHOLD = min_size
+
+
+def get_import_prefetch() -> ImportPrefetch | None:
+    """Read a global variable to get the configuration for prefetching imported files in the
+    background.
+
+    Returns:
+        ImportPrefetch | None: Current prefetch configuration, or None if prefetching is disabled.
+    """
+    global IMPORT_PREFETCH
+    return IMPORT_PREFETCH
+
+
+def set_import_prefetch(mode: Literal["read", "parse"] | None, max_workers: int | None = None) -> None:
+    """Set a global variable to change whether the files imported by a document are prefetched on a
+    thread pool (see the `prefetch` module) while the rest of the document is constructed.
+
+    Args:
+        mode (Literal["read", "parse"] | None): "read" to read each imported file into memory,
+            "parse" to also compose it and prefetch its own imports, or None to disable prefetching
+            (the default).
+        max_workers (int | None): Maximum number of worker threads. Defaults to None.
+    """
+    global IMPORT_PREFETCH
+    IMPORT_PREFETCH = ImportPrefetch(mode, max_workers) if mode is not None else None
+
+
+def _lazy_load_yaml_file(path: Path, loader_type: Type[yaml.Loader], anchor: str | None = None) -> LazyImport:
+    # Nested imports within the file must be resolved against the import directory (and filesystem)
+    # in effect when the proxy was created, not when it is first accessed.
+    relative_dir = get_import_relative_dir()
+    filesystem = get_filesystem()
+
+    def _load() -> Any:
+        with import_relative_dir(relative_dir), use_filesystem(filesystem):
+            return load_yaml_file(path, loader_type, anchor)
+
+    return LazyImport(_load, f"{path} &{anchor}" if anchor is not None else str(path))
+
+
+# Executor for the current context, overriding the process-wide default set by
+# `set_import_executor`.
+_CONTEXT_EXECUTOR: contextvars.ContextVar[ImportExecutor | None] = contextvars.ContextVar(
+    "_CONTEXT_EXECUTOR", default=None
+)
+
+
+def get_import_executor() -> ImportExecutor | None:
+    """Read the executor used to load the files matched by the `!import-all` family of tags: the
+    one set for the current context with `import_executor`, if any, or else the process-wide
+    default set with `set_import_executor`.
+
+    Returns:
+        ImportExecutor | None: Current executor configuration, or None if files are loaded
+            sequentially.
+    """
+    global IMPORT_EXECUTOR
+    if (executor := _CONTEXT_EXECUTOR.get()) is not None:
+        return executor
+    return IMPORT_EXECUTOR
+
+
+def set_import_executor(kind: Literal["thread", "process"] | None, max_workers: int | None = None) -> None:
+    """Set a global variable to change the executor used to load the files matched by the
+    `!import-all` family of tags.
+
+    Args:
+        kind (Literal["thread", "process"] | None): Kind of executor to load files with, or None to
+            load files sequentially (the default).
+        max_workers (int | None): Maximum number of workers. Defaults to None.
+    """
+    global IMPORT_EXECUTOR
+    IMPORT_EXECUTOR = ImportExecutor(kind, max_workers) if kind is not None else None
+
+
+@contextmanager
+def import_executor(kind: Literal["thread", "process"], max_workers: int | None = None) -> Iterator[ImportExecutor]:
+    """Context manager which sets the executor used to load the files matched by the `!import-all`
+    family of tags in the current context only, i.e. for the current thread or asyncio task.
+
+    Args:
+        kind (Literal["thread", "process"]): Kind of executor to load files with.
+        max_workers (int | None): Maximum number of workers. Defaults to None.
+
+    Yields:
+        ImportExecutor: The executor configuration.
+    """
+    executor = ImportExecutor(kind, max_workers)
+    token = _CONTEXT_EXECUTOR.set(executor)
+    try:
+        yield executor
+    finally:
+        _CONTEXT_EXECUTOR.reset(token)
+
+
+class _EventComposer(yaml.composer.Composer):
+    """Composes node graphs from the events of an existing parser, resolving implicit tags with the
+    resolver of a given loader. Used to build the node marked by an anchor straight from the parser
+    events, without emitting the fragment back to text and parsing it again.
+    """
+
+    def __init__(self, events: Iterator[yaml.Event], resolver: yaml.resolver.BaseResolver):
+        super().__init__()
+        self._events = events
+        self._next_event: yaml.Event | None = None
+        self._resolver = resolver
+
+    def peek_event(self) -> yaml.Event | None:
+        if self._next_event is None:
+            self._next_event = next(self._events, None)
+        return self._next_event
+
+    def check_event(self, *choices) -> bool:
+        event = self.peek_event()
+        return event is not None and (not choices or isinstance(event, choices))
+
+    def get_event(self) -> yaml.Event | None:
+        event = self.peek_event()
+        self._next_event = None
+        return event
+
+    def resolve(self, kind, value, implicit):
+        return self._resolver.resolve(kind, value, implicit)
+
+    def descend_resolver(self, current_node, current_index):
+        return self._resolver.descend_resolver(current_node, current_index)
+
+    def ascend_resolver(self):
+        return self._resolver.ascend_resolver()
+
+    def compose_node(self, parent, index):
+        # Outside of a complete document, anchors may be redefined, with the new definition
+        # shadowing the old one, rather than raising an error.
+        if not self.check_event(yaml.AliasEvent):
+            self.anchors.pop(self.peek_event().anchor, None)  # type: ignore
+        return super().compose_node(parent, index)
+
+    def compose_anchor(self, anchor: str) -> yaml.Node | None:
+        """Scan the events for the first node marked by the anchor, and compose it.
+
+        Every anchored node encountered along the way is composed as well, so that aliases inside
+        the fragment may refer to anchors defined earlier in the same document.
+
+        Args:
+            anchor (str): Anchor to compose.
+
+        Returns:
+            yaml.Node | None: Node marked by the anchor, or None if the anchor was not found.
+        """
+        while self.check_event():
+            event = self.peek_event()
+            if isinstance(event, (yaml.ScalarEvent, yaml.CollectionStartEvent)) and event.anchor is not None:
+                self.compose_node(None, None)
+                if anchor in self.anchors:
+                    return self.anchors[anchor]
+            else:
+                if isinstance(event, yaml.DocumentStartEvent):
+                    self.anchors = {}
+                self.get_event()
+        return None
+
+
 def load_yaml_anchor(file_stream: IO, anchor: str, loader_type: Type[yaml.Loader]) -> Any:
-    """Load an anchor from a YAML file.
+    """Load an anchor from a YAML file. The node marked by the anchor is composed directly from the
+    parser events and constructed with the given loader type, so the rest of the file is only
+    scanned, never constructed.
 
     Args:
         file_stream (IO): YAML file stream to load from.
         anchor (str): Anchor to load.
+        loader_type (Type[yaml.Loader]): YAML loader type.
+
+    Raises:
+        ValueError: If the anchor is not found in the file.
 
     Returns:
         Any: Content from the yaml file which the anchor marks.
     """
-    level = 0
-    events: list[yaml.Event] = []
-    for event in yaml.parse(file_stream, loader_type):
-        if isinstance(event, yaml.events.ScalarEvent) and event.anchor == anchor:
-            events = [event]
-            break
-        elif isinstance(event, yaml.events.MappingStartEvent) and event.anchor == anchor:
-            events = [event]
-            level = 1
-        elif isinstance(event, yaml.events.SequenceStartEvent) and event.anchor == anchor:
-            events = [event]
-            level = 1
-        elif level > 0:
-            events.append(event)
-            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
-                level += 1
-            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
-                level -= 1
-            if level == 0:
-                break
-    if not events:
-        raise ValueError(f"Anchor '{anchor}' not found in {file_stream.name}")
-    events = (
-        [yaml.StreamStartEvent(), yaml.DocumentStartEvent()] + events + [yaml.DocumentEndEvent(), yaml.StreamEndEvent()]
+    loader = loader_type(file_stream)
+    try:
+        return _construct_anchor(loader, anchor, getattr(file_stream, "name", "<stream>"))
+    finally:
+        loader.dispose()
+
+
+def _construct_anchor(loader: yaml.Loader, anchor: str, name: str) -> Any:
+    return loader.construct_document(_compose_anchor(loader, anchor, name))
+
+
+def _compose_anchor(loader: yaml.Loader, anchor: str, name: str) -> yaml.Node:
+    node = _EventComposer(iter(loader.get_event, None), loader).compose_anchor(anchor)
+    if node is None:
+        raise ValueError(f"Anchor '{anchor}' not found in {name}")
+    return node
+
+
+class _NamedBuffer:
+    """Read-only stream over an in-memory or memory-mapped buffer, named after the file it holds so
+    that parse errors point at the file."""
+
+    def __init__(self, buffer: Any, name: str):
+        self._buffer = buffer
+        self.name = name
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+def _is_c_loader(loader_type: Type[yaml.Loader]) -> bool:
+    return yaml.__with_libyaml__ and issubclass(loader_type, yaml.cyaml.CParser)
+
+
+@contextmanager
+def _open_yaml_loader(path: Path, loader_type: Type[yaml.Loader]) -> Iterator[yaml.Loader]:
+    """Context manager which reads a YAML file and yields a loader over its contents. Files smaller
+    than `MMAP_THRESHOLD` bytes are read with a single bulk read, and larger files are memory-mapped.
+    The loader and the file handle are closed when the context exits.
+
+    Args:
+        path (Path): Path to the YAML file.
+        loader_type (Type[yaml.Loader]): YAML loader type.
+
+    Yields:
+        yaml.Loader: Loader over the contents of the file.
+    """
+    data = _read_file_data(path)
+    try:
+        loader = _new_loader(data, str(path), loader_type)
+        try:
+            yield loader
+        finally:
+            loader.dispose()
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def _read_file(path: Path) -> bytes | mmap.mmap:
+    if not uses_os_filesystem():
+        return get_filesystem().read_bytes(path)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size and size >= MMAP_THRESHOLD:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return f.read()
+
+
+def _read_file_data(path: Path) -> bytes | mmap.mmap:
+    """Read the contents of a file to be parsed: from the prefetcher of the current load, if it has
+    already read the file, or else with a single bulk read, or by memory-mapping files of at least
+    `MMAP_THRESHOLD` bytes. The caller closes the memory map."""
+    data: bytes | mmap.mmap | None = None
+    if (prefetcher := _get_prefetcher()) is not None:
+        data = prefetcher.take(("read", os.path.abspath(path)))
+    if data is None:
+        data = _read_file(path)
+    if (file_stats := current_file_stats()) is not None:
+        file_stats.cached = False
+        file_stats.bytes_read += len(data)
+    if (budget := get_import_budget()) is not None:
+        budget.add_bytes(path, len(data))
+    return data
+
+
+def _new_loader(data: bytes | mmap.mmap, name: str, loader_type: Type[yaml.Loader]) -> yaml.Loader:
+    source: Any
+    if isinstance(data, mmap.mmap):
+        source = _NamedBuffer(data, name)
+    elif _is_c_loader(loader_type):
+        source = _NamedBuffer(io.BytesIO(data), name)
+    else:
+        # The pure-Python reader decodes a byte string in one pass rather than chunk by chunk
+        source = data
+    loader = loader_type(source)
+    if not _is_c_loader(loader_type):
+        loader.name = name
+    return loader
+
+
+def _build_anchor_index(path: Path, loader_type: Type[yaml.Loader]) -> AnchorIndex:
+    with _open_yaml_loader(path, loader_type) as loader:
+        return AnchorIndex.from_events(path, iter(loader.get_event, None))
+
+
+_UNINDEXED = object()
+
+
+def _parse_indexed_anchor(path: Path, loader_type: Type[yaml.Loader], anchor: str) -> Any:
+    """Load an anchor from a file through its anchor index, parsing only the node the anchor marks.
+    Returns `_UNINDEXED` if the file is too small to be indexed, or if the node cannot be parsed on
+    its own, in which case the file must be parsed from its start."""
+    threshold = get_anchor_index_threshold()
+    if threshold is None or not uses_os_filesystem():
+        return _UNINDEXED
+    resolved_path = Path(path).resolve()
+    try:
+        if os.stat(resolved_path).st_size < threshold:
+            return _UNINDEXED
+    except OSError:
+        return _UNINDEXED
+    index = get_anchor_index(resolved_path, lambda: _build_anchor_index(resolved_path, loader_type))
+    if (entry := index.anchors.get(anchor)) is None:
+        raise ValueError(f"Anchor '{anchor}' not found in {path}")
+    if entry.digest is None:
+        return _UNINDEXED
+    with resolved_path.open("rb") as f:
+        f.seek(entry.start)
+        region = f.read(entry.end - entry.start)
+    if (file_stats := current_file_stats()) is not None:
+        file_stats.cached = False
+        file_stats.bytes_read += len(region)
+    if (budget := get_import_budget()) is not None:
+        budget.add_bytes(resolved_path, len(region))
+    # The node is indented by its original column, so that nested block collections line up
+    loader = _new_loader(b" " * entry.column + region, str(path), loader_type)
+    try:
+        start = time.perf_counter()
+        digest = new_event_digest()
+        events = hash_node_events(iter(loader.get_event, None), digest)
+        try:
+            node = _EventComposer(events, loader).compose_anchor(anchor)
+            for _ in events:
+                pass
+        except yaml.YAMLError:
+            return _UNINDEXED
+        if node is None or digest.hexdigest() != entry.digest:
+            return _UNINDEXED
+        parsed = time.perf_counter()
+        value = loader.construct_document(node)
+        if file_stats is not None:
+            file_stats.parse_time += parsed - start
+            file_stats.construct_time += time.perf_counter() - parsed
+        return value
+    finally:
+        loader.dispose()
+
+
+class _AnchorScanner:
+    """Single pass over the anchored nodes of a file, shared by every anchor imported from the file
+    within a load (see `ImportSession.shared`). Each lookup resumes the scan where the previous one
+    stopped, and every anchored node composed along the way is kept, so that the file is parsed at
+    most once no matter how many of its anchors are imported."""
+
+    def __init__(self, path: Path, loader_type: Type[yaml.Loader]):
+        self.path = path
+        self.loader_type = loader_type
+        self._lock = threading.RLock()
+        self._nodes: dict[str, yaml.Node] = {}
+        data = _read_file_data(path)
+        self._mapped = data if isinstance(data, mmap.mmap) else None
+        self._loader = _new_loader(data, str(path), loader_type)
+        self._composer: _EventComposer | None = _EventComposer(iter(self._loader.get_event, None), self._loader)
+
+    def node(self, anchor: str) -> yaml.Node | None:
+        with self._lock:
+            if anchor not in self._nodes and self._composer is not None:
+                node = self._composer.compose_anchor(anchor)
+                for name, composed in self._composer.anchors.items():
+                    self._nodes.setdefault(name, composed)
+                if node is None:
+                    # The whole file has been scanned
+                    self.close()
+            return self._nodes.get(anchor)
+
+    def load(self, anchor: str) -> Any:
+        start = time.perf_counter()
+        if (node := self.node(anchor)) is None:
+            raise ValueError(f"Anchor '{anchor}' not found in {self.path}")
+        parsed = time.perf_counter()
+        # Each anchor is constructed by a loader of its own, since constructing an anchor may import
+        # another anchor from the same file.
+        loader = _new_loader(b"", str(self.path), self.loader_type)
+        try:
+            value = loader.construct_document(node)
+        finally:
+            loader.dispose()
+        if (file_stats := current_file_stats()) is not None:
+            file_stats.parse_time += parsed - start
+            file_stats.construct_time += time.perf_counter() - parsed
+        return value
+
+    def close(self) -> None:
+        with self._lock:
+            if self._composer is None:
+                return
+            self._composer = None
+            self._loader.dispose()
+            if self._mapped is not None:
+                self._mapped.close()
+
+
+def _read_yaml_file(path: Path, loader_type: Type[yaml.Loader], anchor: str | None = None) -> Any:
+    if (observer := _IMPORT_OBSERVER.get()) is not None:
+        return observer.observe_file(path, loader_type, anchor, lambda: _parse_yaml_file(path, loader_type, anchor))
+    value = _parse_yaml_file(path, loader_type, anchor)
+    return freeze(value) if get_shared_imports() else value
+
+
+def _parse_yaml_file(path: Path, loader_type: Type[yaml.Loader], anchor: str | None = None) -> Any:
+    if anchor is not None:
+        if (value := _parse_indexed_anchor(path, loader_type, anchor)) is not _UNINDEXED:
+            return value
+        if (session := get_import_session()) is not None:
+            resolved_path = Path(path).resolve()
+            scanner = session.shared(
+                ("anchors", resolved_path, loader_type), lambda: _AnchorScanner(resolved_path, loader_type)
+            )
+            return scanner.load(anchor)
+    elif (prefetcher := _get_prefetcher()) is not None:
+        if (prefetched := prefetcher.take(("parse", os.path.abspath(path), loader_type))) is not None:
+            return _construct_prefetched(path, loader_type, *prefetched)
+    with _open_yaml_loader(path, loader_type) as loader:
+        start = time.perf_counter()
+        node = loader.get_single_node() if anchor is None else _compose_anchor(loader, anchor, str(path))
+        parsed = time.perf_counter()
+        value = loader.construct_document(node) if node is not None else None
+        if (file_stats := current_file_stats()) is not None:
+            file_stats.parse_time += parsed - start
+            file_stats.construct_time += time.perf_counter() - parsed
+        return value
+
+
+def load_yaml_file(path: Path, loader_type: Type[yaml.Loader], anchor: str | None = None) -> Any:
+    """Load the contents of a YAML file, or of an anchor within it. Within a single load, each file
+    (and anchor) is only loaded once, and later imports of it receive a copy (see the `session`
+    module); otherwise, the parse cache (see `set_parse_cache`) is consulted before reading the file.
+
+    Args:
+        path (Path): Path to the YAML file.
+        loader_type (Type[yaml.Loader]): YAML loader type.
+        anchor (str | None): Anchor to load from the file, or None to load the whole file. Defaults
+            to None.
+
+    Raises:
+        ImportCycleError: If the file (and anchor) is already being imported further up the chain
+            of imports.
+        ImportLimitError: If loading the file exceeds the limits on the resources used by the load
+            (see the `governor` module).
+
+    Returns:
+        Any: Content of the file, or of the anchor within it.
+    """
+    resolved_path = Path(path).resolve()
+    with import_frame(resolved_path, anchor), record_file(resolved_path, anchor):
+        session = get_import_session()
+        if session is None or _IMPORT_OBSERVER.get() is not None:
+            return _load_yaml_file_cached(path, loader_type, anchor)
+        return session.get_or_load(
+            (resolved_path, loader_type, anchor, get_import_relative_dir(), get_shared_imports(), get_lazy_imports()),
+            lambda: _load_yaml_file_cached(path, loader_type, anchor),
+        )
+
+
+def _load_yaml_file_cached(path: Path, loader_type: Type[yaml.Loader], anchor: str | None = None) -> Any:
+    cache = get_parse_cache()
+    if cache is None or _IMPORT_OBSERVER.get() is not None or not uses_os_filesystem():
+        value = _read_yaml_file(path, loader_type, anchor)
+        if uses_os_filesystem():
+            # The parse cache notes the file itself, so it is only noted here when the cache is bypassed.
+            note_dependency(FileSignature.from_path(Path(path).resolve()))
+        return value
+    # Nested imports are resolved relative to the import directory, and are lazy proxies when lazy
+    # imports are enabled, so both are part of the cache key.
+    return cache.get_or_load(
+        path,
+        loader_type,
+        lambda: _read_yaml_file(path, loader_type, anchor),
+        variant=(anchor, get_import_relative_dir(), get_shared_imports(), get_lazy_imports()),
     )
-    return yaml.load(yaml.emit(evt for evt in events), loader_type)
+
+
+def _load_yaml_file_or_raise(path: Path, loader_type: Type[yaml.Loader], anchor: str | None) -> Any:
+    try:
+        return load_yaml_file(path, loader_type, anchor)
+    except (ImportCycleError, ImportLimitError):
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to import {path}: {e}") from e
+
+
+def _load_yaml_file_in_worker(
+    path: Path, loader_type: Type[yaml.Loader], anchor: str | None, relative_dir: Path, filesystem: FileSystem
+) -> tuple[Any, set[Dependency]]:
+    # Entry point for worker processes, which must not spawn nested pools of their own. The
+    # dependencies are returned explicitly since they cannot be tracked across processes.
+    set_import_executor(None)
+    with import_relative_dir(relative_dir), use_filesystem(filesystem), track_dependencies() as deps:
+        try:
+            value = load_yaml_file(path, loader_type, anchor)
+        except Exception as e:
+            # The original exception may not survive pickling, so only its message is kept.
+            raise ValueError(f"Failed to import {path}: {e}") from None
+    return value, deps
+
+
+def _load_yaml_files(paths: list[Path], loader_type: Type[yaml.Loader], anchor: str | None = None) -> list[Any]:
+    executor = get_import_executor()
+    if executor is None or len(paths) < 2 or _IMPORT_OBSERVER.get() is not None:
+        return [load_yaml_file(path, loader_type, anchor) for path in paths]
+    return executor.load_files(paths, loader_type, anchor)
+
+
+def _expand_path_pattern(path_pattern: PathPattern) -> list[PathWithMetadata]:
+    if (observer := _IMPORT_OBSERVER.get()) is not None:
+        results = observer.expand_glob(path_pattern)
+    else:
+        results = path_pattern.results()
+    note_files_matched(len(results))
+    note_dependency(GlobSignature(path_pattern.pattern, path_pattern.relative_to, tuple(r.path for r in results)))
+    return results
+
+
+def _get_prefetcher() -> ImportPrefetcher | None:
+    if (config := get_import_prefetch()) is None or (session := get_import_session()) is None:
+        return None
+    return session.shared(("prefetch", config), lambda: ImportPrefetcher(config))
+
+
+def _prefetch_read(path: Path) -> bytes | None:
+    if not uses_os_filesystem():
+        return get_filesystem().read_bytes(path)
+    with open(path, "rb") as f:
+        # Large files are memory-mapped by their constructor rather than read into memory
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            return None
+        return f.read()
+
+
+def _prefetch_parse(path: Path, loader_type: Type[yaml.Loader]) -> tuple[int, yaml.Node | None]:
+    data = _read_file(path)
+    try:
+        loader = _new_loader(data, str(path), loader_type)
+        try:
+            node = loader.get_single_node()
+        finally:
+            loader.dispose()
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+    if node is not None:
+        _prefetch_imports(node, loader_type)
+    return len(data), node
+
+
+def _construct_prefetched(path: Path, loader_type: Type[yaml.Loader], size: int, node: yaml.Node | None) -> Any:
+    if (file_stats := current_file_stats()) is not None:
+        file_stats.cached = False
+        file_stats.bytes_read += size
+    if (budget := get_import_budget()) is not None:
+        budget.add_bytes(path, size)
+    if node is None:
+        return None
+    start = time.perf_counter()
+    loader = _new_loader(b"", str(path), loader_type)
+    try:
+        value = loader.construct_document(node)
+    finally:
+        loader.dispose()
+    if file_stats is not None:
+        file_stats.construct_time += time.perf_counter() - start
+    return value
+
+
+def _prefetch_imports(root: yaml.Node, loader_type: Type[yaml.Loader]) -> None:
+    """Scan a composed node graph for import tags, and start prefetching the files they import on
+    the prefetcher of the current load (see `set_import_prefetch`). Tags which are loaded lazily or
+    by worker processes, and tags whose argument is malformed, are left alone."""
+    if (prefetcher := _get_prefetcher()) is None:
+        return
+    lazy = get_lazy_imports()
+    executor = get_import_executor()
+    in_worker_processes = executor is not None and executor.kind == "process"
+    seen: set[int] = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            stack.extend(item for pair in node.value for item in pair)
+            continue
+        if isinstance(node, yaml.SequenceNode):
+            stack.extend(node.value)
+            continue
+        if not isinstance(node, yaml.ScalarNode) or node.tag not in RESERVED_TAGS:
+            continue
+        targets: list[tuple[Path, bool]]
+        try:
+            if node.tag == "!import" and not lazy:
+                targets = [(ImportSpec.from_str(node.value).path, False)]
+            elif node.tag == "!import.anchor" and not lazy:
+                targets = [(ImportAnchorSpec.from_str(node.value).path, True)]
+            elif node.tag == "!import.anchors" and not lazy:
+                targets = [(ImportAnchorsSpec.from_str(node.value).path, True)]
+            elif node.tag == "!import-all" and not in_worker_processes:
+                targets = [(path, False) for path in ImportAllSpec.from_str(node.value).path_pattern.glob_results()]
+            elif node.tag == "!import-all-parameterized" and not in_worker_processes:
+                path_pattern = ImportAllParameterizedSpec.from_str(node.value).path_pattern
+                targets = [(path, False) for path in path_pattern.glob_results()]
+            elif node.tag == "!import-all.anchor" and not in_worker_processes:
+                path_pattern = ImportAllAnchorSpec.from_str(node.value).path_pattern
+                targets = [(path, True) for path in path_pattern.glob_results()]
+            else:
+                continue
+        except Exception:
+            # Malformed arguments are reported by the constructor
+            continue
+        for path, anchored in targets:
+            if prefetcher.config.mode == "parse" and not anchored:
+                key: tuple = ("parse", os.path.abspath(path), loader_type)
+                prefetcher.submit(key, partial(_prefetch_parse, path, loader_type))
+            else:
+                prefetcher.submit(("read", os.path.abspath(path)), partial(_prefetch_read, path))
 
 
 @dataclass
@@ -183,10 +989,13 @@ class ImportConstructor:
             import_spec (ImportSpec): Dataclass containing the path to the file to be imported.
 
         Returns:
-            Any: Result of loading the file's contents using the specified loader type.
+            Any: Result of loading the file's contents using the specified loader type, or a
+                `LazyImport` proxy for it when lazy imports are enabled.
         """
+        if get_lazy_imports() and _IMPORT_OBSERVER.get() is None:
+            return _lazy_load_yaml_file(import_spec.path, loader_type)
         # Just load the contents of the file
-        return yaml.load(import_spec.path.open("r"), loader_type)
+        return load_yaml_file(import_spec.path, loader_type)
 
 
 @dataclass
@@ -293,9 +1102,126 @@ class ImportAnchorConstructor:
                 and the anchor to be loaded.
 
         Returns:
-            Any: Result of loading the anchor from the file using the specified loader type.
+            Any: Result of loading the anchor from the file using the specified loader type, or a
+                `LazyImport` proxy for it when lazy imports are enabled.
+        """
+        if get_lazy_imports() and _IMPORT_OBSERVER.get() is None:
+            return _lazy_load_yaml_file(import_spec.path, loader_type, import_spec.anchor)
+        return load_yaml_file(import_spec.path, loader_type, import_spec.anchor)
+
+
+@dataclass
+class ImportAnchorsSpec:
+    """Small utility dataclass for typing the parsed arguments to the `!import.anchors` tag. E.g.,
+
+    ```yaml
+    my-data: !import.anchors path/to/file.yml &first-anchor &second-anchor
+    ```
+
+    Shall be parsed as,
+
+    ```python
+    ImportAnchorsSpec(Path("path/to/file.yml"), ("first-anchor", "second-anchor"))
+    ```
+
+    Attributes:
+        path (Path): Relative path to the file to be imported
+        anchors (tuple[str, ...]): Anchors to be loaded, in order
+
+    Methods:
+        from_str: Parse a string into an `ImportAnchorsSpec` dataclass.
+    """
+
+    path: Path
+    anchors: tuple[str, ...]
+
+    @classmethod
+    def from_str(cls, spec_str: str) -> "ImportAnchorsSpec":
+        """Parse the string into an `ImportAnchorsSpec` dataclass. It is expected that the string
+        will be in the form of `path/to/file.yml &anchor [&anchor ...]`.
+
+        Args:
+            spec_str (str): String to be parsed
+
+        Raises:
+            ValueError: If no anchor is specified.
+
+        Returns:
+            ImportAnchorsSpec: Dataclass containing the path to the file to be imported and the
+                anchors to be loaded.
+        """
+        path_str, *anchors = spec_str.split(" &")
+        anchors = [anchor.strip() for anchor in anchors if anchor.strip()]
+        if not anchors:
+            raise ValueError(f"!import.anchors Expected at least one anchor, got {spec_str!r}")
+        return cls(Path(get_import_relative_dir() / path_str), tuple(anchors))
+
+
+@dataclass
+class ImportAnchorsConstructor:
+    """Custom PyYAML constructor for the `!import.anchors` tag, which loads several anchors from a
+    file into a mapping of each anchor to the node it marks.
+
+    As a Constructor, it can be called with a `yaml.Loader` and a `yaml.Node` to attempt to
+    construct a given node tagged as `!import.anchors` into a Python object. In any valid use of the
+    tag, this node should always be a scalar string.
+
+    It is expected that the first token of the string is the path to the file to be imported, and
+    the remaining tokens are the anchors to be imported (each leading with `&`), e.g.:
+
+    ```yaml
+    my-data: !import.anchors path/to/my/file.yml &first-anchor &second-anchor
+    ```
+
+    The file is scanned once for all of the anchors, which are then also available to any other
+    anchor import of the same file in the same load.
+
+    Methods:
+        __call__: Construct a node tagged as `!import.anchors` into a Python object.
+        load: Using a specified loader type, load the anchors from the specified file into a
+            mapping.
+    """
+
+    def __call__(self, loader: yaml.Loader, node: yaml.Node) -> dict[str, Any]:
+        """Using the specified loader, attempt to construct a node tagged as `!import.anchors` into
+        a Python object.
+
+        Args:
+            loader (yaml.Loader): YAML loader.
+            node (yaml.Node): `!import.anchors`-tagged node.
+
+        Returns:
+            dict[str, Any]: Mapping of each anchor to the result of loading it from the file.
+        """
+        import_spec: ImportAnchorsSpec
+        if isinstance(node, yaml.ScalarNode):
+            val = loader.construct_scalar(node)
+            if isinstance(val, str):
+                import_spec = ImportAnchorsSpec.from_str(val)
+            else:
+                raise TypeError(f"!import.anchors Expected a string, got {type(val)}")
+        else:
+            raise TypeError(f"!import.anchors Expected a string scalar, got {type(node)}")
+        return self.load(type(loader), import_spec)
+
+    def load(self, loader_type: Type[yaml.Loader], import_spec: ImportAnchorsSpec) -> dict[str, Any]:
+        """Utility function which, using the specified loader type and the `ImportAnchorsSpec`,
+        attempts to load each anchor from the specified file.
+
+        Args:
+            loader_type (Type[yaml.Loader]): YAML loader type.
+            import_spec (ImportAnchorsSpec): Dataclass containing the path to the file to be
+                imported and the anchors to be loaded.
+
+        Returns:
+            dict[str, Any]: Mapping of each anchor to the result of loading it from the file, or to
+                a `LazyImport` proxy for it when lazy imports are enabled.
         """
-        return load_yaml_anchor(import_spec.path.open("r"), import_spec.anchor, loader_type)
+        if get_lazy_imports() and _IMPORT_OBSERVER.get() is None:
+            return {
+                anchor: _lazy_load_yaml_file(import_spec.path, loader_type, anchor) for anchor in import_spec.anchors
+            }
+        return {anchor: load_yaml_file(import_spec.path, loader_type, anchor) for anchor in import_spec.anchors}
 
 
 @dataclass
@@ -401,10 +1327,116 @@ class ImportAllConstructor:
             list[Any]: List of objects loaded from the files that match the pattern.
         """
         # Find and load all files that match the pattern into a sequence of objects
-        return [
-            yaml.load(path_w_metadata.path.open("r"), loader_type)
-            for path_w_metadata in import_spec.path_pattern.results()
-        ]
+        paths = [path_w_metadata.path for path_w_metadata in _expand_path_pattern(import_spec.path_pattern)]
+        return _load_yaml_files(paths, loader_type)
+
+
+class ImportAllStream:
+    """Iterable view over the files matched by an `!import-all.stream` tag, which loads one file at
+    a time as it is iterated. The directory tree is walked lazily as well, so memory use is bounded
+    by the largest single file rather than by the whole set of matched files.
+
+    The view may be iterated more than once, in which case the directory tree is walked and the
+    files are loaded again. Files loaded through the view bypass the parse cache.
+
+    Attributes:
+        path_pattern (PathPattern): Pattern for matching files to be imported.
+        loader_type (Type[yaml.Loader]): YAML loader type used to load each file.
+        relative_dir (Path): Relative directory for imports nested within the matched files.
+        filesystem (FileSystem | None): Filesystem the files are read from. Defaults to None, which
+            uses the filesystem in effect when the view is iterated.
+    """
+
+    def __init__(
+        self,
+        path_pattern: PathPattern,
+        loader_type: Type[yaml.Loader],
+        relative_dir: Path,
+        filesystem: FileSystem | None = None,
+    ):
+        self.path_pattern = path_pattern
+        self.loader_type = loader_type
+        self.relative_dir = relative_dir
+        self.filesystem = filesystem
+
+    def __iter__(self) -> Iterator[Any]:
+        filesystem = self.filesystem or get_filesystem()
+        paths = self.path_pattern.iter_results()
+        while True:
+            # The directory tree is walked lazily, so it must be walked within the filesystem too
+            with import_relative_dir(self.relative_dir), use_filesystem(filesystem):
+                if (path_w_metadata := next(paths, None)) is None:
+                    return
+                with record_file(path_w_metadata.path.resolve()):
+                    value = _read_yaml_file(path_w_metadata.path, self.loader_type)
+            yield value
+
+    def __repr__(self) -> str:
+        return f"ImportAllStream({self.path_pattern.pattern!r})"
+
+
+@dataclass
+class ImportAllStreamConstructor:
+    """Custom PyYAML constructor for the `!import-all.stream` tag, which behaves like `!import-all`
+    except that it constructs an iterable view over the matched files, rather than a list of their
+    contents. Each file is only read and parsed when the view reaches it during iteration, e.g.:
+
+    ```yaml
+    records: !import-all.stream records/**/*.yml
+    ```
+
+    ```python
+    for record in data["records"]:
+        process(record)
+    ```
+
+    To standardize the parsing of the tag's argument, the Constructor uses an
+    [`ImportAllSpec`](./#yaml_extras.yaml_import.ImportAllSpec) dataclass to hold the path pattern
+    object to be matched after it's been parsed from the string in the YAML document.
+
+    Methods:
+        __call__: Construct a node tagged as `!import-all.stream` into an iterable view.
+        load: Using a specified loader type, construct an iterable view over the files that match
+            the pattern.
+    """
+
+    def __call__(self, loader: yaml.Loader, node: yaml.Node) -> ImportAllStream:
+        """Using the specified loader, attempt to construct a node tagged as `!import-all.stream`
+        into an iterable view over the files that match the pattern.
+
+        For any valid use of the tag, the node should always be a scalar string, and it should be in
+        the form of a path glob _with no named wildcards_.
+
+        Args:
+            loader (yaml.Loader): YAML loader
+            node (yaml.Node): `!import-all.stream`-tagged node
+
+        Returns:
+            ImportAllStream: Iterable view over the objects loaded from the matching files.
+        """
+        import_spec: ImportAllSpec
+        if isinstance(node, yaml.ScalarNode):
+            val = loader.construct_scalar(node)
+            if isinstance(val, str):
+                import_spec = ImportAllSpec.from_str(val)
+            else:
+                raise TypeError(f"!import-all.stream Expected a string, got {type(val)}")
+        else:
+            raise TypeError(f"!import-all.stream Expected a string scalar, got {type(node)}")
+        return self.load(type(loader), import_spec)
+
+    def load(self, loader_type: Type[yaml.Loader], import_spec: ImportAllSpec) -> ImportAllStream:
+        """Utility function which, using the specified loader type and the `ImportAllSpec`,
+        constructs an iterable view which loads the files that match the pattern one at a time.
+
+        Args:
+            loader_type (Type[yaml.Loader]): YAML loader type
+            import_spec (ImportAllSpec): Dataclass containing the path pattern to be matched.
+
+        Returns:
+            ImportAllStream: Iterable view over the objects loaded from the matching files.
+        """
+        return ImportAllStream(import_spec.path_pattern, loader_type, get_import_relative_dir(), get_filesystem())
 
 
 @dataclass
@@ -520,10 +1552,8 @@ class ImportAllAnchorConstructor:
             list[Any]: List of anchored objects loaded from the files that match the pattern.
         """
         # Find and load all files that match the pattern into a sequence of objects
-        return [
-            load_yaml_anchor(path_w_metadata.path.open("r"), import_spec.anchor, loader_type)
-            for path_w_metadata in import_spec.path_pattern.results()
-        ]
+        paths = [path_w_metadata.path for path_w_metadata in _expand_path_pattern(import_spec.path_pattern)]
+        return _load_yaml_files(paths, loader_type, import_spec.anchor)
 
 
 @dataclass
@@ -642,14 +1672,12 @@ class ImportAllParameterizedConstructor:
         """
         # Find and load all files that match the pattern into a sequence of objects, including
         # merging the named wildcards into the results.
-        import_results: dict[PathWithMetadata, Any] = {
-            path_w_metadata: yaml.load(path_w_metadata.path.open("r"), loader_type)
-            for path_w_metadata in import_spec.path_pattern.results()
-        }
-        _to_object = lambda content: (content if isinstance(content, dict) else {"content": content})
+        paths_w_metadata = _expand_path_pattern(import_spec.path_pattern)
+        contents = _load_yaml_files([path_w_metadata.path for path_w_metadata in paths_w_metadata], loader_type)
+        _to_object = lambda content: (content if isinstance(content, Mapping) else {"content": content})
         return [
             _to_object(content) | (path_w_metadata.metadata or {})
-            for path_w_metadata, content in import_results.items()
+            for path_w_metadata, content in zip(paths_w_metadata, contents)
         ]
 
 
@@ -657,7 +1685,9 @@ _Constructor = yaml.constructor.Constructor | Any
 RESERVED_TAGS: dict[str, Type[_Constructor]] = {
     "!import": ImportConstructor,
     "!import.anchor": ImportAnchorConstructor,
+    "!import.anchors": ImportAnchorsConstructor,
     "!import-all": ImportAllConstructor,
+    "!import-all.stream": ImportAllStreamConstructor,
     "!import-all.anchor": ImportAllAnchorConstructor,
     "!import-all-parameterized": ImportAllParameterizedConstructor,
 }